@@ -0,0 +1,347 @@
+"""
+Headless balancing runs.
+
+Plays complete 1-player games on ``SimulationWorld`` with a scripted or
+random policy, spread over worker processes, and writes one CSV row per
+episode (score, waves cleared, survival time, shots fired, ...)::
+
+    python -m src.batch -n 2000 -o runs.csv                 # all cores, scripted policy
+    python -m src.batch -n 500 --policy random --seed 7 -j 4
+    python -m src.batch -n 1000 --set ALIEN_BOMB_CHANCE=0.015 --set UFO_BOMB_CHANCE=0.03
+
+``--set`` overrides any gameplay constant in ``config`` inside every worker,
+so two runs that differ only in one value can be compared directly. Values
+``config`` derives from others (``SIM_TICK_MS``, ``SIM_FRAME_MS``) cannot be
+set; they follow ``SIM_TICK_HZ`` and ``SIMULATION_HZ``. Episode
+``i`` always plays with seed ``--seed + i``; the same command line therefore
+produces the same CSV regardless of the number of workers.
+"""
+import argparse
+import ast
+import csv
+import logging
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import astuple, dataclass, fields
+from statistics import fmean
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # Keep stdout pure CSV
+
+from . import config, constants  # noqa: E402
+from .core.simulation import FrameInput, SimEventType, SimulationWorld  # noqa: E402
+
+DEFAULT_EPISODES = 100
+DEFAULT_SEED = 1
+# Simulated time after which an episode is cut off (a policy that can neither
+# win nor lose would otherwise run forever)
+DEFAULT_MAX_MINUTES = 30.0
+
+Policy = Callable[[SimulationWorld], FrameInput]
+
+# Settings config computes from another one, with the formula it uses
+DERIVED_SETTINGS: Dict[str, Tuple[str, Callable[[Any], Any]]] = {
+    "SIM_FRAME_MS": ("SIMULATION_HZ", lambda hz: 1000 / hz),
+    "SIM_TICK_MS": ("SIM_TICK_HZ", lambda hz: 1000 / hz),
+}
+
+
+class RandomPolicy:
+    """Holds a random direction for a random number of steps and fires at will."""
+
+    def __init__(self, rng: random.Random, fire_chance: float = 0.1):
+        self.rng = rng
+        self.fire_chance = fire_chance
+        self._direction = 0
+        self._hold = 0
+
+    def __call__(self, world: SimulationWorld) -> FrameInput:
+        rng = self.rng
+        if self._hold <= 0:
+            self._direction = rng.choice((-1, 0, 1))
+            self._hold = rng.randint(5, 40)
+        self._hold -= 1
+        return FrameInput(left=self._direction < 0, right=self._direction > 0,
+                          fire=rng.random() < self.fire_chance)
+
+
+class ScriptedPolicy:
+    """
+    Tracks the nearest invader column and fires continuously.
+
+    Steps aside when a bomb is falling straight at the ship. A small random
+    aim error keeps episodes from collapsing into identical games.
+    """
+
+    def __init__(self, rng: random.Random, dodge_distance: int = 120):
+        self.rng = rng
+        self.dodge_distance = dodge_distance
+        self._aim_error = 0
+
+    def __call__(self, world: SimulationWorld) -> FrameInput:
+        player = world.player
+        if player is None:
+            return FrameInput()
+        x = player.rect.centerx
+        danger = [
+            bomb.rect.centerx for bomb in world.bomb_group
+            if abs(bomb.rect.centerx - x) < player.rect.width
+            and 0 < player.rect.top - bomb.rect.bottom < self.dodge_distance
+        ]
+        if danger:
+            # Move away from the closest threat
+            escape_right = fmean(danger) <= x
+            return FrameInput(left=not escape_right, right=escape_right)
+
+        aliens = world.alien_group.sprites()
+        if not aliens:
+            return FrameInput(fire=True)
+        if world.frame % 60 == 0:
+            self._aim_error = self.rng.randint(-6, 6)
+        target = min(aliens, key=lambda alien: abs(alien.rect.centerx - x)).rect.centerx + self._aim_error
+        return FrameInput(left=target < x - 2, right=target > x + 2, fire=True)
+
+
+POLICIES: Dict[str, Callable[[random.Random], Policy]] = {
+    "scripted": ScriptedPolicy,
+    "random": RandomPolicy,
+}
+
+
+@dataclass(frozen=True)
+class EpisodeResult:
+    """Outcome of one headless game; the field order is the CSV column order."""
+
+    episode: int
+    seed: int
+    policy: str
+    outcome: str  # "game_over", "invaded" or "timeout"
+    score: int
+    waves_cleared: int
+    level: int
+    survival_s: float
+    shots_fired: int
+    aliens_killed: int
+    ufos_killed: int
+    lives_lost: int
+    steps: int
+    wall_s: float
+
+
+def run_episode(episode: int, seed: int, policy: str = "scripted",
+                max_minutes: float = DEFAULT_MAX_MINUTES) -> EpisodeResult:
+    """
+    Play one game to the end with ``policy`` and report how it went.
+
+    Lives, extra lives and the loss of a life follow ``Game``; the respawn
+    pause is skipped because nothing moves during it.
+
+    Args:
+        episode: Episode number (copied into the result)
+        seed: Seed for the world and the policy
+        policy: Key into ``POLICIES``
+        max_minutes: Simulated minutes after which the game is abandoned
+
+    Returns:
+        The episode's totals
+    """
+    started = time.perf_counter()
+    world = SimulationWorld()
+    world.reseed(seed)
+    world.reset()
+    # The policy gets its own stream so it does not shift the world's bombs
+    controller = POLICIES[policy](random.Random(f"policy-{seed}"))
+    step_ms = config.SIM_TICK_MS
+    max_steps = int(max_minutes * 60_000 / step_ms)
+
+    lives = constants.LIVES_NUMBER
+    awarded = score = waves = shots = aliens = ufos = lives_lost = 0
+    outcome = "timeout"
+    steps = 0
+    while steps < max_steps:
+        steps += 1
+        for event in world.step(controller(world), step_ms):
+            kind = event.type
+            if kind == SimEventType.SHOT_FIRED:
+                shots += 1
+            elif kind == SimEventType.ALIEN_KILLED:
+                score += event.value
+                aliens += 1
+            elif kind == SimEventType.UFO_KILLED:
+                score += event.value
+                ufos += 1
+            elif kind == SimEventType.WAVE_CLEARED:
+                waves += 1
+            elif kind == SimEventType.PLAYER_HIT:
+                lives -= event.value
+                lives_lost += event.value
+                if lives > 0:
+                    world.lose_life()
+            elif kind == SimEventType.ALIEN_VICTORY:
+                outcome = "invaded"
+        while score >= config.EXTRA_LIFE_SCORE + awarded * config.EXTRA_LIFE_INTERVAL:
+            lives += 1
+            awarded += 1
+        if outcome == "invaded":
+            break
+        if lives <= 0:
+            outcome = "game_over"
+            break
+    return EpisodeResult(
+        episode=episode,
+        seed=seed,
+        policy=policy,
+        outcome=outcome,
+        score=score,
+        waves_cleared=waves,
+        level=world.level,
+        survival_s=round(world.time_ms / 1000, 3),
+        shots_fired=shots,
+        aliens_killed=aliens,
+        ufos_killed=ufos,
+        lives_lost=lives_lost,
+        steps=steps,
+        wall_s=round(time.perf_counter() - started, 4),
+    )
+
+
+def parse_overrides(pairs: Iterable[str]) -> Dict[str, Any]:
+    """
+    Turn ``KEY=VALUE`` strings into config overrides.
+
+    Raises:
+        ValueError: For malformed pairs, names ``config`` does not define,
+            derived settings, or values of a different type than the default
+    """
+    overrides: Dict[str, Any] = {}
+    for pair in pairs:
+        key, sep, text = pair.partition("=")
+        key = key.strip()
+        if not sep or not key.isupper() or not hasattr(config, key):
+            raise ValueError(f"not a config setting: {pair!r}")
+        if key in DERIVED_SETTINGS:
+            raise ValueError(f"{key} is derived; set {DERIVED_SETTINGS[key][0]} instead")
+        try:
+            value = ast.literal_eval(text.strip())
+        except (ValueError, SyntaxError):
+            raise ValueError(f"bad value for {key}: {text!r}") from None
+        expected = type(getattr(config, key))
+        # An int is fine where a float is expected, but not the other way round
+        if type(value) is not expected and not (expected is float and type(value) is int):
+            raise ValueError(f"{key} needs a {expected.__name__}, got {text.strip()!r}")
+        if key.endswith("_HZ") and value <= 0:
+            raise ValueError(f"{key} must be positive, got {value}")
+        overrides[key] = value
+    return overrides
+
+
+def _apply_overrides(overrides: Dict[str, Any]) -> None:
+    for key, value in overrides.items():
+        setattr(config, key, value)
+    for key, (source, derive) in DERIVED_SETTINGS.items():
+        setattr(config, key, derive(getattr(config, source)))
+
+
+def _init_worker(overrides: Dict[str, Any]) -> None:
+    # Simulation warnings would otherwise interleave on every worker's stderr
+    logging.disable(logging.WARNING)
+    _apply_overrides(overrides)
+
+
+def _run_job(job: Sequence[Any]) -> EpisodeResult:
+    return run_episode(*job)
+
+
+def run_batch(episodes: int, seed: int = DEFAULT_SEED, policy: str = "scripted",
+              jobs: Optional[int] = None, overrides: Optional[Dict[str, Any]] = None,
+              max_minutes: float = DEFAULT_MAX_MINUTES) -> Iterator[EpisodeResult]:
+    """
+    Play ``episodes`` games across ``jobs`` worker processes.
+
+    Args:
+        episodes: Number of games
+        seed: Seed of episode 0; episode ``i`` uses ``seed + i``
+        policy: Key into ``POLICIES``
+        jobs: Worker processes (default: one per CPU); 1 plays in-process
+        overrides: Config values to set in every worker first
+        max_minutes: Simulated minutes after which a game is abandoned
+
+    Yields:
+        Results in episode order as they become available
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"unknown policy {policy!r}")
+    overrides = overrides or {}
+    work = [(index, seed + index, policy, max_minutes) for index in range(episodes)]
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1:
+        saved = {key: getattr(config, key) for key in (*overrides, *DERIVED_SETTINGS)}
+        disabled = logging.root.manager.disable
+        _init_worker(overrides)
+        try:
+            yield from map(_run_job, work)
+        finally:
+            for key, value in saved.items():
+                setattr(config, key, value)
+            logging.disable(disabled)
+        return
+    chunksize = max(1, episodes // (jobs * 8))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(overrides,)) as pool:
+        yield from pool.map(_run_job, work, chunksize=chunksize)
+
+
+def summarize(results: List[EpisodeResult]) -> str:
+    """One-line averages over a batch, for the terminal."""
+    if not results:
+        return "no episodes"
+    outcomes = {name: sum(r.outcome == name for r in results) for name in ("game_over", "invaded", "timeout")}
+    return (
+        f"{len(results)} episodes: score {fmean(r.score for r in results):.0f}, "
+        f"waves {fmean(r.waves_cleared for r in results):.2f}, "
+        f"survival {fmean(r.survival_s for r in results):.1f}s, "
+        f"shots {fmean(r.shots_fired for r in results):.0f} (mean); "
+        + ", ".join(f"{name} {count}" for name, count in outcomes.items())
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Play many headless games and write per-episode results as CSV.")
+    parser.add_argument("-n", "--episodes", type=int, default=DEFAULT_EPISODES, help="Games to play")
+    parser.add_argument("-j", "--jobs", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="scripted", help="Controller for the ship")
+    parser.add_argument("--seed", type=lambda text: int(text, 0), default=DEFAULT_SEED,
+                        help="Seed of the first episode (episode i uses seed + i)")
+    parser.add_argument("--set", dest="overrides", action="append", default=[], metavar="KEY=VALUE",
+                        help="Override a config constant in every worker, e.g. ALIEN_BOMB_CHANCE=0.02")
+    parser.add_argument("--max-minutes", type=float, default=DEFAULT_MAX_MINUTES,
+                        help="Simulated minutes before an episode is cut off")
+    parser.add_argument("-o", "--output", help="Write the CSV here instead of stdout")
+    args = parser.parse_args(argv)
+    try:
+        overrides = parse_overrides(args.overrides)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    started = time.perf_counter()
+    handle = open(args.output, "w", newline="", encoding="utf-8") if args.output else sys.stdout
+    results: List[EpisodeResult] = []
+    try:
+        writer = csv.writer(handle)
+        writer.writerow([field.name for field in fields(EpisodeResult)])
+        for result in run_batch(args.episodes, args.seed, args.policy, args.jobs, overrides, args.max_minutes):
+            writer.writerow(astuple(result))
+            results.append(result)
+    finally:
+        if handle is not sys.stdout:
+            handle.close()
+    print(f"{summarize(results)} in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,323 @@
+"""
+Scenario benchmarks for the game loop.
+
+Boots ``Game`` on the SDL dummy video/audio drivers, drives named scenarios
+for a fixed number of frames and reports update, draw and present timings
+plus allocation figures as JSON::
+
+    python -m src.bench                                  # all scenarios, JSON to stdout
+    python -m src.bench -s bomb_storm --frames 1200 -o bench.json
+    python -m src.bench --baseline bench.json --threshold 0.15
+
+With ``--baseline`` every scenario is compared against a stored report and the
+exit status is 1 when any tracked metric regressed by more than the threshold.
+Frames are not paced by the clock, so numbers show raw per-frame cost.
+"""
+import argparse
+import gc
+import json
+import logging
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from statistics import fmean
+from typing import Callable, Dict, List, Optional
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from . import constants  # noqa: E402
+from .main import Game  # noqa: E402
+
+BENCH_SEED = 0x5EED
+DEFAULT_FRAMES = 600
+DEFAULT_WARMUP = 30
+DEFAULT_ALLOC_FRAMES = 60
+DEFAULT_THRESHOLD = 0.10
+# Differences below this many milliseconds are treated as noise
+NOISE_FLOOR_MS = 0.05
+# (section, statistic) pairs checked against a baseline
+TRACKED_METRICS = (
+    ("frame_ms", "mean"), ("frame_ms", "p95"),
+    ("update_ms", "mean"), ("draw_ms", "mean"), ("present_ms", "mean"),
+)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A named workload: ``setup`` prepares the game, ``tick`` runs before every frame."""
+
+    name: str
+    description: str
+    setup: Callable[[Game], None]
+    tick: Optional[Callable[[Game, int], None]] = None
+
+
+def _start_playing(game: Game, two_player: bool = False) -> None:
+    game.two_player_mode = two_player
+    if two_player:
+        game.start_two_player_game()
+    else:
+        game.reset_game(start_playing=True)
+    game.world.reseed(BENCH_SEED)
+    game.level_start_ready_time = 0
+    game.wave_message_timer = 0
+
+
+def _keep_alive(game: Game, frame: int) -> None:
+    """Hold the game in play: top up lives, skip respawn pauses, sweep the ship."""
+    game.waiting_for_respawn = False
+    game.set_current_lives(constants.LIVES_NUMBER)
+    if game.game_over:
+        _start_playing(game, game.two_player_mode)
+    phase = frame % 240
+    game.player.steer(phase < 120, phase >= 120)
+
+
+def _bomb_storm_setup(game: Game) -> None:
+    _start_playing(game)
+    for _ in range(7):
+        game.world.start_next_wave()
+    game.world.alien_speed = game.world.alien_speed + 0.6
+
+
+def _bomb_storm_tick(game: Game, frame: int) -> None:
+    _keep_alive(game, frame)
+    if not game.alien_group:
+        game.world.start_next_wave()
+    # Late waves keep the screen full of bombs and the player firing constantly
+    game.world.spawn_bomb(chance_scale=25.0)
+    game._fire_requested = True
+
+
+def _two_player_tick(game: Game, frame: int) -> None:
+    _keep_alive(game, frame)
+    if frame % 30 == 29:
+        game.switch_player()
+
+
+def _attract_setup(game: Game) -> None:
+    game.start_intro_demo(cycle=True)
+
+
+def _wave_transition_tick(game: Game, frame: int) -> None:
+    _keep_alive(game, frame)
+    if frame % 60 == 59:
+        game._start_next_wave()
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario("full_formation", "All 55 aliens marching while the ship sweeps the floor",
+                 _start_playing, _keep_alive),
+        Scenario("bomb_storm", "Wave 8 formation with a bomb-heavy sky and constant fire",
+                 _bomb_storm_setup, _bomb_storm_tick),
+        Scenario("two_player_switch", "2-player game switching players every 30 frames",
+                 lambda game: _start_playing(game, two_player=True), _two_player_tick),
+        Scenario("attract_idle", "Menu idle time spent in the cycling attract demo",
+                 _attract_setup),
+        Scenario("wave_transition", "A fresh wave built every 60 frames",
+                 _start_playing, _wave_transition_tick),
+    )
+}
+
+
+def _frame(game: Game, scenario: Scenario, index: int) -> None:
+    """
+    One pass of ``Game.run``'s loop body, without frame pacing.
+
+    Every frame is credited exactly one simulation step of wall time, so the
+    timestep and interpolator run as in the game but the step count per frame
+    stays fixed.
+    """
+    profiler = game.profiler
+    if scenario.tick:
+        scenario.tick(game, index)
+    profiler.begin_frame()
+    game._begin_frame()
+    with profiler.section("events"):
+        game.handle_events()
+    if game._should_simulate():
+        with profiler.section("update"):
+            game._run_simulation_steps(game.timestep.advance(game.timestep.step_ms))
+    else:
+        game.timestep.reset()
+        game.interpolator.clear()
+    with profiler.section("draw"):
+        game.interpolator.apply(game.timestep.alpha)
+        try:
+            game.draw()
+        finally:
+            game.interpolator.restore()
+    profiler.end_frame()
+
+
+def _stats(samples: List[float]) -> Dict[str, float]:
+    if not samples:
+        return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    ordered = sorted(samples)
+    last = len(ordered) - 1
+
+    def rank(p: float) -> float:
+        return round(ordered[min(last, int(round(p / 100.0 * last)))], 4)
+
+    return {"mean": round(fmean(ordered), 4), "p50": rank(50), "p95": rank(95),
+            "p99": rank(99), "max": round(ordered[-1], 4)}
+
+
+def run_scenario(scenario: Scenario, frames: int = DEFAULT_FRAMES, warmup: int = DEFAULT_WARMUP,
+                 alloc_frames: int = DEFAULT_ALLOC_FRAMES) -> Dict[str, object]:
+    """
+    Run one scenario on a fresh ``Game`` and return its report entry.
+
+    Args:
+        scenario: Workload to drive
+        frames: Timed frames
+        warmup: Untimed frames run first so caches and pools are populated
+        alloc_frames: Extra frames run under ``tracemalloc`` (0 skips them)
+
+    Returns:
+        Timing statistics per section (ms), GC and allocation figures
+    """
+    game = Game()
+    profiler = game.profiler
+    profiler.window = max(frames, 1)
+    profiler.enabled = True
+    scenario.setup(game)
+    for index in range(warmup):
+        _frame(game, scenario, index)
+    profiler.reset()
+
+    gc.collect()
+    collections_before = sum(stat["collections"] for stat in gc.get_stats())
+    started = time.perf_counter()
+    for index in range(warmup, warmup + frames):
+        _frame(game, scenario, index)
+    wall_s = time.perf_counter() - started
+    collections = sum(stat["collections"] for stat in gc.get_stats()) - collections_before
+
+    draw = profiler.samples("draw")
+    present = profiler.samples("present") or [0.0] * len(draw)
+    report: Dict[str, object] = {
+        "frames": frames,
+        "wall_s": round(wall_s, 4),
+        "fps": round(frames / wall_s, 1) if wall_s else 0.0,
+        "frame_ms": _stats(profiler.samples("frame")),
+        "update_ms": _stats(profiler.samples("update")),
+        # Presenting happens inside Game.draw; report rendering and presenting apart
+        "draw_ms": _stats([total - shown for total, shown in zip(draw, present)]),
+        "present_ms": _stats(present),
+        "gc_collections": collections,
+    }
+
+    if alloc_frames > 0:
+        tracemalloc.start()
+        baseline_bytes, _ = tracemalloc.get_traced_memory()
+        start = warmup + frames
+        for index in range(start, start + alloc_frames):
+            _frame(game, scenario, index)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        report["alloc_peak_kb"] = round((peak - baseline_bytes) / 1024, 1)
+        report["alloc_net_kb_per_frame"] = round((current - baseline_bytes) / 1024 / alloc_frames, 3)
+    return report
+
+
+def run_suite(names: Optional[List[str]] = None, frames: int = DEFAULT_FRAMES,
+              warmup: int = DEFAULT_WARMUP, alloc_frames: int = DEFAULT_ALLOC_FRAMES) -> Dict[str, object]:
+    """Run the named scenarios (all by default) and return the full JSON report."""
+    selected = names or list(SCENARIOS)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "video_driver": os.environ.get("SDL_VIDEODRIVER", ""),
+            "frames": frames,
+            "warmup": warmup,
+        },
+        "scenarios": {
+            name: run_scenario(SCENARIOS[name], frames, warmup, alloc_frames) for name in selected
+        },
+    }
+
+
+def compare(report: Dict[str, object], baseline: Dict[str, object],
+            threshold: float = DEFAULT_THRESHOLD) -> List[str]:
+    """
+    List the metrics in ``report`` that regressed against ``baseline``.
+
+    A metric regresses when it exceeds the baseline by more than ``threshold``
+    (a fraction) and by more than ``NOISE_FLOOR_MS``. Scenarios missing from
+    either report are skipped.
+    """
+    regressions = []
+    base_scenarios = baseline.get("scenarios", {})
+    for name, current in report.get("scenarios", {}).items():
+        previous = base_scenarios.get(name)
+        if previous is None:
+            continue
+        for section, statistic in TRACKED_METRICS:
+            now = current.get(section, {}).get(statistic)
+            before = previous.get(section, {}).get(statistic)
+            if now is None or before is None:
+                continue
+            if now > before * (1.0 + threshold) and now - before > NOISE_FLOOR_MS:
+                change = (now / before - 1.0) * 100 if before else float("inf")
+                regressions.append(
+                    f"{name}: {section}.{statistic} {before:.3f} -> {now:.3f} ms (+{change:.0f}%)"
+                )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the Space Invaders scenario benchmarks.")
+    parser.add_argument("-s", "--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="Scenario to run (repeatable; default: all)")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="Timed frames per scenario")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP, help="Untimed frames before timing")
+    parser.add_argument("--alloc-frames", type=int, default=DEFAULT_ALLOC_FRAMES,
+                        help="Frames traced for allocations (0 to skip)")
+    parser.add_argument("-o", "--output", help="Write the JSON report here instead of stdout")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown as a fraction of the baseline (default 0.10)")
+    parser.add_argument("--list", action="store_true", help="List scenarios and exit")
+    parser.add_argument("--verbose", action="store_true", help="Keep game logging enabled")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for scenario in SCENARIOS.values():
+            print(f"{scenario.name:18} {scenario.description}")
+        return 0
+    if not args.verbose:
+        # Game logs warnings to stdout, which would interleave with the report
+        logging.disable(logging.WARNING)
+
+    report = run_suite(args.scenario, args.frames, args.warmup, args.alloc_frames)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as handle:
+            regressions = compare(report, json.load(handle), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%} of {args.baseline}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,12 @@ ASSETS_DIR = os.path.join(os.path.dirname(BASE_DIR), "assets")
 IMG_DIR = os.path.join(ASSETS_DIR, "images")
 SOUND_DIR = os.path.join(ASSETS_DIR, "sounds")
 FONT_DIR = os.path.join(ASSETS_DIR, "fonts")
+# Font file under FONT_DIR used for every named font, skipping system lookup
+FONT_FILE = os.environ.get("SPACEINVADERS_FONT", "")
+# Resolved system font paths, reused across runs; empty keeps them in memory only
+FONT_CACHE_PATH = os.environ.get(
+    "SPACEINVADERS_FONT_CACHE", os.path.join(os.path.dirname(BASE_DIR), ".font_cache.json")
+)
 
 # Rendering/scaling configuration
 SPRITE_SCALE = 1  # Pixel scale for sprites pulled from the sheet
@@ -19,6 +25,20 @@ MIN_WINDOW_SCALE = 0.5
 MAX_WINDOW_SCALE = 5.0
 DEFAULT_WINDOW_SCALE = float(os.environ.get("SPACEINVADERS_WINDOW_SCALE", "1.0"))
 DEFAULT_WINDOW_SCALE = max(MIN_WINDOW_SCALE, min(MAX_WINDOW_SCALE, DEFAULT_WINDOW_SCALE))
+# Present only the playfield regions that changed; "0" falls back to full-frame flips
+DIRTY_RECT_RENDERING = os.environ.get("SPACEINVADERS_DIRTY_RECTS", "1").lower() not in ("0", "false", "no")
+DIRTY_RECT_FULL_REDRAW_RATIO = 0.5  # Dirty fraction of the playfield above which a full present is used
+# Map prebuilt sprite packs (python -m src.utils.sprite_pack) instead of slicing the PNG
+SPRITE_PACK_ENABLED = os.environ.get("SPACEINVADERS_SPRITE_PACK", "1").lower() not in ("0", "false", "no")
+SPRITE_PACK_SCALES = (1, 2)  # Scales pre-rendered into each pack
+HUD_TEXT_CACHE_SIZE = 64  # Rendered HUD text surfaces kept in the LRU cache
+PROFILER_WINDOW = 240  # Frames of history behind the profiler's rolling percentiles
+# Collect frame timings from startup (the F3 overlay also turns collection on)
+PROFILER_ENABLED = os.environ.get("SPACEINVADERS_PROFILE", "").lower() in ("1", "true", "yes")
+LOG_RATE_LIMIT = 5  # Messages per high-frequency gameplay event kind per window
+LOG_RATE_WINDOW_FRAMES = 60  # Frames per log rate-limit window
+HIGH_SCORE_SAVE_DELAY_MS = 250  # Quiet period before queued high-score saves are written
+SETTINGS_SAVE_DELAY_MS = 500  # Debounce for settings.json writes after a toggle
 
 # Backwards-compat constants used by legacy tests/utilities
 SCALE = SPRITE_SCALE
@@ -45,8 +65,25 @@ ALIEN_DROP_DISTANCE = 6
 BULLET_SPEED = -5
 BOMB_SPEED = 3
 UFO_INTERVAL = 15000  # milliseconds
+ALIEN_ANIMATION_INTERVAL_MS = 500  # Formation animation/heartbeat cadence
 PLAYER_MAX_BULLETS = int(os.environ.get("SPACEINVADERS_PLAYER_SHOTS", "1"))
+COLLISION_CELL_SIZE = 32  # Spatial hash bucket size in logical pixels
 BUNKER_PLAYER_GAP = 80
+EXTRA_LIFE_SCORE = 20000  # First bonus life
+EXTRA_LIFE_INTERVAL = 70000  # Further bonus lives every this many points after the first
+
+# Simulation timing (all per-frame speeds/chances are tuned for this rate)
+SIMULATION_HZ = 60
+SIM_FRAME_MS = 1000 / SIMULATION_HZ
+# Fixed rate the game actually steps at; speeds are rescaled so gameplay pace is unchanged
+SIM_TICK_HZ = max(10, min(240, int(os.environ.get("SPACEINVADERS_SIM_HZ", str(SIMULATION_HZ)))))
+SIM_TICK_MS = 1000 / SIM_TICK_HZ
+SIM_MAX_STEPS_PER_FRAME = 5  # Catch-up steps per rendered frame before time is dropped (slow-down)
+# Render rate during play: 0 = uncapped; menus and attract mode stay at the nominal rate
+RENDER_FPS_CAP = max(0, int(os.environ.get("SPACEINVADERS_FPS", "60")))
+RENDER_VSYNC = os.environ.get("SPACEINVADERS_VSYNC", "").lower() in ("1", "true", "yes")
+# Draw moving sprites between their last two simulated positions
+RENDER_INTERPOLATION = os.environ.get("SPACEINVADERS_INTERPOLATE", "1").lower() not in ("0", "false", "no")
 
 # Alien pacing behaviour
 ALIEN_START_SPEED = 0.4
@@ -55,6 +92,18 @@ ALIEN_SPEED_INCREMENT = 0.02  # Legacy constant kept for compatibility
 ALIEN_BOMB_CHANCE = 0.01  # Base probability per frame to drop a bomb
 UFO_BOMB_CHANCE = 0.02  # Chance per frame for the UFO to drop a bomb
 
+# Audio mixer: smaller buffers lower latency but may crackle on slow hardware
+AUDIO_BUFFER_SIZE = int(os.environ.get("SPACEINVADERS_AUDIO_BUFFER", "512"))
+AUDIO_SFX_CHANNELS = 6  # Reserved channels for one-shot effects (heartbeat and UFO get their own)
+# Decode sound effects on a background thread the first time they are enabled
+AUDIO_BACKGROUND_LOAD = os.environ.get("SPACEINVADERS_AUDIO_BACKGROUND", "1").lower() not in ("0", "false", "no")
+
+# Reproducible runs: fixed seed for every game (unset = fresh seed per game)
+# and a directory that finished games are written to as binary replays
+_seed = os.environ.get("SPACEINVADERS_SEED", "")
+RANDOM_SEED = int(_seed, 0) if _seed else None
+REPLAY_DIR = os.environ.get("SPACEINVADERS_RECORD", "")  # Empty = keep replays in memory only
+
 # Attract mode configuration (idle demo mode)
 ATTRACT_IDLE_TIME = int(os.environ.get("SPACEINVADERS_ATTRACT_TIMEOUT", "15000"))  # ms of idle time before demo
 ATTRACT_SLIDE_INTERVAL = int(os.environ.get("SPACEINVADERS_ATTRACT_SLIDE_INTERVAL", "4000"))  # ms per slide
@@ -1,20 +1,173 @@
 """
 Collision detection and handling system.
 """
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import pygame
 
+from .. import config
 from ..utils.logger import setup_logger
 
+logger = setup_logger(__name__)
+
+# Narrow-phase test between two sprites, as taken by pygame's collide helpers
+Narrowphase = Callable[[pygame.sprite.Sprite, pygame.sprite.Sprite], Any]
+
+
+def collision_bounds(sprite: pygame.sprite.Sprite) -> pygame.Rect:
+    """Broad-phase box of a sprite: the area swept by its last move for projectiles."""
+    swept = getattr(sprite, "swept_rect", None)
+    return sprite.rect if swept is None else swept
+
+
+def _sweep_path(sprite: pygame.sprite.Sprite) -> Tuple[int, int, int, int]:
+    x, y = sprite.rect.topleft
+    start = getattr(sprite, "sweep_start", None)
+    if start is None:
+        return x, y, 0, 0
+    return start[0], start[1], x - start[0], y - start[1]
+
+
+def _sample_count(dx: int, dy: int, width: int, height: int) -> int:
+    # Stepping at most one sprite length per sample leaves no gaps along the path
+    if abs(dy) >= abs(dx):
+        distance, stride = abs(dy), height
+    else:
+        distance, stride = abs(dx), width
+    return max(1, -(-distance // max(1, stride)))
+
+
+def _mask_of(sprite: pygame.sprite.Sprite) -> pygame.mask.Mask:
+    mask = getattr(sprite, "mask", None)
+    return pygame.mask.from_surface(sprite.image) if mask is None else mask
+
+
+def sweep_contact(a: pygame.sprite.Sprite, b: pygame.sprite.Sprite) -> Optional[float]:
+    """
+    Swept mask test over both sprites' last moves.
+
+    Returns:
+        Fraction of the step (0 = start of the move, 1 = now) at which the
+        masks first touch, or None if they never do
+    """
+    ax, ay, adx, ady = _sweep_path(a)
+    bx, by, bdx, bdy = _sweep_path(b)
+    a_rect, b_rect = a.rect, b.rect
+    samples = _sample_count(
+        bdx - adx, bdy - ady,
+        min(a_rect.width, b_rect.width), min(a_rect.height, b_rect.height),
+    )
+    mask_a, mask_b = _mask_of(a), _mask_of(b)
+    for i in range(samples + 1):
+        t = i / samples
+        offset = (round(bx - ax + (bdx - adx) * t), round(by - ay + (bdy - ady) * t))
+        if mask_a.overlap(mask_b, offset) is not None:
+            return t
+    return None
+
+
+def collide_swept(a: pygame.sprite.Sprite, b: pygame.sprite.Sprite) -> bool:
+    """Narrow phase for ``groupcollide``: masks touch anywhere along the last step."""
+    return sweep_contact(a, b) is not None
+
+
+def sweep_rects(sprite: pygame.sprite.Sprite) -> Iterator[pygame.Rect]:
+    """Rects along a sprite's last move, from where it started to where it is."""
+    x, y, dx, dy = _sweep_path(sprite)
+    rect = sprite.rect
+    samples = _sample_count(dx, dy, rect.width, rect.height)
+    for i in range(samples + 1):
+        t = i / samples
+        yield pygame.Rect(round(x + dx * t), round(y + dy * t), rect.width, rect.height)
+
+
+class SpatialHash:
+    """
+    Uniform grid broad-phase index.
+
+    Sprites are bucketed by every cell their rect overlaps, so a query only
+    looks at the handful of sprites near the probe instead of scanning a whole
+    group. Rects (swept boxes for projectiles, see ``collision_bounds``) are
+    sampled when a sprite is inserted; rebuild the index after moving sprites.
+    Killed sprites are skipped at query time.
+    """
+
+    def __init__(self, cell_size: int = config.COLLISION_CELL_SIZE):
+        """
+        Initialize an empty index.
+
+        Args:
+            cell_size: Width/height of a grid cell in logical pixels
+        """
+        self.cell_size = max(1, int(cell_size))
+        self._cells: Dict[Tuple[int, int], List[Tuple[int, pygame.sprite.Sprite]]] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def clear(self) -> None:
+        """Remove every sprite from the index."""
+        self._cells.clear()
+        self._count = 0
+
+    def _cell_span(self, rect: pygame.Rect) -> Tuple[int, int, int, int]:
+        size = self.cell_size
+        return (
+            rect.left // size,
+            max(rect.left, rect.right - 1) // size,
+            rect.top // size,
+            max(rect.top, rect.bottom - 1) // size,
+        )
+
+    def insert(self, sprite: pygame.sprite.Sprite) -> None:
+        """Add a sprite under every cell its current bounds touch."""
+        entry = (self._count, sprite)
+        self._count += 1
+        cells = self._cells
+        x0, x1, y0, y1 = self._cell_span(collision_bounds(sprite))
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [entry]
+                else:
+                    bucket.append(entry)
+
+    def insert_many(self, sprites: Iterable[pygame.sprite.Sprite]) -> None:
+        """Add several sprites in iteration order."""
+        for sprite in sprites:
+            self.insert(sprite)
+
+    def query(self, rect: pygame.Rect) -> List[pygame.sprite.Sprite]:
+        """Return live sprites whose bounds overlap ``rect``, in insertion order."""
+        cells = self._cells
+        found: Dict[int, pygame.sprite.Sprite] = {}
+        x0, x1, y0, y1 = self._cell_span(rect)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for order, sprite in bucket:
+                    if order in found or not sprite.alive():
+                        continue
+                    if collision_bounds(sprite).colliderect(rect):
+                        found[order] = sprite
+        if len(found) > 1:
+            return [found[order] for order in sorted(found)]
+        return list(found.values())
+
 
 class CollisionManager:
     """Manages all collision detection and responses in the game."""
 
-    def __init__(self):
+    def __init__(self, cell_size: int = config.COLLISION_CELL_SIZE):
         """Initialize the collision manager."""
-        self.logger = setup_logger(__name__)
+        self.logger = logger
         self.collision_handlers: Dict[str, callable] = {}
+        self.cell_size = cell_size
+        self.layers: Dict[str, SpatialHash] = {}
 
     def register_collision_handler(self, collision_type: str, handler: callable) -> None:
         """Register a handler for a specific collision type."""
@@ -36,3 +189,87 @@ class CollisionManager:
             self.collision_handlers[collision_type](*args, **kwargs)
         else:
             self.logger.warning(f"No handler registered for collision type: {collision_type}")
+
+    # Broad-phase queries -----------------------------------------------------
+
+    def rebuild(self, layers: Dict[str, Iterable[pygame.sprite.Sprite]]) -> None:
+        """
+        Re-index the given layers; call once per frame after sprites have moved.
+
+        Args:
+            layers: Layer name -> sprites (usually a sprite group) to index
+        """
+        for name, sprites in layers.items():
+            index = self.layers.get(name)
+            if not isinstance(index, SpatialHash):
+                index = self.layers[name] = SpatialHash(self.cell_size)
+            else:
+                index.clear()
+            index.insert_many(sprites)
+
+    def set_layer(self, layer: str, index: Any) -> None:
+        """
+        Use a ready-made index for a layer instead of hashing it.
+
+        Any object with ``query(rect)`` returning live overlapping sprites and
+        ``__len__`` works, e.g. ``AlienFormation`` which answers from its columns.
+        """
+        self.layers[layer] = index
+
+    def add_to_layer(self, layer: str, sprite: pygame.sprite.Sprite) -> None:
+        """Index a sprite created after the last rebuild."""
+        index = self.layers.get(layer)
+        if not isinstance(index, SpatialHash):
+            index = self.layers[layer] = SpatialHash(self.cell_size)
+        index.insert(sprite)
+
+    def query(self, layer: str, rect: pygame.Rect) -> List[pygame.sprite.Sprite]:
+        """Return live sprites in ``layer`` overlapping ``rect``."""
+        index = self.layers.get(layer)
+        if index is None:
+            return []
+        return index.query(rect)
+
+    def spritecollide(self, sprite: pygame.sprite.Sprite, layer: str,
+                      dokill: bool = False, collided: Optional[Narrowphase] = None) -> List[pygame.sprite.Sprite]:
+        """
+        Indexed equivalent of ``pygame.sprite.spritecollide`` against a layer.
+
+        ``collided`` (e.g. ``pygame.sprite.collide_mask``) only runs on pairs
+        whose rects already overlap.
+        """
+        collided_sprites = self.query(layer, collision_bounds(sprite))
+        if collided is not None and collided_sprites:
+            collided_sprites = [other for other in collided_sprites if collided(sprite, other)]
+        if dokill:
+            for other in collided_sprites:
+                other.kill()
+        return collided_sprites
+
+    def groupcollide(self, group: pygame.sprite.Group, layer: str,
+                     dokill_group: bool = False, dokill_layer: bool = False,
+                     collided: Optional[Narrowphase] = None) -> Dict[Any, List[Any]]:
+        """
+        Indexed equivalent of ``pygame.sprite.groupcollide``.
+
+        Each sprite in ``group`` probes the layer index, so the cost grows with
+        the number of probes and nearby sprites rather than ``len(a) * len(b)``.
+        ``collided`` is the narrow phase, run only on rect-overlapping pairs.
+        """
+        index = self.layers.get(layer)
+        hits: Dict[Any, List[Any]] = {}
+        if index is None or not len(index):
+            return hits
+        for sprite in group.sprites():
+            collided_sprites = index.query(collision_bounds(sprite))
+            if collided_sprites and collided is not None:
+                collided_sprites = [other for other in collided_sprites if collided(sprite, other)]
+            if not collided_sprites:
+                continue
+            hits[sprite] = collided_sprites
+            if dokill_layer:
+                for other in collided_sprites:
+                    other.kill()
+            if dokill_group:
+                sprite.kill()
+        return hits
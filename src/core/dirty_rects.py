@@ -0,0 +1,128 @@
+"""
+Dirty-rectangle tracking for the logical playfield.
+"""
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+import pygame
+
+from .. import config
+
+_SpriteState = Tuple[Tuple[int, int, int, int], int]
+
+
+class DirtyRectTracker:
+    """
+    Collects the playfield regions that changed since the last present.
+
+    Sprite groups are diffed against the previous frame by rect and image, so
+    a sprite that moved, changed image, appeared or disappeared marks both its
+    old and new rects. Anything else (HUD bands, floating text, overlays) is
+    marked explicitly. ``collect()`` returns None when the whole frame must be
+    presented: after ``invalidate()``, in full-redraw mode, or when the dirty
+    area is large enough that a single full update is cheaper.
+    """
+
+    def __init__(self, size: Tuple[int, int], enabled: bool = config.DIRTY_RECT_RENDERING,
+                 full_redraw_ratio: float = config.DIRTY_RECT_FULL_REDRAW_RATIO):
+        """
+        Initialize the tracker.
+
+        Args:
+            size: Logical playfield size (width, height)
+            enabled: False forces full-frame presents (fallback mode)
+            full_redraw_ratio: Fraction of the playfield above which a frame is
+                presented in full instead of region by region
+        """
+        self.bounds = pygame.Rect((0, 0), size)
+        self.enabled = enabled
+        self.full_redraw_ratio = full_redraw_ratio
+        self._rects: List[pygame.Rect] = []
+        self._full = True
+        self._sprites: Dict[pygame.sprite.Sprite, _SpriteState] = {}
+        self._regions: Dict[Hashable, Tuple[Hashable, pygame.Rect]] = {}
+        self._transient: Dict[Hashable, List[pygame.Rect]] = {}
+
+    def invalidate(self) -> None:
+        """Present the whole playfield on the next ``collect()``."""
+        self._full = True
+
+    def mark(self, rect) -> None:
+        """Mark a playfield rect as changed."""
+        rect = pygame.Rect(rect).clip(self.bounds)
+        if rect.width and rect.height:
+            self._rects.append(rect)
+
+    def track(self, *groups: Iterable[pygame.sprite.Sprite]) -> None:
+        """Diff the sprites in ``groups`` against the previous frame."""
+        previous = self._sprites
+        current: Dict[pygame.sprite.Sprite, _SpriteState] = {}
+        mark = self.mark
+        for group in groups:
+            for sprite in group:
+                rect = sprite.rect
+                state = (tuple(rect), id(sprite.image))
+                current[sprite] = state
+                old = previous.pop(sprite, None)
+                if old != state:
+                    mark(rect)
+                    if old is not None:
+                        mark(old[0])
+        # Whatever is left was removed since the last frame
+        for old_rect, _ in previous.values():
+            mark(old_rect)
+        self._sprites = current
+
+    def track_region(self, key: Hashable, signature: Hashable, rect) -> None:
+        """Mark ``rect`` when the content ``signature`` drawn there changes."""
+        rect = pygame.Rect(rect)
+        old = self._regions.get(key)
+        if old is None or old[0] != signature or old[1] != rect:
+            self.mark(rect)
+            if old is not None and old[1] != rect:
+                self.mark(old[1])
+            self._regions[key] = (signature, rect)
+
+    def track_transient(self, key: Hashable, rects: Iterable) -> None:
+        """Mark short-lived drawings (e.g. floating text) and where they were last frame."""
+        rects = [pygame.Rect(rect) for rect in rects]
+        for rect in self._transient.get(key, ()):
+            self.mark(rect)
+        for rect in rects:
+            self.mark(rect)
+        self._transient[key] = rects
+
+    def collect(self) -> Optional[List[pygame.Rect]]:
+        """
+        Return merged dirty rects for this frame and start a new one.
+
+        Returns:
+            List of playfield rects to present (possibly empty), or None for a
+            full-frame present
+        """
+        rects, self._rects = self._rects, []
+        full, self._full = self._full, False
+        if full or not self.enabled:
+            return None
+        merged = merge_rects(rects)
+        area = sum(rect.width * rect.height for rect in merged)
+        if area > self.full_redraw_ratio * self.bounds.width * self.bounds.height:
+            return None
+        return merged
+
+
+def merge_rects(rects: Iterable[pygame.Rect]) -> List[pygame.Rect]:
+    """Union overlapping or touching rects until none overlap."""
+    merged: List[pygame.Rect] = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        changed = True
+        while changed:
+            changed = False
+            probe = rect.inflate(2, 2)
+            for index, other in enumerate(merged):
+                if probe.colliderect(other):
+                    rect.union_ip(merged.pop(index))
+                    changed = True
+                    break
+        merged.append(rect)
+    return merged
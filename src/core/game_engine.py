@@ -9,13 +9,15 @@ from .. import config
 from ..ui.font_manager import get_font
 from ..utils.logger import setup_logger
 
+logger = setup_logger(__name__)
+
 
 class GameEngine:
     """Main game engine responsible for initialization and core game loop."""
 
     def __init__(self):
         """Initialize the game engine."""
-        self.logger = setup_logger(__name__)
+        self.logger = logger
         self.screen: Optional[pygame.Surface] = None
         self.clock: Optional[pygame.time.Clock] = None
         self.font: Optional[pygame.font.Font] = None
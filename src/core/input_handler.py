@@ -7,13 +7,15 @@ import pygame
 
 from ..utils.logger import setup_logger
 
+logger = setup_logger(__name__)
+
 
 class InputHandler:
     """Handles all input events and key states."""
 
     def __init__(self):
         """Initialize the input handler."""
-        self.logger = setup_logger(__name__)
+        self.logger = logger
         self.key_bindings: Dict[int, Callable] = {}
         self.event_handlers: Dict[int, Callable] = {}
 
@@ -0,0 +1,180 @@
+"""
+Letterboxed presentation of the logical playfield onto the window.
+"""
+from typing import Iterable, List, Optional, Tuple
+
+import pygame
+
+from .. import constants
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+SCALE_QUALITIES = ("nearest", "scale2x", "smooth")
+
+
+class PlayfieldPresenter:
+    """
+    Scales the logical playfield into the window, reusing surfaces across frames.
+
+    The letterbox geometry and the destination surface are worked out once per
+    window size. Scaling writes straight into a subsurface of the window via the
+    ``dest`` argument of the transform functions, so presenting a frame no
+    longer allocates a window-sized surface. Call ``invalidate()`` after the
+    window is recreated or something else has drawn on it.
+
+    Quality modes:
+        nearest: plain nearest-neighbour; dirty regions are scaled on their own
+            and an integer window multiple maps them without rounding.
+        scale2x: ``pygame.transform.scale2x`` (EPX) first, then nearest to fit.
+        smooth: ``pygame.transform.smoothscale``.
+    The filtered modes rescale the whole frame, but still only push dirty
+    regions to the display.
+    """
+
+    def __init__(self, logical_size: Tuple[int, int], quality: str = "nearest"):
+        """
+        Initialize the presenter.
+
+        Args:
+            logical_size: Size (width, height) of the playfield surface
+            quality: One of ``SCALE_QUALITIES``
+        """
+        self.logger = logger
+        self.logical_width, self.logical_height = logical_size
+        self.quality = "nearest"
+        self.set_quality(quality)
+        self.scale = 1.0
+        self.integer_scale = 0
+        self.dest_rect = pygame.Rect(0, 0, 0, 0)
+        self._window_size: Optional[Tuple[int, int]] = None
+        self._target: Optional[pygame.Surface] = None
+        self._scaled: Optional[pygame.Surface] = None
+        self._doubled: Optional[pygame.Surface] = None
+        self._direct = True
+
+    def set_quality(self, quality: str) -> None:
+        """Select the scaling filter; unknown names fall back to nearest."""
+        if quality not in SCALE_QUALITIES:
+            self.logger.warning("Unknown scale quality %r; using nearest", quality)
+            quality = "nearest"
+        if quality != self.quality:
+            self.quality = quality
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        """Drop cached geometry and surfaces; the next present is a full one."""
+        self._window_size = None
+        self._target = None
+        self._scaled = None
+        self._doubled = None
+
+    def _configure(self, screen: pygame.Surface) -> bool:
+        """Recompute geometry for the current window. Returns True if it changed."""
+        window_size = screen.get_size()
+        if window_size == self._window_size and self._target is not None:
+            return False
+        window_width, window_height = window_size
+        scale = min(window_width / self.logical_width, window_height / self.logical_height)
+        scaled_width = max(1, int(self.logical_width * scale))
+        scaled_height = max(1, int(self.logical_height * scale))
+        self.scale = scale
+        self.integer_scale = int(scale) if scale >= 1 and scale == int(scale) else 0
+        self.dest_rect = pygame.Rect(
+            (window_width - scaled_width) // 2,
+            (window_height - scaled_height) // 2,
+            scaled_width,
+            scaled_height,
+        )
+        self._window_size = window_size
+        self._target = screen.subsurface(self.dest_rect.clip(screen.get_rect()))
+        self._scaled = None
+        self._doubled = None
+        self._direct = True
+        return True
+
+    def window_rect(self, rect: pygame.Rect) -> pygame.Rect:
+        """Map a playfield rect to the window rect it is presented in."""
+        left, top = self.dest_rect.topleft
+        factor = self.integer_scale
+        if factor:
+            return pygame.Rect(left + rect.x * factor, top + rect.y * factor,
+                               rect.width * factor, rect.height * factor)
+        # Map edges rather than sizes so neighbouring regions meet exactly
+        scale = self.scale
+        x0 = left + int(rect.left * scale)
+        y0 = top + int(rect.top * scale)
+        return pygame.Rect(x0, y0, left + int(rect.right * scale) - x0, top + int(rect.bottom * scale) - y0)
+
+    def present(self, screen: pygame.Surface, source: pygame.Surface,
+                dirty_rects: Optional[Iterable[pygame.Rect]] = None) -> Optional[List[pygame.Rect]]:
+        """
+        Draw ``source`` into ``screen``.
+
+        Args:
+            screen: Window surface
+            source: Logical playfield surface
+            dirty_rects: Playfield regions that changed, or None for a full frame
+
+        Returns:
+            Window rects to pass to ``pygame.display.update``, or None when the
+            whole window should be flipped
+        """
+        if self._configure(screen):
+            screen.fill(constants.BLACK)
+            dirty_rects = None
+        if dirty_rects is None:
+            self._scale_frame(screen, source)
+            return None
+
+        updated = []
+        if self.quality == "nearest":
+            for rect in dirty_rects:
+                window_rect = self.window_rect(rect)
+                if window_rect.width <= 0 or window_rect.height <= 0:
+                    continue
+                region = source.subsurface(rect)
+                if self._direct:
+                    try:
+                        pygame.transform.scale(region, window_rect.size, screen.subsurface(window_rect))
+                        updated.append(window_rect)
+                        continue
+                    except ValueError:
+                        self._direct = False
+                updated.append(screen.blit(pygame.transform.scale(region, window_rect.size), window_rect))
+            return updated
+
+        dirty_rects = list(dirty_rects)
+        if dirty_rects:
+            self._scale_frame(screen, source)
+            updated = [self.window_rect(rect) for rect in dirty_rects]
+        return updated
+
+    def _scale_frame(self, screen: pygame.Surface, source: pygame.Surface) -> None:
+        """Scale the whole playfield into the letterboxed destination."""
+        size = self.dest_rect.size
+        if self._direct:
+            try:
+                self._scale_into(source, size, self._target)
+                return
+            except ValueError:
+                # Playfield and window formats differ; keep a matching buffer instead
+                self._direct = False
+        if self._scaled is None:
+            self._scaled = pygame.Surface(size, 0, source)
+        self._scale_into(source, size, self._scaled)
+        screen.blit(self._scaled, self.dest_rect)
+
+    def _scale_into(self, source: pygame.Surface, size: Tuple[int, int], dest: pygame.Surface) -> None:
+        if dest.get_size() != size:
+            raise ValueError("destination does not match the presented size")
+        if self.quality == "smooth" and source.get_bitsize() >= 24:
+            pygame.transform.smoothscale(source, size, dest)
+        elif self.quality == "scale2x":
+            if self._doubled is None:
+                width, height = source.get_size()
+                self._doubled = pygame.Surface((width * 2, height * 2), 0, source)
+            pygame.transform.scale2x(source, self._doubled)
+            pygame.transform.scale(self._doubled, size, dest)
+        else:
+            pygame.transform.scale(source, size, dest)
@@ -0,0 +1,162 @@
+"""
+Lightweight frame profiler with rolling percentiles.
+"""
+import time
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .. import config
+
+
+class _Section:
+    """Reusable timing context for one named section."""
+
+    __slots__ = ("_profiler", "name", "_start")
+
+    def __init__(self, profiler: "FrameProfiler", name: str):
+        self._profiler = profiler
+        self.name = name
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = self._profiler.clock()
+        return self
+
+    def __exit__(self, *exc):
+        profiler = self._profiler
+        elapsed = (profiler.clock() - self._start) * 1000.0
+        profiler._current[self.name] = profiler._current.get(self.name, 0.0) + elapsed
+        return False
+
+
+class _NullSection:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class RingBuffer:
+    """Fixed-size window of the most recent float samples."""
+
+    def __init__(self, size: int):
+        self.size = max(1, size)
+        self._data = array('d', bytes(8 * self.size))
+        self._index = 0
+        self.count = 0
+
+    def push(self, value: float) -> None:
+        self._data[self._index] = value
+        self._index = (self._index + 1) % self.size
+        if self.count < self.size:
+            self.count += 1
+
+    def values(self) -> List[float]:
+        if self.count < self.size:
+            return list(self._data[:self.count])
+        return list(self._data)
+
+    def percentiles(self, *points: float) -> Tuple[float, ...]:
+        """Nearest-rank percentiles (0-100) over the window; zeros when empty."""
+        values = sorted(self.values())
+        if not values:
+            return tuple(0.0 for _ in points)
+        last = len(values) - 1
+        return tuple(values[min(last, int(round(p / 100.0 * last)))] for p in points)
+
+
+class FrameProfiler:
+    """
+    Collects per-frame timings for named sections.
+
+    Wrap work in ``with profiler.section("name"):``; time spent in a section is
+    summed over the frame and pushed into that section's ring buffer by
+    ``end_frame()``. Sections that did not run in a frame record zero, so
+    percentiles reflect every frame. When disabled, ``section()`` returns a
+    shared no-op context and nothing is recorded.
+    """
+
+    def __init__(self, window: int = config.PROFILER_WINDOW, enabled: bool = False,
+                 clock: Callable[[], float] = time.perf_counter):
+        """
+        Initialize the profiler.
+
+        Args:
+            window: Number of recent frames kept per section
+            enabled: Start collecting immediately
+            clock: Time source in seconds
+        """
+        self.window = window
+        self.enabled = enabled
+        self.clock = clock
+        self.frames = 0
+        self._sections: Dict[str, _Section] = {}
+        self._buffers: Dict[str, RingBuffer] = {}
+        self._current: Dict[str, float] = {}
+        self._frame_start: Optional[float] = None
+
+    def section(self, name: str):
+        """Context manager timing ``name`` for the current frame."""
+        if not self.enabled:
+            return _NULL_SECTION
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = _Section(self, name)
+        return section
+
+    def begin_frame(self) -> None:
+        if self.enabled:
+            self._current = {}
+            self._frame_start = self.clock()
+
+    def end_frame(self) -> None:
+        """Close the frame and record every section's total for it."""
+        if not self.enabled or self._frame_start is None:
+            return
+        current = self._current
+        current["frame"] = (self.clock() - self._frame_start) * 1000.0
+        for name in current:
+            if name not in self._buffers:
+                buffer = self._buffers[name] = RingBuffer(self.window)
+                # Backfill frames from before the section first ran
+                for _ in range(min(self.frames, self.window)):
+                    buffer.push(0.0)
+        for name, buffer in self._buffers.items():
+            buffer.push(current.get(name, 0.0))
+        self.frames += 1
+        self._frame_start = None
+
+    def reset(self) -> None:
+        self.frames = 0
+        self._buffers.clear()
+        self._current = {}
+        self._frame_start = None
+
+    def percentiles(self, name: str) -> Tuple[float, float, float]:
+        """Return (p50, p95, p99) in milliseconds for a section."""
+        buffer = self._buffers.get(name)
+        if buffer is None:
+            return 0.0, 0.0, 0.0
+        return buffer.percentiles(50, 95, 99)
+
+    def samples(self, name: str) -> List[float]:
+        """Per-frame totals (ms) for a section, oldest first, one per recorded frame."""
+        buffer = self._buffers.get(name)
+        if buffer is None:
+            return []
+        values = buffer.values()
+        if buffer.count == buffer.size:
+            values = values[buffer._index:] + values[:buffer._index]
+        return values
+
+    def summary(self) -> Dict[str, Tuple[float, float, float]]:
+        """Percentiles for every recorded section, slowest p95 first (frame total leads)."""
+        rows = {name: self.percentiles(name) for name in self._buffers}
+        order = sorted(rows, key=lambda name: (name != "frame", -rows[name][1], name))
+        return {name: rows[name] for name in order}
@@ -0,0 +1,290 @@
+"""
+Seeded input recordings and headless playback.
+
+A replay stores everything needed to reproduce a game on the simulation core:
+the world's RNG seed, a hash of the gameplay configuration and the controls fed
+to every ``SimulationWorld.step``. Controls are packed into a per-step bitfield
+and run-length encoded, so a minute of play usually fits in a few hundred bytes.
+
+File layout (little endian)::
+
+    magic "SIRP" | version u8 | seed u64 | config hash 8 bytes | steps u32
+    then runs of (length as LEB128 varint, input bits u8) until ``steps`` is covered
+
+Run ``python -m src.core.replay FILE`` to play a recording back headlessly at
+full speed and print the outcome.
+"""
+import argparse
+import hashlib
+import os
+import struct
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Tuple
+
+from .. import config
+from ..utils.logger import setup_logger
+from .simulation import FrameInput, SimEventType, SimulationWorld
+
+logger = setup_logger(__name__)
+
+MAGIC = b"SIRP"
+VERSION = 1
+_HEADER = struct.Struct("<4sBQ8sI")
+
+# Input bits for one simulation step
+LEFT = 0x01
+RIGHT = 0x02
+FIRE = 0x04
+HOLD_FIRE = 0x08  # Step ran with ``armed=False``
+
+# Settings that change how a seeded game unfolds; replays made under different
+# values are rejected rather than silently diverging.
+GAMEPLAY_CONFIG_KEYS = (
+    "BASE_WIDTH", "BASE_HEIGHT", "SPRITE_SCALE", "SIM_FRAME_MS", "SIM_TICK_MS",
+    "ALIEN_ROWS", "ALIEN_COLUMNS", "ALIEN_SPACING_X", "ALIEN_SPACING_Y",
+    "ALIEN_MARGIN_X", "ALIEN_MARGIN_Y", "ALIEN_EDGE_PADDING", "ALIEN_DROP_DISTANCE",
+    "ALIEN_ANIMATION_INTERVAL_MS", "ALIEN_START_SPEED", "ALIEN_MAX_SPEED",
+    "ALIEN_BOMB_CHANCE", "UFO_BOMB_CHANCE", "UFO_INTERVAL",
+    "BULLET_SPEED", "BOMB_SPEED", "PLAYER_MAX_BULLETS", "BUNKER_PLAYER_GAP",
+)
+
+
+class ReplayError(ValueError):
+    """Raised for unreadable replays or ones recorded under another configuration."""
+
+
+def config_hash() -> bytes:
+    """Return an 8-byte fingerprint of the gameplay configuration."""
+    values = tuple((key, getattr(config, key, None)) for key in GAMEPLAY_CONFIG_KEYS)
+    return hashlib.sha1(repr(values).encode("utf-8")).digest()[:8]
+
+
+def pack_input(inputs: FrameInput, armed: bool = True) -> int:
+    """Encode one step's controls as an input bitfield."""
+    bits = 0
+    if inputs.left:
+        bits |= LEFT
+    if inputs.right:
+        bits |= RIGHT
+    if inputs.fire:
+        bits |= FIRE
+    if not armed:
+        bits |= HOLD_FIRE
+    return bits
+
+
+def unpack_input(bits: int) -> Tuple[FrameInput, bool]:
+    """Decode an input bitfield into ``(FrameInput, armed)``."""
+    inputs = FrameInput(left=bool(bits & LEFT), right=bool(bits & RIGHT), fire=bool(bits & FIRE))
+    return inputs, not bits & HOLD_FIRE
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise ReplayError("Replay data ends inside a run length")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, offset
+        shift += 7
+
+
+@dataclass
+class Replay:
+    """A decoded recording: seed, configuration fingerprint and input runs."""
+
+    seed: int
+    config_hash: bytes = field(default_factory=config_hash)
+    runs: List[List[int]] = field(default_factory=list)  # [length, bits] pairs
+
+    @property
+    def steps(self) -> int:
+        return sum(length for length, _ in self.runs)
+
+    def matches_config(self) -> bool:
+        return self.config_hash == config_hash()
+
+    def inputs(self) -> Iterator[Tuple[FrameInput, bool]]:
+        """Yield ``(FrameInput, armed)`` for every recorded step in order."""
+        for length, bits in self.runs:
+            decoded = unpack_input(bits)
+            for _ in range(length):
+                yield decoded
+
+    def to_bytes(self) -> bytes:
+        out = bytearray(_HEADER.pack(MAGIC, VERSION, self.seed, self.config_hash, self.steps))
+        for length, bits in self.runs:
+            _write_varint(out, length)
+            out.append(bits)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        """
+        Decode a replay.
+
+        Raises:
+            ReplayError: If the data is not a replay this version can read
+        """
+        if len(data) < _HEADER.size:
+            raise ReplayError("Replay data is truncated")
+        magic, version, seed, fingerprint, steps = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ReplayError("Not a replay file")
+        if version != VERSION:
+            raise ReplayError(f"Unsupported replay version {version}")
+        runs: List[List[int]] = []
+        offset = _HEADER.size
+        remaining = steps
+        while remaining > 0:
+            length, offset = _read_varint(data, offset)
+            if offset >= len(data) or not 0 < length <= remaining:
+                raise ReplayError("Corrupt replay run")
+            runs.append([length, data[offset]])
+            offset += 1
+            remaining -= length
+        return cls(seed, fingerprint, runs)
+
+    def save(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "wb") as handle:
+            handle.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        with open(path, "rb") as handle:
+            return cls.from_bytes(handle.read())
+
+
+class ReplayRecorder:
+    """Appends each simulation step's controls to a run-length encoded replay."""
+
+    def __init__(self, seed: int):
+        self.replay = Replay(seed)
+        self._runs = self.replay.runs
+
+    @property
+    def steps(self) -> int:
+        return self.replay.steps
+
+    def record(self, inputs: FrameInput, armed: bool = True) -> None:
+        bits = pack_input(inputs, armed)
+        runs = self._runs
+        if runs and runs[-1][1] == bits:
+            runs[-1][0] += 1
+        else:
+            runs.append([1, bits])
+
+
+@dataclass
+class ReplayResult:
+    """Outcome of playing a replay back on a headless world."""
+
+    steps: int
+    score: int
+    level: int
+    player_hits: int
+    aliens_killed: int
+    ufos_killed: int
+    invaded: bool
+    sim_ms: float
+    wall_s: float
+
+
+def play_replay(replay: Replay, world: Optional[SimulationWorld] = None,
+                strict: bool = True) -> ReplayResult:
+    """
+    Re-run a recording on a headless world as fast as the CPU allows.
+
+    Life losses are applied the way a one-player ``Game`` applies them, so the
+    world ends in the same state the recorded game did.
+
+    Args:
+        replay: Recording to play back
+        world: World to drive (a fresh default-sized one when omitted)
+        strict: Refuse replays recorded under a different gameplay configuration
+
+    Returns:
+        Totals for the run
+
+    Raises:
+        ReplayError: If ``strict`` and the configuration hash does not match
+    """
+    if strict and not replay.matches_config():
+        raise ReplayError("Replay was recorded with different gameplay settings")
+    if world is None:
+        world = SimulationWorld()
+    world.reseed(replay.seed)
+    world.reset()
+
+    score = hits = aliens = ufos = 0
+    invaded = False
+    total = replay.steps
+    started = time.perf_counter()
+    step = 0
+    for step, (inputs, armed) in enumerate(replay.inputs(), 1):
+        for event in world.step(inputs, config.SIM_TICK_MS, armed=armed):
+            kind = event.type
+            if kind == SimEventType.ALIEN_KILLED:
+                score += event.value
+                aliens += 1
+            elif kind == SimEventType.UFO_KILLED:
+                score += event.value
+                ufos += 1
+            elif kind == SimEventType.PLAYER_HIT:
+                hits += event.value
+                # The recording stops on the fatal hit, so any earlier one cost a life
+                if step < total:
+                    world.lose_life()
+            elif kind == SimEventType.ALIEN_VICTORY:
+                invaded = True
+    return ReplayResult(
+        steps=step,
+        score=score,
+        level=world.level,
+        player_hits=hits,
+        aliens_killed=aliens,
+        ufos_killed=ufos,
+        invaded=invaded,
+        sim_ms=world.time_ms,
+        wall_s=time.perf_counter() - started,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Play a Space Invaders replay back headlessly.")
+    parser.add_argument("path", help="Replay file written by the game")
+    parser.add_argument("--force", action="store_true",
+                        help="Play even if the gameplay settings differ from the recording")
+    args = parser.parse_args(argv)
+    try:
+        replay = Replay.load(args.path)
+        result = play_replay(replay, strict=not args.force)
+    except (OSError, ReplayError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    print(f"seed {replay.seed:#x}: {result.steps} steps ({result.sim_ms / 1000:.1f}s of play) "
+          f"in {result.wall_s:.3f}s")
+    print(f"score {result.score}, level {result.level}, aliens {result.aliens_killed}, "
+          f"ufos {result.ufos_killed}, hits {result.player_hits}"
+          + (", invaded" if result.invaded else ""))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
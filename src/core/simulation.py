@@ -0,0 +1,597 @@
+"""
+Headless simulation core.
+
+``SimulationWorld`` owns everything that happens on the playfield while a wave
+is being played: formation movement, bomb and UFO spawning, collisions and
+wave progression. It never touches the display, the mixer or the wall clock;
+time only advances through ``step(inputs, dt_ms)``. That lets the world run as
+fast as the CPU allows (balancing runs, replays, soak tests) while ``Game``
+stays a thin adapter that turns the returned events into sound, effects and
+score changes.
+"""
+import random
+import struct
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, List, Optional, Tuple
+
+import pygame
+
+from .. import config, constants
+from ..entities.alien import Alien
+from ..entities.bullet import Bomb, BombPool, Bullet, BulletPool
+from ..entities.bunker import BOMB_STAMP, SHOT_STAMP, Bunker
+from ..entities.formation import AlienFormation, FormationSnapshot
+from ..entities.player import Player
+from ..entities.ufo import UFO
+from ..utils.sprite_sheet import get_game_sprite
+from .collision_manager import CollisionManager, collide_swept, sweep_contact, sweep_rects
+from .profiler import FrameProfiler
+
+Color = Tuple[int, int, int]
+
+# Point value for each formation row, top row first
+ROW_VALUES = (30, 20, 20, 10, 10)
+
+
+@dataclass(frozen=True)
+class FrameInput:
+    """Player controls sampled for a single simulation step."""
+
+    left: bool = False
+    right: bool = False
+    fire: bool = False
+
+    @classmethod
+    def from_keys(cls, pressed: Any, fire: bool = False) -> "FrameInput":
+        """Build an input frame from a pygame key state object."""
+        return cls(left=bool(pressed[pygame.K_LEFT]), right=bool(pressed[pygame.K_RIGHT]), fire=fire)
+
+
+class SimEventType(Enum):
+    """Things that happened during a step that the presentation layer may care about."""
+    SHOT_FIRED = "shot_fired"
+    BOMB_DROPPED = "bomb_dropped"
+    FORMATION_STEP = "formation_step"
+    UFO_SPAWNED = "ufo_spawned"
+    ALIEN_KILLED = "alien_killed"
+    UFO_KILLED = "ufo_killed"
+    BUNKER_HIT = "bunker_hit"
+    BUNKER_DESTROYED = "bunker_destroyed"
+    BOMB_INTERCEPTED = "bomb_intercepted"
+    PLAYER_HIT = "player_hit"
+    ALIEN_VICTORY = "alien_victory"
+    WAVE_CLEARED = "wave_cleared"
+
+
+@dataclass(frozen=True)
+class SimEvent:
+    """A single simulation event with its position and payload."""
+
+    type: SimEventType
+    pos: Tuple[int, int] = (0, 0)
+    value: int = 0
+    reason: str = ""
+
+
+@dataclass(frozen=True)
+class PlayfieldSnapshot:
+    """
+    One player's wave in progress, small enough to copy on every 2-player switch.
+
+    Holds the formation's origin, live and animation-frame bitmasks, each
+    bunker's impact log (``None`` once destroyed) and the pacing state; sprites
+    are not kept.
+    """
+
+    level: int
+    alien_direction: int
+    alien_speed: float
+    initial_alien_count: int
+    formation: FormationSnapshot
+    bunker_damage: Tuple[Optional[bytes], ...]
+
+    _HEADER = struct.Struct("<HbdHHiiB")
+    _DAMAGE_LEN = struct.Struct("<H")
+    _DESTROYED = 0xFFFF
+
+    def to_bytes(self) -> bytes:
+        formation = self.formation
+        mask_len = (formation.slots + 7) // 8
+        parts = [
+            self._HEADER.pack(
+                self.level, self.alien_direction, self.alien_speed, self.initial_alien_count,
+                formation.slots, *formation.origin, len(self.bunker_damage),
+            ),
+            formation.alive.to_bytes(mask_len, "little"),
+            formation.frames.to_bytes(mask_len, "little"),
+        ]
+        for damage in self.bunker_damage:
+            if damage is None:
+                parts.append(self._DAMAGE_LEN.pack(self._DESTROYED))
+            else:
+                parts.extend((self._DAMAGE_LEN.pack(len(damage)), damage))
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "PlayfieldSnapshot":
+        level, direction, speed, initial, slots, ox, oy, bunkers = cls._HEADER.unpack_from(data)
+        pos = cls._HEADER.size
+        mask_len = (slots + 7) // 8
+        alive = int.from_bytes(data[pos:pos + mask_len], "little")
+        frames = int.from_bytes(data[pos + mask_len:pos + 2 * mask_len], "little")
+        pos += 2 * mask_len
+        damage: List[Optional[bytes]] = []
+        for _ in range(bunkers):
+            (length,) = cls._DAMAGE_LEN.unpack_from(data, pos)
+            pos += cls._DAMAGE_LEN.size
+            if length == cls._DESTROYED:
+                damage.append(None)
+            else:
+                damage.append(bytes(data[pos:pos + length]))
+                pos += length
+        formation = FormationSnapshot(slots, (ox, oy), alive, frames)
+        return cls(level, direction, speed, initial, formation, tuple(damage))
+
+
+class SimulationWorld:
+    """Display-independent playfield state advanced in fixed steps."""
+
+    def __init__(
+        self,
+        width: int = config.BASE_WIDTH,
+        height: int = config.BASE_HEIGHT,
+        player_floor: Optional[int] = None,
+        rng: Optional[random.Random] = None,
+        tint_provider: Optional[Callable[[str], Optional[Color]]] = None,
+        alien_tint_provider: Optional[Callable[[int], Optional[Color]]] = None,
+    ):
+        """
+        Create an empty world; call ``reset()`` to populate it.
+
+        Args:
+            width: Logical playfield width
+            height: Logical playfield height
+            player_floor: Y coordinate the player ship rests on
+            rng: Random source for bombs and UFO values (defaults to a private
+                ``random.Random``; ``reseed()`` replaces it with a seeded one)
+            tint_provider: Maps sprite keys (``"player"``, ``"bunker"`` ...) to tints
+            alien_tint_provider: Maps alien point values to tints
+        """
+        self.width = width
+        self.height = height
+        if player_floor is None:
+            player_floor = height - constants.BOTTOM_PANEL_HEIGHT - 4
+        self.player_floor = player_floor
+        self.seed: Optional[int] = None
+        self.rng = rng if rng is not None else random.Random()
+        self.tint_provider = tint_provider
+        self.alien_tint_provider = alien_tint_provider
+
+        self.time_ms = 0.0
+        self.frame = 0
+        self.level = 1
+        self.alien_direction = 1
+        self.alien_speed = config.ALIEN_START_SPEED
+        self.initial_alien_count = 0
+        self.last_ufo_time = 0.0
+        self._animation_elapsed = 0.0
+
+        self.player: Optional[Player] = None
+        self.player_group = pygame.sprite.GroupSingle()
+        self.alien_group = AlienFormation()
+        self.bunker_group = pygame.sprite.Group()
+        self.bunkers: List[Bunker] = []  # Every bunker of the current set, destroyed or not
+        self.bullet_group = pygame.sprite.Group()
+        self.bomb_group = pygame.sprite.Group()
+        # Projectiles are recycled: they return to these pools when they leave their group
+        self.bullet_pool = BulletPool()
+        self.bomb_pool = BombPool()
+        self.ufo_group = pygame.sprite.Group()
+        self.collisions = CollisionManager()
+        # Disabled unless a caller (e.g. Game's profiler overlay) swaps in its own
+        self.profiler = FrameProfiler()
+
+        self._events: List[SimEvent] = []
+
+    # Setup -----------------------------------------------------------------
+
+    def reset(self, level: int = 1) -> None:
+        """Clear the playfield and build a fresh player, formation and bunkers."""
+        self.level = level
+        self.clear_projectiles()
+        self.ufo_group.empty()
+        self.respawn_player()
+        self.alien_group = self.create_aliens()
+        self.bunker_group = self.create_bunkers()
+        self.alien_direction = 1
+        self.reset_alien_progression()
+        self.last_ufo_time = self.time_ms
+        self._animation_elapsed = 0.0
+
+    def reseed(self, seed: int) -> None:
+        """Draw all further randomness from a fresh generator seeded with ``seed``."""
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+    def _tint(self, key: str) -> Optional[Color]:
+        return self.tint_provider(key) if self.tint_provider else None
+
+    def _alien_tint(self, value: int) -> Optional[Color]:
+        return self.alien_tint_provider(value) if self.alien_tint_provider else None
+
+    def create_aliens(self) -> AlienFormation:
+        """Create alien formation and return sprite group."""
+        group = AlienFormation()
+        margin_y = config.ALIEN_MARGIN_Y
+        spacing_y = config.ALIEN_SPACING_Y
+        rows = config.ALIEN_ROWS
+        cols = config.ALIEN_COLUMNS
+        values = ROW_VALUES[:rows]
+
+        # Get sprite dimensions for centering
+        sprite_names = {30: 'alien_squid_1', 20: 'alien_crab_1', 10: 'alien_octopus_1'}
+        sprite_sizes = {
+            value: get_game_sprite(name, config.SPRITE_SCALE).get_size()
+            for value, name in sprite_names.items()
+        }
+        max_sprite_width = max(size[0] for size in sprite_sizes.values())
+        max_row_height = max(size[1] for size in sprite_sizes.values())
+
+        column_gap = config.ALIEN_SPACING_X
+        formation_width = cols * max_sprite_width + (cols - 1) * column_gap
+        start_x = max(
+            config.ALIEN_MARGIN_X,
+            (self.width - formation_width) / 2,
+        )
+        for row_idx, value in enumerate(values):
+            alien_width, alien_height = sprite_sizes[value]
+            offset_within_cell = (max_sprite_width - alien_width) / 2
+            for col_idx in range(cols):
+                cell_x = start_x + col_idx * (max_sprite_width + column_gap)
+                x = cell_x + offset_within_cell
+                row_base_y = margin_y + row_idx * spacing_y
+                y = row_base_y + (max_row_height - alien_height)
+                group.add(Alien(x, y, value, tint=self._alien_tint(value)))
+        return group
+
+    def create_bunkers(self) -> pygame.sprite.Group:
+        """Create bunkers above the player and return sprite group."""
+        group = pygame.sprite.Group()
+        spacing = self.width // (constants.BLOCK_NUMBER + 1)
+        player_top = self.player.rect.top if self.player else self.player_floor
+        bunker_bottom = max(0, player_top - config.BUNKER_PLAYER_GAP)
+        tint = self._tint("bunker")
+        for i in range(constants.BLOCK_NUMBER):
+            center_x = spacing * (i + 1)
+            group.add(Bunker(center_x, bunker_bottom, tint=tint))
+        self.bunkers = group.sprites()
+        return group
+
+    # 2-player snapshots ------------------------------------------------------
+
+    def snapshot_playfield(self) -> PlayfieldSnapshot:
+        """Capture the wave in progress for the player about to hand over."""
+        damage = tuple(bunker.erosion_state() if bunker.alive() else None for bunker in self.bunkers)
+        return PlayfieldSnapshot(
+            self.level,
+            self.alien_direction,
+            self.alien_speed,
+            self.initial_alien_count,
+            self.alien_group.snapshot(),
+            damage,
+        )
+
+    def restore_playfield(self, snapshot: Optional[PlayfieldSnapshot]) -> None:
+        """
+        Load a player's wave into the existing formation and bunkers.
+
+        ``None`` gives a fresh level-1 wave. Sprites are only rebuilt if the
+        current formation or bunker set has a different layout.
+        """
+        if snapshot is None:
+            self.level = 1
+            self.alien_direction = 1
+            formation = FormationSnapshot.fresh(self.alien_group.slot_count)
+            damage = (b"",) * len(self.bunkers)
+        else:
+            self.level = snapshot.level
+            self.alien_direction = snapshot.alien_direction
+            formation = snapshot.formation
+            damage = snapshot.bunker_damage
+        if formation.slots != self.alien_group.slot_count or formation.slots == 0:
+            self.alien_group = self.create_aliens()
+            if snapshot is None:
+                formation = FormationSnapshot.fresh(self.alien_group.slot_count)
+        if len(damage) != len(self.bunkers) or not damage:
+            self.bunker_group = self.create_bunkers()
+            if snapshot is None:
+                damage = (b"",) * len(self.bunkers)
+        self.alien_group.restore(formation)
+        # Themes follow the level, so refresh tints from the restored level
+        self.alien_group.retint(self._alien_tint)
+        bunker_tint = self._tint("bunker")
+        for bunker, impacts in zip(self.bunkers, damage):
+            if impacts is None:
+                self.bunker_group.remove(bunker)
+            else:
+                bunker.set_tint(bunker_tint)
+                bunker.restore_erosion(impacts)
+                self.bunker_group.add(bunker)
+        if snapshot is None:
+            self.reset_alien_progression()
+        else:
+            self.initial_alien_count = snapshot.initial_alien_count
+            self.alien_speed = snapshot.alien_speed
+
+    def position_player(self) -> None:
+        """Place the player ship at the bottom centre of the playfield."""
+        if self.player:
+            self.player.rect.midbottom = (self.width // 2, self.player_floor)
+
+    def respawn_player(self) -> None:
+        """Replace the player ship with a fresh one at the starting position."""
+        self.player = Player(tint=self._tint("player"))
+        self.player_group = pygame.sprite.GroupSingle(self.player)
+        self.position_player()
+
+    def lose_life(self) -> None:
+        """Clear the shots in flight, respawn the ship and slow the formation back down."""
+        self.clear_projectiles()
+        self.respawn_player()
+        self.reset_alien_progression()
+
+    def clear_projectiles(self) -> None:
+        """Remove every bullet and bomb in flight."""
+        self.bullet_group.empty()
+        self.bomb_group.empty()
+
+    def pool_stats(self) -> dict:
+        """Recycling counters for the projectile pools."""
+        return {"bullets": self.bullet_pool.stats(), "bombs": self.bomb_pool.stats()}
+
+    def reset_alien_progression(self, speed_bonus: float = 0.0) -> None:
+        """Reset alien speed progression to the slow starting pace."""
+        self.initial_alien_count = len(self.alien_group)
+        self.alien_speed = config.ALIEN_START_SPEED + speed_bonus
+
+    def update_alien_speed(self) -> None:
+        """Increase alien speed as their numbers decrease."""
+        remaining = len(self.alien_group)
+        if remaining and self.initial_alien_count:
+            progress = 1.0 - (remaining / self.initial_alien_count)
+            max_speed = config.ALIEN_MAX_SPEED
+            base = config.ALIEN_START_SPEED
+            self.alien_speed = base + progress * (max_speed - base)
+
+    def start_next_wave(self) -> None:
+        """Advance to the next wave when all aliens are cleared."""
+        self.level += 1
+        bonus_speed = min(0.05 * (self.level - 1), 0.6)
+        self.alien_group = self.create_aliens()
+        self.clear_projectiles()
+        self.ufo_group.empty()
+        self.reset_alien_progression(speed_bonus=bonus_speed)
+
+    # Actions ---------------------------------------------------------------
+
+    def fire(self) -> Optional[Bullet]:
+        """Fire a player bullet if the in-flight limit allows it."""
+        if not self.player or len(self.bullet_group) >= config.PLAYER_MAX_BULLETS:
+            return None
+        bullet = self.bullet_pool.acquire(self.player.get_bullet_spawn_position())
+        self.bullet_group.add(bullet)
+        self._emit(SimEventType.SHOT_FIRED, bullet.rect.midbottom)
+        return bullet
+
+    def spawn_bomb(self, chance_scale: float = 1.0) -> Optional[Bomb]:
+        """
+        Randomly drop a bomb from one of the remaining aliens.
+
+        The chance starts at ``ALIEN_BOMB_CHANCE`` and ramps up as aliens fall.
+        """
+        if not self.alien_group:
+            return None
+        bomb_chance = config.ALIEN_BOMB_CHANCE + (
+            max(0, self.initial_alien_count - len(self.alien_group)) * 0.0005
+        )
+        if self.rng.random() >= bomb_chance * chance_scale:
+            return None
+        alien = self.rng.choice(self.alien_group.sprites())
+        bomb = self.bomb_pool.acquire(alien.rect.midbottom, 'bomb_1', self._tint("bomb_1"))
+        self.bomb_group.add(bomb)
+        self._emit(SimEventType.BOMB_DROPPED, bomb.rect.topleft)
+        return bomb
+
+    def spawn_ufo(self) -> None:
+        """Launch the mystery ship once the UFO interval has elapsed."""
+        if self.time_ms - self.last_ufo_time > config.UFO_INTERVAL:
+            ufo = UFO(-60, 40, rng=self.rng)  # Start UFO slightly higher
+            self.ufo_group.add(ufo)
+            self.last_ufo_time = self.time_ms
+            self._emit(SimEventType.UFO_SPAWNED, ufo.rect.center, ufo.value)
+
+    def _drop_ufo_bombs(self, chance_scale: float) -> None:
+        """Allow active UFOs to drop their own bomb type while flying across."""
+        for ufo in self.ufo_group.sprites():
+            if self.rng.random() < config.UFO_BOMB_CHANCE * chance_scale:
+                bomb = self.bomb_pool.acquire(ufo.rect.midbottom, 'bomb_2', self._tint("bomb_2"))
+                self.bomb_group.add(bomb)
+                self._emit(SimEventType.BOMB_DROPPED, bomb.rect.topleft, 1)
+
+    # Simulation ------------------------------------------------------------
+
+    def _emit(self, event_type: SimEventType, pos=(0, 0), value: int = 0, reason: str = "") -> None:
+        self._events.append(SimEvent(event_type, tuple(pos), value, reason))
+
+    def step(self, inputs: FrameInput, dt_ms: float = config.SIM_FRAME_MS, armed: bool = True) -> List[SimEvent]:
+        """
+        Advance the world by ``dt_ms`` milliseconds.
+
+        Args:
+            inputs: Player controls for this step
+            dt_ms: Simulated time to advance; speeds are tuned per ``SIM_FRAME_MS``
+            armed: When False aliens and UFOs hold their fire (menus, tests)
+
+        Returns:
+            Events produced during the step, in the order they happened
+        """
+        self._events = []
+        section = self.profiler.section
+        scale = dt_ms / config.SIM_FRAME_MS
+        self.time_ms += dt_ms
+        self.frame += 1
+
+        with section("sim.movement"):
+            if self.player:
+                self.player.steer(inputs.left, inputs.right, scale)
+        if inputs.fire:
+            with section("sim.spawn"):
+                self.fire()
+
+        # Update non-projectile entities first
+        with section("sim.movement"):
+            self.ufo_group.update(scale)
+        if armed:
+            with section("sim.spawn"):
+                self._drop_ufo_bombs(scale)
+
+        with section("sim.movement"):
+            self._animation_elapsed += dt_ms
+            if self._animation_elapsed >= config.ALIEN_ANIMATION_INTERVAL_MS:
+                self._animation_elapsed %= config.ALIEN_ANIMATION_INTERVAL_MS
+                self.alien_group.animate()
+                if self.alien_group:
+                    self._emit(SimEventType.FORMATION_STEP)
+
+            if self.alien_group:
+                self._move_formation(scale)
+
+        with section("sim.spawn"):
+            if armed:
+                self.spawn_bomb(scale)
+            self.spawn_ufo()
+
+        # Everything that is hit rather than hitting stays put until the
+        # projectiles move, so one index per step answers every pair query.
+        with section("collide.index"):
+            self.collisions.set_layer("aliens", self.alien_group)
+            self.collisions.rebuild({
+                "ufos": self.ufo_group,
+                "bunkers": self.bunker_group,
+                "bombs": self.bomb_group,
+            })
+        with section("collide.invasion"):
+            victory = self._check_alien_collisions()
+        self._resolve_collisions()
+
+        if not victory:
+            with section("collide.invasion"):
+                self._check_alien_collisions()
+
+        if not self.alien_group:
+            self.start_next_wave()
+            self._emit(SimEventType.WAVE_CLEARED, value=self.level)
+
+        # Move projectiles after handling collisions to keep frame semantics
+        with section("sim.sprites"):
+            self.bullet_group.update(scale)
+            self.bomb_group.update(scale)
+        return self._events
+
+    def _move_formation(self, scale: float) -> None:
+        """Move the formation sideways, dropping and reversing at the edges."""
+        dropped = self.alien_group.advance(
+            self.alien_direction * self.alien_speed * scale,
+            config.ALIEN_EDGE_PADDING,
+            self.width - config.ALIEN_EDGE_PADDING,
+            config.ALIEN_DROP_DISTANCE,
+        )
+        if dropped:
+            self.alien_direction *= -1
+
+    def _resolve_collisions(self) -> None:
+        """Resolve projectile hits for this step."""
+        collisions = self.collisions
+        section = self.profiler.section
+        with section("collide.bullets_aliens"):
+            hits = collisions.groupcollide(self.bullet_group, "aliens", collided=collide_swept)
+            for bullet, aliens in hits.items():
+                # An earlier bullet this step may already have killed these invaders
+                aliens = [alien for alien in aliens if alien.alive()]
+                if not aliens:
+                    continue
+                # A fast shot can sweep past several invaders; only the first one it meets dies
+                alien = aliens[0] if len(aliens) == 1 else min(aliens, key=lambda a: sweep_contact(bullet, a))
+                bullet.kill()
+                alien.kill()
+                self._emit(SimEventType.ALIEN_KILLED, alien.rect.center, alien.value)
+            if hits:
+                self.update_alien_speed()
+
+        with section("collide.bullets_ufos"):
+            hits = collisions.groupcollide(self.bullet_group, "ufos", True, True, collide_swept)
+            for ufos in hits.values():
+                for ufo in ufos:
+                    self._emit(SimEventType.UFO_KILLED, ufo.rect.center, ufo.value)
+
+        with section("collide.bullets_bunkers"):
+            hits = collisions.groupcollide(self.bullet_group, "bunkers")
+            for bullet, bunker_list in hits.items():
+                self._erode_bunkers(bullet, bunker_list, SHOT_STAMP)
+
+        with section("collide.bullets_bombs"):
+            intercepts = collisions.groupcollide(self.bullet_group, "bombs", True, True, collide_swept)
+            for bombs in intercepts.values():
+                for bomb in bombs:
+                    self._emit(SimEventType.BOMB_INTERCEPTED, bomb.rect.center)
+
+        with section("collide.bombs_player"):
+            if self.player:
+                hit_bombs = collisions.spritecollide(self.player, "bombs", dokill=True, collided=collide_swept)
+                if hit_bombs:
+                    self._emit(SimEventType.PLAYER_HIT, self.player.rect.center, len(hit_bombs))
+
+        with section("collide.bombs_bunkers"):
+            hits = collisions.groupcollide(self.bomb_group, "bunkers")
+            for bomb, bunker_list in hits.items():
+                self._erode_bunkers(bomb, bunker_list, BOMB_STAMP)
+
+    def _erode_bunkers(self, projectile: pygame.sprite.Sprite, bunkers: List[Bunker], stamp: int) -> None:
+        """Carve the first solid bunker pixel along ``projectile``'s last move; gaps let it through."""
+        for rect in sweep_rects(projectile):
+            for bunker in bunkers:
+                point = bunker.hit_point(rect)
+                if point is None:
+                    continue
+                projectile.kill()
+                bunker.damage(point, stamp)
+                self._emit(SimEventType.BUNKER_HIT, point, int(stamp == BOMB_STAMP))
+                return
+
+    def _check_alien_collisions(self) -> bool:
+        """Handle aliens touching the player, the ground or bunkers. Returns True on invasion."""
+        formation = self.alien_group
+        bounds = formation.bounds()
+        if bounds is None:
+            return False
+
+        if self.player:
+            invaders = formation.query(self.player.rect)
+            if invaders:
+                self._emit(SimEventType.ALIEN_VICTORY, invaders[0].rect.center,
+                           reason="Game over: an alien reached the player")
+                return True
+
+        ground = self.height - 4
+        if bounds.bottom >= ground:
+            landed = formation.query(pygame.Rect(bounds.left, ground - 1, bounds.width, bounds.bottom))
+            self._emit(SimEventType.ALIEN_VICTORY, landed[0].rect.center,
+                       reason="Game over: aliens reached the ground")
+            return True
+
+        for bunker in self.bunker_group.sprites():
+            if formation.query(bunker.rect):
+                bunker.kill()
+                self._emit(SimEventType.BUNKER_DESTROYED, bunker.rect.topleft)
+        return False
@@ -0,0 +1,125 @@
+"""
+Fixed-timestep scheduling and render interpolation.
+
+``FixedTimestep`` turns the wall time between rendered frames into a whole
+number of simulation steps of ``SIM_TICK_MS``, so gameplay pace no longer
+depends on how fast frames are drawn: a 144 Hz monitor runs the same number
+of steps per second as a cabinet that renders at 40 FPS. The leftover time is
+exposed as ``alpha`` so ``SpriteInterpolator`` can draw moving sprites part
+way between their last two simulated positions.
+"""
+from typing import Dict, Iterable, List, Tuple
+
+import pygame
+
+from .. import config
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class FixedTimestep:
+    """Accumulator that hands out fixed simulation steps for elapsed wall time."""
+
+    def __init__(self, step_ms: float = config.SIM_TICK_MS,
+                 max_steps: int = config.SIM_MAX_STEPS_PER_FRAME):
+        """
+        Initialize an empty accumulator.
+
+        Args:
+            step_ms: Length of one simulation step
+            max_steps: Most steps run for a single rendered frame; time beyond
+                that is dropped so a slow machine slows down instead of
+                falling ever further behind
+        """
+        self.step_ms = step_ms
+        self.max_steps = max(1, max_steps)
+        self.accumulator = 0.0
+        self.skipped_frames = 0  # Steps run without a render of their own
+        self.dropped_ms = 0.0
+
+    def advance(self, elapsed_ms: float) -> int:
+        """
+        Add wall time and return how many steps to simulate before the next render.
+
+        Args:
+            elapsed_ms: Wall time since the previous rendered frame
+        """
+        self.accumulator += max(0.0, elapsed_ms)
+        steps = int(self.accumulator // self.step_ms)
+        if steps > self.max_steps:
+            dropped = self.accumulator - self.max_steps * self.step_ms
+            self.dropped_ms += dropped
+            logger.debug("Simulation %.1f ms behind; dropping it", dropped)
+            self.accumulator -= dropped
+            steps = self.max_steps
+        self.accumulator -= steps * self.step_ms
+        if steps > 1:
+            self.skipped_frames += steps - 1
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        """Fraction of a step accumulated since the last one (0 <= alpha < 1)."""
+        return min(1.0, self.accumulator / self.step_ms)
+
+    def reset(self) -> None:
+        """Forget pending time, e.g. while the simulation is paused."""
+        self.accumulator = 0.0
+
+
+class SpriteInterpolator:
+    """
+    Draws sprites between their previous and current simulated positions.
+
+    ``capture()`` records where sprites are before a step; ``apply(alpha)``
+    moves their rects part way back towards those positions for drawing and
+    ``restore()`` puts them back before the next step. Sprites that jumped
+    further than ``snap_distance`` (respawns) or were recycled by their pool
+    since the capture are drawn where they are.
+    """
+
+    def __init__(self, enabled: bool = config.RENDER_INTERPOLATION, snap_distance: int = 64):
+        self.enabled = enabled
+        self.snap_distance = snap_distance
+        # Position and pool generation of each sprite at the last capture
+        self._previous: Dict[pygame.sprite.Sprite, Tuple[Tuple[int, int], int]] = {}
+        self._applied: List[Tuple[pygame.sprite.Sprite, Tuple[int, int]]] = []
+
+    def capture(self, groups: Iterable[Iterable[pygame.sprite.Sprite]]) -> None:
+        """Remember the positions of every sprite in ``groups``."""
+        previous = self._previous
+        previous.clear()
+        if not self.enabled:
+            return
+        for group in groups:
+            for sprite in group:
+                previous[sprite] = (sprite.rect.topleft, getattr(sprite, "generation", 0))
+
+    def apply(self, alpha: float) -> None:
+        """Shift captured sprites to ``previous + (current - previous) * alpha``."""
+        if not self._previous:
+            return
+        back = 1.0 - alpha
+        snap = self.snap_distance
+        applied = self._applied
+        for sprite, ((px, py), generation) in self._previous.items():
+            if not sprite.alive() or getattr(sprite, "generation", 0) != generation:
+                continue
+            rect = sprite.rect
+            x, y = rect.topleft
+            dx, dy = px - x, py - y
+            if (dx or dy) and abs(dx) <= snap and abs(dy) <= snap:
+                applied.append((sprite, (x, y)))
+                rect.topleft = (x + round(dx * back), y + round(dy * back))
+
+    def restore(self) -> None:
+        """Return every shifted sprite to its simulated position."""
+        for sprite, position in self._applied:
+            sprite.rect.topleft = position
+        self._applied.clear()
+
+    def clear(self) -> None:
+        """Drop captured positions (new wave, player switch)."""
+        self.restore()
+        self._previous.clear()
@@ -1,8 +1,18 @@
 """Alien entity - represents enemy invaders in the game."""
+import logging
+
 import pygame
 
 from .. import config, constants
-from ..utils.logger import setup_logger
+
+logger = logging.getLogger(__name__)
+
+# Map point values to sprite names
+SPRITE_MAP = {
+    30: 'alien_squid_1',    # Top row - highest points
+    20: 'alien_crab_1',     # Middle row - medium points
+    10: 'alien_octopus_1'   # Bottom row - lowest points
+}
 
 
 class Alien(pygame.sprite.Sprite):
@@ -11,6 +21,10 @@ class Alien(pygame.sprite.Sprite):
 
     Aliens move in formation and can drop bombs. Different alien types
     have different point values and sprite animations.
+
+    While an alien belongs to an ``AlienFormation`` its position and animation
+    frame live in the formation's columns; ``rect`` is a view that is refreshed
+    on access, and changes made through it are folded back into the formation.
     """
 
     def __init__(self, x: int, y: int, value: int, tint=None):
@@ -23,41 +37,76 @@ class Alien(pygame.sprite.Sprite):
             value: Point value (30=squid, 20=crab, 10=octopus)
         """
         super().__init__()
-        self.logger = setup_logger(__name__)
         self.value = value
-        self.animation_frame = 0  # For sprite animation
-
-        # Map point values to sprite names
-        sprite_map = {
-            30: 'alien_squid_1',    # Top row - highest points
-            20: 'alien_crab_1',     # Middle row - medium points
-            10: 'alien_octopus_1'   # Bottom row - lowest points
-        }
+        self._formation = None
+        self._slot = -1
+        self._synced = None
+        self._frame_index = 0  # For sprite animation
 
         try:
-            # Load sprite from sprite sheet
-            from ..utils.sprite_sheet import get_game_sprite
-            sprite_name = sprite_map.get(value, 'alien_octopus_1')
-            self.image = get_game_sprite(sprite_name, config.SPRITE_SCALE, tint=tint)
-
-            # Store both animation frames for later use
-            frame1_name = sprite_name
-            frame2_name = sprite_name.replace('_1', '_2')
-            self.frame1 = get_game_sprite(frame1_name, config.SPRITE_SCALE, tint=tint)
-            self.frame2 = get_game_sprite(frame2_name, config.SPRITE_SCALE, tint=tint)
+            # Load both animation frames from the sprite sheet
+            self.set_tint(tint)
 
         except Exception as e:
             # Fallback to colored rectangles if sprite loading fails
             colors = {30: constants.GREEN, 20: constants.BLUE, 10: (255, 0, 255)}
-            self.image = pygame.Surface((24, 16))
-            self.image.fill(colors.get(value, constants.WHITE))
-            self.frame1 = self.frame2 = self.image
+            self.frame1 = pygame.Surface((24, 16))
+            self.frame1.fill(colors.get(value, constants.WHITE))
+            self.frame2 = self.frame1
+            self.mask1 = self.mask2 = pygame.mask.Mask(self.frame1.get_size(), fill=True)
+
+            logger.warning(f"Could not load alien sprite for value {value}: {e}. Using fallback.")
+
+        self._rect = self.frame1.get_rect(topleft=(x, y))
+
+    def set_tint(self, tint) -> None:
+        """Use the shared sprite-sheet frames for ``tint`` (None for untinted)."""
+        from ..utils.sprite_sheet import get_game_sprite, get_game_sprite_mask
+        sprite_name = SPRITE_MAP.get(self.value, 'alien_octopus_1')
+        frame2_name = sprite_name.replace('_1', '_2')
+        self.frame1 = get_game_sprite(sprite_name, config.SPRITE_SCALE, tint=tint)
+        self.frame2 = get_game_sprite(frame2_name, config.SPRITE_SCALE, tint=tint)
+        self.mask1 = get_game_sprite_mask(sprite_name, config.SPRITE_SCALE)
+        self.mask2 = get_game_sprite_mask(frame2_name, config.SPRITE_SCALE)
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """Screen rect, kept in sync with the owning formation."""
+        formation = self._formation
+        if formation is None:
+            return self._rect
+        return formation.lease_rect(self)
+
+    @rect.setter
+    def rect(self, value) -> None:
+        self._rect = pygame.Rect(value)
+        if self._formation is not None:
+            self._formation.adopt_rect(self)
+
+    @property
+    def animation_frame(self) -> int:
+        """Current animation frame (0 or 1)."""
+        formation = self._formation
+        if formation is None:
+            return self._frame_index
+        return formation.frame_of(self)
+
+    @animation_frame.setter
+    def animation_frame(self, frame: int) -> None:
+        self._frame_index = frame
+        if self._formation is not None:
+            self._formation.set_frame(self, frame)
 
-            self.logger.warning(f"Could not load alien sprite for value {value}: {e}. Using fallback.")
+    @property
+    def image(self) -> pygame.Surface:
+        """Surface for the current animation frame."""
+        return self.frame1 if self.animation_frame == 0 else self.frame2
 
-        self.rect = self.image.get_rect(topleft=(x, y))
+    @property
+    def mask(self) -> pygame.mask.Mask:
+        """Shared collision mask for the current animation frame."""
+        return self.mask1 if self.animation_frame == 0 else self.mask2
 
     def animate(self) -> None:
         """Switch between animation frames for classic alien movement."""
         self.animation_frame = 1 - self.animation_frame  # Toggle between 0 and 1
-        self.image = self.frame1 if self.animation_frame == 0 else self.frame2
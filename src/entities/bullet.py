@@ -1,13 +1,57 @@
 """Bullet and bomb entities - projectiles in the game."""
-from typing import Tuple
+from typing import Optional, Tuple
 
 import pygame
 
 from .. import config, constants
 from ..utils.logger import setup_logger
+from ..utils.sprite_sheet import get_game_sprite, get_game_sprite_mask, solid_mask
+from .pool import PooledSprite, SpritePool
 
+logger = setup_logger(__name__)
 
-class Bullet(pygame.sprite.Sprite):
+
+class Projectile(PooledSprite):
+    """
+    Pooled sprite that remembers its last move so collisions can be swept.
+
+    ``sweep_start`` is where the last ``move_by`` began; collision code tests
+    the whole segment from there to ``rect`` so fast projectiles cannot skip
+    over thin sprites. A sprite placed by hand since its last move has no
+    segment and is tested where it stands. Fractions of a pixel are carried
+    over to the next move, so the distance covered per second does not
+    depend on the simulation rate.
+    """
+
+    _moved_from: Optional[Tuple[int, int]] = None
+    _moved_to: Optional[Tuple[int, int]] = None
+    _y_remainder = 0.0
+
+    def move_by(self, dy: float) -> None:
+        """Move vertically by ``dy`` pixels, recording the segment travelled."""
+        self._moved_from = self.rect.topleft
+        travel = self._y_remainder + dy
+        whole = int(travel)
+        self._y_remainder = travel - whole
+        self.rect.y += whole
+        self._moved_to = self.rect.topleft
+
+    @property
+    def sweep_start(self) -> Tuple[int, int]:
+        """Top-left corner at the start of the last move."""
+        if self._moved_from is None or self.rect.topleft != self._moved_to:
+            return self.rect.topleft
+        return self._moved_from
+
+    @property
+    def swept_rect(self) -> pygame.Rect:
+        """Bounding box of everything the sprite covered during its last move."""
+        x, y = self.sweep_start
+        rect = self.rect
+        return rect.union(rect.move(x - rect.x, y - rect.y))
+
+
+class Bullet(Projectile):
     """
     Player bullet projectile.
 
@@ -23,27 +67,34 @@ class Bullet(pygame.sprite.Sprite):
             pos: Starting position (x, y) for the bullet
         """
         super().__init__()
-        self.logger = setup_logger(__name__)
+        self.logger = logger
+        self.reset(pos)
+        self.speed = config.BULLET_SPEED
+
+    def reset(self, pos: Tuple[int, int]) -> None:
+        """Place the bullet at ``pos`` ready to fly again."""
         try:
             # Load bullet sprite from sprite sheet
-            from ..utils.sprite_sheet import get_game_sprite
             self.image = get_game_sprite('bullet', config.SPRITE_SCALE)
+            self.mask = get_game_sprite_mask('bullet', config.SPRITE_SCALE)
         except Exception:
             # Fallback to simple rectangle
             self.image = pygame.Surface((2, 8))
             self.image.fill(constants.WHITE)
+            self.mask = solid_mask(self.image)
 
         self.rect = self.image.get_rect(midbottom=pos)
-        self.speed = config.BULLET_SPEED
+        self._moved_from = None
+        self._y_remainder = 0.0
 
-    def update(self) -> None:
+    def update(self, dt_scale: float = 1.0) -> None:
         """Update bullet position and remove if off-screen."""
-        self.rect.y += config.BULLET_SPEED
+        self.move_by(config.BULLET_SPEED * dt_scale)
         if self.rect.bottom < 0:
             self.kill()
 
 
-class Bomb(pygame.sprite.Sprite):
+class Bomb(Projectile):
     """
     Alien bomb projectile.
 
@@ -60,22 +111,49 @@ class Bomb(pygame.sprite.Sprite):
             sprite_name: Sprite identifier (aliens use `bomb_1`, UFOs use `bomb_2`)
         """
         super().__init__()
-        self.logger = setup_logger(__name__)
+        self.logger = logger
+        self.reset(pos, sprite_name, tint)
+        self.speed = config.BOMB_SPEED
+
+    def reset(self, pos: Tuple[int, int], sprite_name: str = 'bomb_1', tint=None) -> None:
+        """Place the bomb at ``pos`` with the given look, ready to fall again."""
         try:
             # Load bomb sprite from sprite sheet
-            from ..utils.sprite_sheet import get_game_sprite
             self.image = get_game_sprite(sprite_name, config.SPRITE_SCALE, tint=tint)
+            self.mask = get_game_sprite_mask(sprite_name, config.SPRITE_SCALE)
         except Exception:
             # Fallback to simple rectangle
             self.image = pygame.Surface((2, 8))
             self.image.fill(constants.RED)
+            self.mask = solid_mask(self.image)
         # Use center-based placement so callers can pass a logical position
         # (e.g., player's center or alien midbottom) and get a predictable rect.
         self.rect = self.image.get_rect(center=pos)
-        self.speed = config.BOMB_SPEED
+        self._moved_from = None
+        self._y_remainder = 0.0
 
-    def update(self) -> None:
+    def update(self, dt_scale: float = 1.0) -> None:
         """Update bomb position and remove if off-screen."""
-        self.rect.y += config.BOMB_SPEED
+        self.move_by(config.BOMB_SPEED * dt_scale)
         if self.rect.top > config.BASE_HEIGHT:
             self.kill()
+
+
+class BulletPool(SpritePool[Bullet]):
+    """Recycles player bullets."""
+
+    def __init__(self, max_free: int = 8):
+        super().__init__(Bullet, max_free)
+
+    def acquire(self, pos: Tuple[int, int]) -> Bullet:
+        return super().acquire(pos)
+
+
+class BombPool(SpritePool[Bomb]):
+    """Recycles alien and UFO bombs."""
+
+    def __init__(self, max_free: int = 64):
+        super().__init__(Bomb, max_free)
+
+    def acquire(self, pos: Tuple[int, int], sprite_name: str = 'bomb_1', tint=None) -> Bomb:
+        return super().acquire(pos, sprite_name, tint)
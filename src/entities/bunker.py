@@ -1,18 +1,87 @@
 """Bunker entity - destructible cover for the player."""
+import math
+from array import array
+from typing import Dict, Optional, Tuple
+
 import pygame
 
 from .. import config, constants
 from ..utils.logger import setup_logger
+from ..utils.sprite_sheet import get_game_sprite, get_game_sprite_mask, solid_mask
+
+logger = setup_logger(__name__)
+
+# Explosion shapes carved out of a bunker by each projectile kind, as in the arcade
+SHOT_STAMP = 0
+BOMB_STAMP = 1
+_STAMP_PATTERNS = {
+    SHOT_STAMP: (
+        "#...#..#",
+        "..#...#.",
+        ".######.",
+        "########",
+        "########",
+        ".######.",
+        "..#..#..",
+        "#..#...#",
+    ),
+    BOMB_STAMP: (
+        "..#...",
+        "#...#.",
+        "..##.#",
+        ".####.",
+        "#.###.",
+        ".####.",
+        "#.###.",
+        "..#.#.",
+    ),
+}
+# The sheet's bunker art is drawn at twice arcade resolution
+_STAMP_SCALE = 2
+_BACKGROUND = (0, 0, 0, 255)
+
+_stamps: Dict[Tuple[int, int], pygame.mask.Mask] = {}
+_probes: Dict[Tuple[int, int], pygame.mask.Mask] = {}
+
+
+def get_stamp(kind: int, scale: int = config.SPRITE_SCALE) -> pygame.mask.Mask:
+    """Return the shared erosion mask for a projectile kind at a sprite scale."""
+    key = (kind, scale)
+    stamp = _stamps.get(key)
+    if stamp is None:
+        rows = _STAMP_PATTERNS[kind]
+        pattern = pygame.mask.Mask((len(rows[0]), len(rows)))
+        for y, row in enumerate(rows):
+            for x, cell in enumerate(row):
+                if cell == "#":
+                    pattern.set_at((x, y))
+        factor = _STAMP_SCALE * scale
+        width, height = pattern.get_size()
+        stamp = _stamps[key] = pattern.scale((width * factor, height * factor))
+    return stamp
+
+
+def _probe(size: Tuple[int, int]) -> pygame.mask.Mask:
+    probe = _probes.get(size)
+    if probe is None:
+        probe = _probes[size] = pygame.mask.Mask(size, fill=True)
+    return probe
 
 
 class Bunker(pygame.sprite.Sprite):
     """
     Destructible bunker that provides cover for the player.
 
-    Bunkers can be damaged by both player bullets and alien bombs.
-    They provide strategic cover but deteriorate over time when hit.
+    Bunkers can be damaged by both player bullets and alien bombs. Each hit
+    carves an explosion-shaped stamp out of the bunker's collision mask and
+    paints the same pixels out of its private image, so shots pass through
+    holes that earlier hits opened. Only the stamp's rectangle is touched per
+    hit; ``dirty_rect`` reports it for partial screen updates. Every carve is
+    logged in ``impacts`` so the damage can be replayed onto fresh art.
     """
 
+    MAX_HEALTH = 4
+
     def __init__(self, x: int, y: int, tint=None):
         """
         Initialize a bunker.
@@ -22,39 +91,110 @@ class Bunker(pygame.sprite.Sprite):
             y: Y position on screen
         """
         super().__init__()
-        self.logger = setup_logger(__name__)
-        self.health = 4
-        self.images = []
+        self.logger = logger
+        self.tint = tint
+        self.base_image: Optional[pygame.Surface] = None
+        self.impacts = array('h')  # (stamp kind, x, y) per carve, bunker-local
+        self.dirty_rect: Optional[pygame.Rect] = None
 
         try:
             # Load bunker sprites from sprite sheet
-            from ..utils.sprite_sheet import get_game_sprite
-            bunker_sprites = ['bunker_full', 'bunker_damaged_1', 'bunker_damaged_2', 'bunker_damaged_3']
-            for sprite_name in bunker_sprites:
-                image = get_game_sprite(sprite_name, config.SPRITE_SCALE, tint=tint)
-                self.images.append(image)
-            self.image = self.images[0]
-            self.base_image = self.image.copy()
+            self.set_tint(tint)
+            self._pristine = get_game_sprite_mask('bunker_full', config.SPRITE_SCALE)
         except Exception as e:
             # Fallback to simple rectangle
-            self.image = pygame.Surface((32 * config.SPRITE_SCALE, 24 * config.SPRITE_SCALE))
-            self.image.fill(constants.GREEN)
+            self.base_image = pygame.Surface((32 * config.SPRITE_SCALE, 24 * config.SPRITE_SCALE))
+            self.base_image.fill(constants.GREEN)
+            self.image = self.base_image.copy()
+            self._pristine = solid_mask(self.base_image)
             self.logger.warning(f"Could not load bunker sprite: {e}. Using fallback.")
-            self.base_image = self.image.copy()
+        self.mask = self._pristine.copy()
+        self.initial_pixels = self.solid_pixels = self.mask.count()
         self.rect = self.image.get_rect(midbottom=(x, y))
 
-    def damage(self) -> None:
-        """Reduce bunker health when hit by bullets or bombs."""
-        self.health -= 1
-        if self.health <= 0:
+    @property
+    def health(self) -> int:
+        """Remaining solid pixels in quarters of the original (0 once fully eroded)."""
+        if self.initial_pixels <= 0:
+            return 0
+        return math.ceil(self.MAX_HEALTH * self.solid_pixels / self.initial_pixels)
+
+    def set_tint(self, tint) -> None:
+        """Reload the bunker art for ``tint``, keeping the erosion so far."""
+        if self.base_image is not None and tint == self.tint:
+            return
+        self.tint = tint
+        # Registry sprites are shared, so carve into a private copy
+        self.base_image = get_game_sprite('bunker_full', config.SPRITE_SCALE, tint=tint)
+        self.image = self.base_image.copy()
+        if self.impacts:
+            self.mask.to_surface(self.image, setcolor=None, unsetcolor=_BACKGROUND)
+
+    def hit_point(self, rect: pygame.Rect) -> Optional[Tuple[int, int]]:
+        """Screen point where ``rect`` first touches solid bunker pixels, or None."""
+        overlap = rect.clip(self.rect)
+        if not overlap.width or not overlap.height:
+            return None
+        local = self.mask.overlap(_probe(overlap.size), (overlap.x - self.rect.x, overlap.y - self.rect.y))
+        if local is None:
+            return None
+        return self.rect.x + local[0], self.rect.y + local[1]
+
+    def damage(self, point: Optional[Tuple[int, int]] = None, kind: int = BOMB_STAMP) -> int:
+        """
+        Carve an explosion out of the bunker.
+
+        Args:
+            point: Screen point the stamp is centred on (default: top centre)
+            kind: ``SHOT_STAMP`` or ``BOMB_STAMP``
+
+        Returns:
+            Number of solid pixels removed
+        """
+        if point is None:
+            point = self.rect.midtop
+        stamp = get_stamp(kind)
+        width, height = stamp.get_size()
+        offset = (point[0] - self.rect.x - width // 2, point[1] - self.rect.y - height // 2)
+        carved = self._carve(stamp, offset)
+        if carved:
+            self.impacts.extend((kind, *offset))
+            dirty = pygame.Rect(self.rect.x + offset[0], self.rect.y + offset[1], width, height).clip(self.rect)
+            self.dirty_rect = dirty if self.dirty_rect is None else self.dirty_rect.union(dirty)
+        if self.solid_pixels <= 0:
             self.kill()
-            self.logger.debug(f"Bunker destroyed at {self.rect.topleft}")
+            self.logger.debug("Bunker destroyed at %s", self.rect.topleft)
         else:
-            # Tint the bunker instead of wiping the sprite
-            damage_ratio = self.health / 4
-            tint_value = int(80 + 175 * damage_ratio)
-            tinted = self.base_image.copy()
-            tint_color = (tint_value, tint_value, tint_value, 255)
-            tinted.fill(tint_color, special_flags=pygame.BLEND_RGBA_MULT)
-            self.image = tinted
-            self.logger.debug(f"Bunker damaged, health: {self.health}")
+            self.logger.debug("Bunker eroded by %d px, %d left", carved, self.solid_pixels)
+        return carved
+
+    def _carve(self, stamp: pygame.mask.Mask, offset: Tuple[int, int]) -> int:
+        carved = self.mask.overlap_area(stamp, offset)
+        if carved:
+            self.mask.erase(stamp, offset)
+            stamp.to_surface(self.image, setcolor=_BACKGROUND, unsetcolor=None, dest=offset)
+            self.solid_pixels -= carved
+        return carved
+
+    def take_dirty_rect(self) -> Optional[pygame.Rect]:
+        """Return and clear the screen area changed by hits since the last call."""
+        dirty, self.dirty_rect = self.dirty_rect, None
+        return dirty
+
+    def erosion_state(self) -> bytes:
+        """The impact log, for snapshots."""
+        return self.impacts.tobytes()
+
+    def restore_erosion(self, state: bytes) -> None:
+        """Rebuild mask and image from pristine art plus an impact log."""
+        if state == self.impacts.tobytes():
+            return
+        self.image = self.base_image.copy()
+        self.mask = self._pristine.copy()
+        self.solid_pixels = self.initial_pixels
+        self.impacts = array('h')
+        self.impacts.frombytes(state)
+        for i in range(0, len(self.impacts), 3):
+            kind, x, y = self.impacts[i:i + 3]
+            self._carve(get_stamp(kind), (x, y))
+        self.dirty_rect = None
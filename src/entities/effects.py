@@ -5,13 +5,18 @@ import pygame
 
 from .. import config
 from ..utils.sprite_sheet import get_game_sprite
+from .pool import PooledSprite, SpritePool
 
 
-class ExplosionEffect(pygame.sprite.Sprite):
+class ExplosionEffect(PooledSprite):
     """Simple animated explosion using arcade sprites."""
 
     def __init__(self, pos, tint=None, duration_ms: int = 300):
         super().__init__()
+        self.reset(pos, tint, duration_ms)
+
+    def reset(self, pos, tint=None, duration_ms: int = 300) -> None:
+        """Restart the explosion at ``pos``."""
         self.frames = [
             get_game_sprite('explosion', config.SPRITE_SCALE, tint=tint),
             get_game_sprite('explosion_alt', config.SPRITE_SCALE, tint=tint),
@@ -29,3 +34,13 @@ class ExplosionEffect(pygame.sprite.Sprite):
             return
         index = min(len(self.frames) - 1, elapsed // max(1, self.frame_interval))
         self.image = self.frames[index]
+
+
+class ExplosionPool(SpritePool[ExplosionEffect]):
+    """Recycles explosion effects."""
+
+    def __init__(self, max_free: int = 16):
+        super().__init__(ExplosionEffect, max_free)
+
+    def acquire(self, pos, tint=None, duration_ms: int = 300) -> ExplosionEffect:
+        return super().acquire(pos, tint, duration_ms)
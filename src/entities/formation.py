@@ -0,0 +1,340 @@
+"""Array-backed alien formation."""
+from array import array
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+import pygame
+
+from .alien import Alien
+
+# Flips every animation frame byte between 0 and 1 in one C-level pass
+_TOGGLE_FRAME = bytes([1, 0]) + bytes(range(2, 256))
+
+
+@dataclass(frozen=True)
+class FormationSnapshot:
+    """
+    Where a formation is and which of its aliens are alive.
+
+    Slot layout is not stored: a snapshot restores into any formation built
+    by ``SimulationWorld.create_aliens`` with the same number of slots.
+    """
+
+    slots: int
+    origin: Tuple[int, int]
+    alive: int  # Bit per slot
+    frames: int  # Bit per slot, set while showing the second animation frame
+
+    @classmethod
+    def fresh(cls, slots: int) -> "FormationSnapshot":
+        """A full formation at its starting position."""
+        return cls(slots, (0, 0), (1 << slots) - 1, 0)
+
+
+class AlienFormation(pygame.sprite.Group):
+    """
+    Sprite group that stores the invader formation as parallel columns.
+
+    Each alien occupies a slot holding its offset from the formation origin,
+    size, point value, alive flag and animation frame. Moving the formation
+    only moves the origin, bounds are cached between kills, animation flips
+    the frame column in one pass and drawing blits live slots straight from
+    the columns, so the per-frame cost no longer walks every sprite.
+
+    ``Alien.rect`` stays usable: rects handed out are refreshed from the
+    columns and, if the caller moved them, folded back in before the next
+    bulk operation.
+    """
+
+    def __init__(self, *sprites):
+        self._ox = 0
+        self._oy = 0
+        self._x_remainder = 0.0  # Sub-pixel part of the origin, carried between moves
+        self._art = 0  # Bumped whenever alien frames are swapped
+        self._dx = array('i')
+        self._dy = array('i')
+        self._w = array('i')
+        self._h = array('i')
+        self._value = array('i')
+        self._alive = bytearray()
+        self._frame = bytearray()
+        self._slot_sprites: List[Optional[Alien]] = []
+        self._roster: List[Alien] = []  # Every alien ever added, by slot, dead or alive
+        self._slot_of: Dict[Alien, int] = {}
+        self._leased = set()
+        self._live: Optional[List[int]] = None
+        self._extent: Optional[Tuple[int, int, int, int]] = None
+        super().__init__(*sprites)
+
+    # Group bookkeeping -------------------------------------------------------
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        rect = sprite.rect
+        frame = sprite.animation_frame
+        slot = len(self._slot_sprites)
+        self._dx.append(rect.x - self._ox)
+        self._dy.append(rect.y - self._oy)
+        self._w.append(rect.width)
+        self._h.append(rect.height)
+        self._value.append(getattr(sprite, "value", 0))
+        self._alive.append(1)
+        self._frame.append(frame)
+        self._slot_sprites.append(sprite)
+        self._roster.append(sprite)
+        self._slot_of[sprite] = slot
+        sprite._rect = pygame.Rect(rect)
+        sprite._formation = self
+        sprite._slot = slot
+        sprite._synced = None
+        self._invalidate()
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        slot = self._slot_of.pop(sprite, None)
+        if slot is None:
+            return
+        if sprite._formation is self:
+            # Leave the sprite with its final position and frame
+            sprite._rect = self.lease_rect(sprite)
+            sprite._frame_index = self._frame[slot]
+            sprite._formation = None
+            sprite._slot = -1
+        self._alive[slot] = 0
+        self._slot_sprites[slot] = None
+        self._leased.discard(slot)
+        self._invalidate()
+
+    def empty(self):
+        super().empty()
+        self._ox = self._oy = 0
+        self._x_remainder = 0.0
+        for column in (self._dx, self._dy, self._w, self._h, self._value):
+            del column[:]
+        self._alive = bytearray()
+        self._frame = bytearray()
+        self._slot_sprites = []
+        self._roster = []
+        self._slot_of.clear()
+        self._leased.clear()
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        self._live = None
+        self._extent = None
+
+    # Alien views -------------------------------------------------------------
+
+    def lease_rect(self, alien: Alien) -> pygame.Rect:
+        """Return the alien's rect refreshed from the columns."""
+        slot = alien._slot
+        rect = alien._rect
+        if slot in self._leased and tuple(rect) != alien._synced:
+            self._adopt(alien, slot)
+            return rect
+        self._leased.add(slot)
+        rect.x = self._ox + self._dx[slot]
+        rect.y = self._oy + self._dy[slot]
+        alien._synced = tuple(rect)
+        return rect
+
+    def adopt_rect(self, alien: Alien) -> None:
+        """Take the alien's current rect as its new formation position."""
+        self._leased.add(alien._slot)
+        self._adopt(alien, alien._slot)
+
+    def _adopt(self, alien: Alien, slot: int) -> None:
+        rect = alien._rect
+        self._dx[slot] = rect.x - self._ox
+        self._dy[slot] = rect.y - self._oy
+        self._w[slot] = rect.width
+        self._h[slot] = rect.height
+        alien._synced = tuple(rect)
+        self._extent = None
+
+    def _reconcile(self) -> None:
+        """Fold back any rect a caller moved since it was handed out."""
+        if not self._leased:
+            return
+        sprites = self._slot_sprites
+        for slot in self._leased:
+            alien = sprites[slot]
+            if alien is not None and tuple(alien._rect) != alien._synced:
+                self._adopt(alien, slot)
+        self._leased.clear()
+
+    def frame_of(self, alien: Alien) -> int:
+        return self._frame[alien._slot]
+
+    def set_frame(self, alien: Alien, frame: int) -> None:
+        self._frame[alien._slot] = frame
+
+    # Snapshots ---------------------------------------------------------------
+
+    @property
+    def slot_count(self) -> int:
+        return len(self._roster)
+
+    def snapshot(self) -> FormationSnapshot:
+        """Capture origin, live slots and animation frames."""
+        self._reconcile()
+        alive = 0
+        for slot in self._live_slots():
+            alive |= 1 << slot
+        frames = 0
+        for slot, frame in enumerate(self._frame):
+            if frame:
+                frames |= 1 << slot
+        return FormationSnapshot(len(self._roster), (self._ox, self._oy), alive, frames)
+
+    def restore(self, snapshot: FormationSnapshot) -> None:
+        """
+        Put the formation back into a snapshotted state, reusing its aliens.
+
+        Aliens killed since are re-added to the group, so nothing is allocated.
+
+        Raises:
+            ValueError: If the snapshot was taken from a different layout
+        """
+        if snapshot.slots != len(self._roster):
+            raise ValueError(f"snapshot has {snapshot.slots} slots, formation has {len(self._roster)}")
+        self._reconcile()
+        self._ox, self._oy = snapshot.origin
+        self._x_remainder = 0.0
+        revived = False
+        for slot, alien in enumerate(self._roster):
+            if snapshot.alive >> slot & 1:
+                if self._slot_sprites[slot] is None:
+                    self._revive(slot, alien)
+                    revived = True
+            elif self._slot_sprites[slot] is not None:
+                self.remove(alien)
+            self._frame[slot] = snapshot.frames >> slot & 1
+        if revived:
+            # Keep iteration in slot order, as in a freshly built formation
+            self.spritedict = {alien: self.spritedict[alien] for alien in self._slot_sprites if alien is not None}
+        self._invalidate()
+
+    def _revive(self, slot: int, alien: Alien) -> None:
+        super().add_internal(alien)
+        alien.add_internal(self)
+        self._alive[slot] = 1
+        self._slot_sprites[slot] = alien
+        self._slot_of[alien] = slot
+        alien._formation = self
+        alien._slot = slot
+        alien._synced = None
+
+    def retint(self, tint_for_value: Callable[[int], Optional[Tuple[int, int, int]]]) -> None:
+        """Swap every alien's frames, dead or alive, for the given tint."""
+        for alien in self._roster:
+            alien.set_tint(tint_for_value(alien.value))
+        self._art += 1
+
+    # Bulk operations ---------------------------------------------------------
+
+    def _live_slots(self) -> List[int]:
+        if self._live is None:
+            self._live = [slot for slot, alive in enumerate(self._alive) if alive]
+        return self._live
+
+    def bounds(self) -> Optional[pygame.Rect]:
+        """Bounding rect of every live alien, or None when the formation is empty."""
+        self._reconcile()
+        if self._extent is None:
+            live = self._live_slots()
+            if not live:
+                return None
+            dx, dy, w, h = self._dx, self._dy, self._w, self._h
+            left = min(dx[slot] for slot in live)
+            top = min(dy[slot] for slot in live)
+            right = max(dx[slot] + w[slot] for slot in live)
+            bottom = max(dy[slot] + h[slot] for slot in live)
+            self._extent = (left, top, right, bottom)
+        left, top, right, bottom = self._extent
+        return pygame.Rect(self._ox + left, self._oy + top, right - left, bottom - top)
+
+    def draw_state(self) -> Tuple[Hashable, Optional[pygame.Rect]]:
+        """
+        Describe what ``draw`` would paint, for dirty-rect tracking.
+
+        The signature is built from the columns without leasing any
+        ``Alien.rect``, so comparing frames costs a few byte copies however
+        large the formation is.
+
+        Returns:
+            A comparable signature that changes whenever the drawing does, and
+            the formation's bounds (None when empty)
+        """
+        bounds = self.bounds()
+        signature = (self._ox, self._oy, self._art, bytes(self._alive), bytes(self._frame),
+                     self._dx.tobytes(), self._dy.tobytes())
+        return signature, bounds
+
+    def advance(self, move_x: float, min_x: float, max_x: float, drop: int) -> bool:
+        """
+        Move the formation sideways, or drop it when the move would cross a limit.
+
+        Args:
+            move_x: Horizontal move for this step (sign gives direction)
+            min_x: Left limit the formation may not reach
+            max_x: Right limit the formation may not reach
+            drop: Pixels to descend when an edge is hit
+
+        Returns:
+            True if the formation dropped (the caller should reverse direction)
+        """
+        bounds = self.bounds()
+        if bounds is None:
+            return False
+        if bounds.right + move_x >= max_x or bounds.left + move_x <= min_x:
+            self._oy += drop
+            self._x_remainder = 0.0
+            return True
+        # Rects hold whole pixels; keep the fraction so slow marches still add up
+        travel = self._x_remainder + move_x
+        whole = int(travel)
+        self._x_remainder = travel - whole
+        self._ox += whole
+        return False
+
+    def animate(self) -> None:
+        """Flip every alien to its other animation frame."""
+        self._frame = self._frame.translate(_TOGGLE_FRAME)
+
+    def query(self, rect: pygame.Rect) -> List[Alien]:
+        """Return live aliens overlapping ``rect`` in slot order."""
+        bounds = self.bounds()
+        if bounds is None or not bounds.colliderect(rect):
+            return []
+        x0 = rect.left - self._ox
+        x1 = rect.right - self._ox
+        y0 = rect.top - self._oy
+        y1 = rect.bottom - self._oy
+        dx, dy, w, h = self._dx, self._dy, self._w, self._h
+        sprites = self._slot_sprites
+        return [
+            sprites[slot]
+            for slot in self._live_slots()
+            if dx[slot] < x1 and dx[slot] + w[slot] > x0 and dy[slot] < y1 and dy[slot] + h[slot] > y0
+        ]
+
+    def draw(self, surface, bgsurf=None, special_flags=0):
+        """Blit every live alien straight from the columns."""
+        self._reconcile()
+        ox, oy = self._ox, self._oy
+        dx, dy, frames = self._dx, self._dy, self._frame
+        sprites = self._slot_sprites
+        surface.blits(
+            [
+                (
+                    sprites[slot].frame2 if frames[slot] else sprites[slot].frame1,
+                    (ox + dx[slot], oy + dy[slot]),
+                    None,
+                    special_flags,
+                )
+                for slot in self._live_slots()
+            ],
+            doreturn=False,
+        )
+        return []
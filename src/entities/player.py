@@ -8,6 +8,8 @@ import pygame
 from .. import config, constants
 from ..utils.logger import setup_logger
 
+logger = setup_logger(__name__)
+
 
 class Player(pygame.sprite.Sprite):
     """
@@ -17,10 +19,12 @@ class Player(pygame.sprite.Sprite):
     It has collision detection and proper boundary checking.
     """
 
+    _x_remainder = 0.0
+
     def __init__(self, tint=None):
         """Initialize the player spaceship."""
         super().__init__()
-        self.logger = setup_logger(__name__)
+        self.logger = logger
         self._tint = tint
 
         try:
@@ -35,8 +39,9 @@ class Player(pygame.sprite.Sprite):
     def _create_sprite(self) -> None:
         """Create the player sprite graphics using the sprite sheet."""
         try:
-            from ..utils.sprite_sheet import get_game_sprite
+            from ..utils.sprite_sheet import get_game_sprite, get_game_sprite_mask
             self.image = get_game_sprite('player', config.SPRITE_SCALE, tint=self._tint)
+            self.mask = get_game_sprite_mask('player', config.SPRITE_SCALE)
             self.logger.debug("Loaded player sprite from sprite sheet")
         except Exception as e:
             self.logger.warning(f"Failed to load player sprite from sheet: {e}. Using fallback.")
@@ -55,6 +60,7 @@ class Player(pygame.sprite.Sprite):
                 (16, 8),   # Right wing
             ]
             pygame.draw.polygon(self.image, constants.WHITE, points)
+            self.mask = pygame.mask.from_surface(self.image)
 
     def _initialize_position(self) -> None:
         """Set the initial position of the player."""
@@ -70,16 +76,33 @@ class Player(pygame.sprite.Sprite):
             pressed: Pygame key state object
         """
         try:
-            if pressed[pygame.K_LEFT]:
-                self.rect.x -= self.speed
-            if pressed[pygame.K_RIGHT]:
-                self.rect.x += self.speed
-
-            # Keep player within screen bounds
-            self.rect.clamp_ip(pygame.Rect(0, 0, config.BASE_WIDTH, config.BASE_HEIGHT))
+            self.steer(pressed[pygame.K_LEFT], pressed[pygame.K_RIGHT])
         except Exception as e:
             self.logger.error(f"Error updating player: {e}")
 
+    def steer(self, left: bool, right: bool, dt_scale: float = 1.0) -> None:
+        """
+        Move the ship horizontally and keep it on screen.
+
+        Args:
+            left: Whether the move-left control is held
+            right: Whether the move-right control is held
+            dt_scale: Step length relative to one nominal frame
+        """
+        step = self.speed * dt_scale
+        travel = self._x_remainder
+        if left:
+            travel -= step
+        if right:
+            travel += step
+        # Carry the fraction of a pixel over so pace does not depend on the tick rate
+        whole = int(travel)
+        self._x_remainder = travel - whole
+        self.rect.x += whole
+
+        # Keep player within screen bounds
+        self.rect.clamp_ip(pygame.Rect(0, 0, config.BASE_WIDTH, config.BASE_HEIGHT))
+
     def get_bullet_spawn_position(self) -> tuple:
         """Get the position where bullets should spawn."""
         return self.rect.midtop
@@ -0,0 +1,99 @@
+"""Recycling pools for short-lived sprites."""
+from __future__ import annotations
+
+from abc import ABCMeta, abstractmethod
+from typing import Dict, Generic, List, Optional, Type, TypeVar
+
+import pygame
+
+
+class PooledSprite(pygame.sprite.Sprite, metaclass=ABCMeta):
+    """
+    Sprite that returns itself to its pool once it has left every group.
+
+    Killing the sprite, removing it from its last group or emptying that group
+    all release it, so pooled sprites need no special handling by the groups
+    and collision code that remove them. Sprites built directly (outside a
+    pool) behave exactly like plain sprites. ``generation`` counts how often
+    the sprite has been recycled, so code holding on to it across frames can
+    tell a new life from the old one.
+    """
+
+    _pool: Optional["SpritePool"] = None
+    generation = 0
+
+    @abstractmethod
+    def reset(self, *args, **kwargs) -> None:
+        """Reinitialize a recycled sprite; takes the constructor's arguments."""
+
+    def kill(self) -> None:
+        super().kill()
+        self.release()
+
+    def remove_internal(self, group) -> None:
+        super().remove_internal(group)
+        if not self.alive():
+            self.release()
+
+    def release(self) -> None:
+        """Hand the sprite back to its pool (no-op when unpooled or still grouped)."""
+        if self._pool is not None and not self.alive():
+            self._pool.release(self)
+
+
+T = TypeVar("T", bound=PooledSprite)
+
+
+class SpritePool(Generic[T]):
+    """Free list of recyclable sprites of one class."""
+
+    def __init__(self, sprite_cls: Type[T], max_free: int = 64):
+        """
+        Initialize an empty pool.
+
+        Args:
+            sprite_cls: PooledSprite subclass to build and recycle
+            max_free: Most idle sprites kept around; extras are dropped
+        """
+        self.sprite_cls = sprite_cls
+        self.max_free = max_free
+        self._free: List[T] = []
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    def acquire(self, *args, **kwargs) -> T:
+        """Return a ready sprite built from (or reset with) the given arguments."""
+        if self._free:
+            sprite = self._free.pop()
+            sprite.reset(*args, **kwargs)
+            sprite.generation += 1
+            self.reused += 1
+        else:
+            sprite = self.sprite_cls(*args, **kwargs)
+            self.created += 1
+        sprite._pooled = False
+        sprite._pool = self
+        return sprite
+
+    def release(self, sprite: T) -> None:
+        """Take back a sprite that left play; repeated releases are ignored."""
+        if getattr(sprite, "_pooled", True) or sprite.alive():
+            return
+        sprite._pooled = True
+        self.released += 1
+        if len(self._free) < self.max_free:
+            self._free.append(sprite)
+
+    def stats(self) -> Dict[str, int]:
+        """Pool counters for diagnostics."""
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "released": self.released,
+            "free": len(self._free),
+            "in_use": self.created + self.reused - self.released,
+        }
@@ -1,11 +1,14 @@
 """UFO entity - bonus mystery ship that appears periodically."""
 import random
+from typing import Optional
 
 import pygame
 
 from .. import config, constants
 from ..utils.logger import setup_logger
 
+logger = setup_logger(__name__)
+
 
 class UFO(pygame.sprite.Sprite):
     """
@@ -15,20 +18,24 @@ class UFO(pygame.sprite.Sprite):
     and awards random bonus points when destroyed.
     """
 
-    def __init__(self, x: int, y: int):
+    _x_remainder = 0.0
+
+    def __init__(self, x: int, y: int, rng: Optional[random.Random] = None):
         """
         Initialize a UFO.
 
         Args:
             x: Starting X position
             y: Starting Y position
+            rng: Random source for the bonus value (defaults to the ``random`` module)
         """
         super().__init__()
-        self.logger = setup_logger(__name__)
+        self.logger = logger
         try:
             # Load UFO sprite from sprite sheet
-            from ..utils.sprite_sheet import get_game_sprite
+            from ..utils.sprite_sheet import get_game_sprite, get_game_sprite_mask
             self.image = get_game_sprite('ufo', config.SPRITE_SCALE)
+            self.mask = get_game_sprite_mask('ufo', config.SPRITE_SCALE)
         except Exception:
             # Fallback to drawn UFO
             self.image = pygame.Surface((32, 16))
@@ -36,14 +43,18 @@ class UFO(pygame.sprite.Sprite):
             # Draw UFO as an ellipse
             pygame.draw.ellipse(self.image, constants.RED, (0, 0, 32, 16))
             pygame.draw.ellipse(self.image, constants.WHITE, (8, 4, 16, 8))
+            self.mask = pygame.mask.Mask(self.image.get_size(), fill=True)
 
         self.rect = self.image.get_rect(topleft=(x, y))
         self.speed = 2
-        self.value = random.choice([50, 100, 150, 300])
+        self.value = (rng or random).choice([50, 100, 150, 300])
 
-    def update(self) -> None:
+    def update(self, dt_scale: float = 1.0) -> None:
         """Update UFO position and remove when off-screen."""
-        self.rect.x += self.speed
+        travel = self._x_remainder + self.speed * dt_scale
+        whole = int(travel)
+        self._x_remainder = travel - whole
+        self.rect.x += whole
         # Remove UFO when it goes off screen
         if self.rect.right < 0 or self.rect.left > config.BASE_WIDTH:
             self.kill()
@@ -14,54 +14,45 @@ import logging
 import os
 import random
 import sys
-from typing import Optional, Tuple
+import time
+from logging import DEBUG
+from typing import Dict, List, Optional, Tuple
 
 import pygame
 
 from . import config, constants
-from .entities.alien import Alien
-from .entities.bullet import Bomb, Bullet
-from .entities.bunker import Bunker
-from .entities.effects import ExplosionEffect
-from .entities.player import Player
-from .entities.ufo import UFO
+from .core.dirty_rects import DirtyRectTracker
+from .core.presenter import PlayfieldPresenter
+from .core.profiler import FrameProfiler
+from .core.replay import Replay, ReplayRecorder
+from .core.simulation import FrameInput, SimEvent, SimEventType, SimulationWorld
+from .core.timestep import FixedTimestep, SpriteInterpolator
+from .entities.effects import ExplosionPool
+from .entities.formation import AlienFormation
 from .systems.game_state_manager import GameState, GameStateManager
 from .ui.color_scheme import get_color, get_tint
 from .ui.continue_screen import ContinueScreen
 from .ui.font_manager import get_font
+from .ui.hud import HudLayer
 from .ui.initials_entry import InitialsEntry
 from .ui.level_themes import LevelTheme, get_level_theme
 from .ui.menu import Menu
 from .ui.sprite_digits import FontDigitWriter
 from .ui.start_screen_demo import ScoreTableDemo, WaveFormationDemo
-from .utils.audio_manager import AudioManager
+from .utils.audio_manager import AudioManager, configure_mixer
 from .utils.high_score_manager import HighScoreManager
+from .utils.logger import LogRateLimiter, configure_logging
 from .utils.settings_manager import SettingsManager
-from .utils.sprite_sheet import clear_tint_cache, get_game_sprite
+from .utils.sprite_sheet import clear_tint_cache, get_game_sprite, get_sprite_registry
 from .utils.sprite_viewer import SpriteViewer
 
 # Check if DEBUG mode is enabled
 DEBUG_MODE = os.environ.get("SPACEINVADERS_DEBUG", "").lower() in ("1", "true", "yes")
 
-# Configure logging with both file and console output
+# Log to game.log and the console (always at least WARNING) from a background
+# thread; the game loop only enqueues records
 log_level = logging.DEBUG if DEBUG_MODE else logging.INFO
-log_format = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-
-# File handler
-file_handler = logging.FileHandler("game.log", mode="w")
-file_handler.setLevel(log_level)
-file_handler.setFormatter(logging.Formatter(log_format))
-
-# Console handler (always show at least WARNING level)
-console_handler = logging.StreamHandler(sys.stdout)
-console_handler.setLevel(logging.WARNING if not DEBUG_MODE else logging.DEBUG)
-console_handler.setFormatter(logging.Formatter(log_format))
-
-# Root logger configuration
-root_logger = logging.getLogger()
-root_logger.setLevel(log_level)
-root_logger.addHandler(file_handler)
-root_logger.addHandler(console_handler)
+configure_logging(log_level, console_level=logging.DEBUG if DEBUG_MODE else logging.WARNING)
 
 # Get logger for this module
 logging = logging.getLogger(__name__)
@@ -81,31 +72,94 @@ def _install_global_exception_logger() -> None:
 _install_global_exception_logger()
 
 
+class _WorldAttribute:
+    """Expose a ``SimulationWorld`` attribute as if it lived on ``Game``."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return getattr(instance.world, self.name)
+
+    def __set__(self, instance, value):
+        setattr(instance.world, self.name, value)
+
+
 class Game:
     """Main game controller."""
 
+    # Playfield state is owned by the simulation world; Game renders it and
+    # keeps these names for the menus, 2-player bookkeeping and tests.
+    player = _WorldAttribute()
+    player_group = _WorldAttribute()
+    alien_group = _WorldAttribute()
+    bunker_group = _WorldAttribute()
+    bullet_group = _WorldAttribute()
+    bomb_group = _WorldAttribute()
+    ufo_group = _WorldAttribute()
+    level = _WorldAttribute()
+    alien_direction = _WorldAttribute()
+    alien_speed = _WorldAttribute()
+    initial_alien_count = _WorldAttribute()
+
     def __init__(self):
+        # Wall time of each startup phase in ms, reported once construction ends
+        self.startup_timings: Dict[str, float] = {}
+        startup_began = phase_began = time.perf_counter()
+        configure_mixer()
         pygame.init()
         initial_size = config.get_window_size(config.DEFAULT_WINDOW_SCALE)
-        self.screen = pygame.display.set_mode(initial_size, pygame.RESIZABLE)
+        self.screen = self._set_display_mode(initial_size)
         pygame.display.set_caption("Space Invaders")
+        phase_began = self._mark_startup("display", phase_began)
         self.logical_width = config.BASE_WIDTH
         self.logical_height = config.BASE_HEIGHT
         self.playfield_surface = pygame.Surface((self.logical_width, self.logical_height))
+        self.dirty_tracker = DirtyRectTracker((self.logical_width, self.logical_height))
+        self._overlay_drawn = False
+        self.scoreboard_height = 0
+        self.hud = HudLayer()
         self.window_width, self.window_height = self.screen.get_size()
         self.clock = pygame.time.Clock()
+        # Gameplay runs in fixed SIM_TICK_MS steps however fast frames are drawn
+        self.timestep = FixedTimestep()
+        self.interpolator = SpriteInterpolator()
+        self._frame_ms = 0.0  # Wall time the previous frame took
         self.font = get_font("hud_main")
         self.small_font = get_font("hud_small")
         self.running = True
         self.game_over = False
         self.waiting_for_respawn = False
-        self.level = 1
-        self.current_theme: LevelTheme = get_level_theme(self.level)
         self.wave_message_text = ""
         self.wave_message_timer = 0
         self.floating_texts = []
         self.settings_manager = SettingsManager()
         self.tint_enabled = self.settings_manager.tint_enabled()
+        # Build the per-spawn sprites once, in display format, before anything is created
+        get_sprite_registry().preload(scale=config.SPRITE_SCALE)
+        phase_began = self._mark_startup("sprites", phase_began)
+        self.presenter = PlayfieldPresenter(
+            (self.logical_width, self.logical_height),
+            quality=self.settings_manager.scale_quality(),
+        )
+        self.world = SimulationWorld(
+            self.logical_width,
+            self.logical_height,
+            tint_provider=self._sprite_tint,
+            alien_tint_provider=self._alien_tint,
+        )
+        self.profiler = FrameProfiler(enabled=config.PROFILER_ENABLED)
+        self.world.profiler = self.profiler
+        self.show_profiler = False
+        self._profiler_lines: List[pygame.Surface] = []
+        # Every game is seeded and its per-step inputs recorded (1-player only)
+        self.recorder: Optional[ReplayRecorder] = None
+        self.last_replay: Optional[Replay] = None
+        self._fire_requested = False
+        # Per-kill/per-bomb messages are capped so busy frames don't flood the log
+        self.log_limiter = LogRateLimiter(logging, config.LOG_RATE_LIMIT, config.LOG_RATE_WINDOW_FRAMES)
         self.sfx_enabled = self.settings_manager.audio_enabled()
         self.music_enabled = self.settings_manager.music_enabled()
         self.level_start_delay_ms = 1500
@@ -119,14 +173,16 @@ class Game:
         self.fast_invader_step = 0
         self._last_music_should_play = None
         self._build_ui_assets()
+        phase_began = self._mark_startup("ui", phase_began)
 
         # State management
         self.state_manager = GameStateManager()
 
-        # Audio and scoring systems
+        # Audio and scoring systems; sounds decode in the background once enabled
         self.audio_manager = AudioManager()
         self.audio_manager.set_sfx_enabled(self.sfx_enabled)
         self.audio_manager.set_music_enabled(self.music_enabled)
+        phase_began = self._mark_startup("audio", phase_began)
         self.high_score_manager = HighScoreManager()
 
         # Single/2-player mode tracking
@@ -136,8 +192,8 @@ class Game:
         # Player 1 scores and lives
         self.score = 0
         self.lives = constants.LIVES_NUMBER
-        self.extra_lives_threshold = 20000  # Extra life at 20k, then every 70k
-        self.extra_lives_interval = 70000
+        self.extra_lives_threshold = config.EXTRA_LIFE_SCORE
+        self.extra_lives_interval = config.EXTRA_LIFE_INTERVAL
         self.lives_awarded = 0  # Track how many extra lives have been awarded
 
         # Player 2 scores and lives (2-player mode only)
@@ -148,38 +204,14 @@ class Game:
         # Player-specific game state (for persisting game state when switching players)
         # Each player maintains independent state: first switch starts fresh, subsequent switches restore
         self.player_states = {
-            1: {
-                'level': 1,
-                'alien_direction': 1,
-                'alien_speed': config.ALIEN_START_SPEED,
-                'initial_alien_count': 0,
-                'aliens': None,
-                'bunkers': None,
-                'has_been_saved': False,  # Track if this player has ever been played
-            },
-            2: {
-                'level': 1,
-                'alien_direction': 1,
-                'alien_speed': config.ALIEN_START_SPEED,
-                'initial_alien_count': 0,
-                'aliens': None,
-                'bunkers': None,
-                'has_been_saved': False,  # Track if this player has ever been played
-            }
+            1: {'snapshot': None, 'has_been_saved': False},
+            2: {'snapshot': None, 'has_been_saved': False},
         }
 
-        self.player = Player(tint=self._sprite_tint("player"))
-        self.player_group = pygame.sprite.GroupSingle(self.player)
-        self._position_player()
-        self.bullet_group = pygame.sprite.Group()
-        self.bomb_group = pygame.sprite.Group()
         self.effects_group = pygame.sprite.Group()
-        self.bunker_group = self.create_bunkers()
-        self.ufo_group = pygame.sprite.Group()
-
-        self.alien_group = self.create_aliens()
-        self.alien_direction = 1
-        self._reset_alien_progression()
+        self.effects_pool = ExplosionPool()
+        self.world.player_floor = self._player_floor()
+        self.world.reset()
 
         # Sprite viewer for testing
         self.sprite_viewer = SpriteViewer(self.screen)
@@ -200,9 +232,6 @@ class Game:
         self.active_demo = None
         self.initials_entry_screen: Optional[InitialsEntry] = None
         self.continue_screen: Optional[ContinueScreen] = None
-        self.alien_speed = config.ALIEN_START_SPEED
-        self.initial_alien_count = len(self.alien_group)
-        self.last_ufo_time = pygame.time.get_ticks()
         # Attract mode/demo settings
         self.attract_last_activity_time = pygame.time.get_ticks()
         self.attract_idle_time = config.ATTRACT_IDLE_TIME
@@ -216,14 +245,38 @@ class Game:
             self.start_intro_demo()
         else:
             self.state_manager.change_state(GameState.MENU)
+        self._mark_startup("world", phase_began)
+        self.startup_timings["total"] = (time.perf_counter() - startup_began) * 1000.0
+        logging.info("Startup report: %s", self.format_startup_report())
         audio_status = "ON" if self.sfx_enabled else "muted (press 'A' to toggle)"
         logging.info("Game started. Player lives=%d. Audio %s", self.lives, audio_status)
 
+    def _mark_startup(self, phase: str, began: float) -> float:
+        """Record the time since ``began`` under ``phase`` and return now."""
+        now = time.perf_counter()
+        self.startup_timings[phase] = (now - began) * 1000.0
+        return now
+
+    def format_startup_report(self) -> str:
+        """Summarize startup phase timings and the state of sound loading."""
+        parts = [f"{phase} {ms:.1f} ms" for phase, ms in self.startup_timings.items()]
+        audio = self.audio_manager.load_report()
+        if audio["load_ms"] is not None:
+            parts.append(f"sounds {audio['state']} ({audio['sounds']} in {audio['load_ms']:.1f} ms)")
+        else:
+            parts.append(f"sounds {audio['state']}")
+        return ", ".join(parts)
+
     @property
     def state(self):
         """Backwards-compatible string state for existing tests/utilities."""
         return self.state_manager.current_state.name
 
+    @property
+    def current_theme(self) -> LevelTheme:
+        """Color theme for the level currently being played."""
+        return get_level_theme(self.level)
+
     def reset_game(self, start_playing: bool = True):
         """Reset the game to initial state."""
         self.game_over = False
@@ -231,7 +284,6 @@ class Game:
         self.score = 0
         self.lives = constants.LIVES_NUMBER
         self.lives_awarded = 0
-        self.level = 1
         self.wave_message_text = "Ready!"
         self.wave_message_timer = pygame.time.get_ticks() + 2000
         self.level_start_ready_time = pygame.time.get_ticks() + self.level_start_delay_ms
@@ -239,28 +291,41 @@ class Game:
         self._game_over_processed = False
         self._game_over_return_time = None
 
-        # Clear all sprite groups
-        self.bullet_group.empty()
-        self.bomb_group.empty()
-        self.ufo_group.empty()
         self.effects_group.empty()
         self.audio_manager.stop_ufo_loop()
 
-        # Reset player
-        self._respawn_player()
-
-        # Recreate aliens and bunkers
-        self.alien_group = self.create_aliens()
-        self.bunker_group = self.create_bunkers()
-
-        # Reset alien movement
-        self.alien_direction = 1
-        self._reset_alien_progression()
-        self.last_ufo_time = pygame.time.get_ticks()
+        # Fresh player, formation and bunkers at level 1
+        self._start_recording()
+        self.world.reset(level=1)
         self.fast_invader_step = 0
 
         logging.info("Game reset complete")
 
+    def _start_recording(self) -> None:
+        """Seed the world for a new game and start recording its inputs."""
+        self._finish_recording()
+        seed = config.RANDOM_SEED if config.RANDOM_SEED is not None else random.getrandbits(64)
+        self.world.reseed(seed)
+        self._fire_requested = False
+        # Player switches swap whole formations in and out, which a replay cannot express
+        self.recorder = None if self.two_player_mode else ReplayRecorder(seed)
+
+    def _finish_recording(self) -> None:
+        """Stop recording; keep the replay and write it out when REPLAY_DIR is set."""
+        recorder, self.recorder = self.recorder, None
+        if recorder is None or not recorder.steps:
+            return
+        self.last_replay = recorder.replay
+        if not config.REPLAY_DIR:
+            return
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{recorder.replay.seed:016x}.sirp"
+        path = os.path.join(config.REPLAY_DIR, name)
+        try:
+            recorder.replay.save(path)
+            logging.info("Replay of %d steps saved to %s", recorder.steps, path)
+        except OSError as e:
+            logging.error(f"Failed to save replay: {e}")
+
     def start_two_player_game(self) -> None:
         """Initialize a 2-player alternating game."""
         self.two_player_mode = True
@@ -274,15 +339,7 @@ class Game:
 
         # Reset player states - each will start fresh on first switch
         for player_num in [1, 2]:
-            self.player_states[player_num] = {
-                'level': 1,
-                'alien_direction': 1,
-                'alien_speed': config.ALIEN_START_SPEED,
-                'initial_alien_count': 0,
-                'aliens': None,
-                'bunkers': None,
-                'has_been_saved': False,
-            }
+            self.player_states[player_num] = {'snapshot': None, 'has_been_saved': False}
 
         self.reset_game(start_playing=True)
         logging.info("2-Player game started. Player 1 begins")
@@ -309,65 +366,34 @@ class Game:
         self._restore_player_state(self.current_player)
 
         # Clear active projectiles and effects
-        self.bullet_group.empty()
-        self.bomb_group.empty()
+        self.world.clear_projectiles()
         self.effects_group.empty()
         self.audio_manager.stop_ufo_loop()
         self._respawn_player()
 
     def _save_player_state(self, player_num: int) -> None:
-        """Save the current player's game state (level, aliens, bunkers, etc.)."""
+        """Snapshot the current player's wave (formation, bunkers, pacing)."""
         if not self.two_player_mode:
             return
 
         self.player_states[player_num] = {
-            'level': self.level,
-            'alien_direction': self.alien_direction,
-            'alien_speed': self.alien_speed,
-            'initial_alien_count': self.initial_alien_count,
-            'aliens': self.alien_group.copy(),
-            'bunkers': self.bunker_group.copy(),
+            'snapshot': self.world.snapshot_playfield(),
             'has_been_saved': True,
         }
         logging.debug("Saved state for Player %d (Level %d, %d aliens)",
                       player_num, self.level, len(self.alien_group))
 
     def _restore_player_state(self, player_num: int) -> None:
-        """Restore a player's previously saved game state, or create fresh for first-time switch."""
+        """Restore a player's snapshot into the live sprites, or start fresh on a first switch."""
         if not self.two_player_mode:
             return
 
         state = self.player_states[player_num]
-
-        # Check if this player has ever been played before
+        # The formation and bunkers on screen are reused either way
+        self.world.restore_playfield(state['snapshot'])
         if not state['has_been_saved']:
-            # First time this player is playing - start fresh at level 1
-            self.level = 1
-            self.alien_direction = 1
-            self.alien_speed = config.ALIEN_START_SPEED
-            self.current_theme = get_level_theme(self.level)
-            self.alien_group = self.create_aliens()
-            self.bunker_group = self.create_bunkers()
             logging.info("Player %d starting fresh (first time)", player_num)
         else:
-            # Player has been saved before - restore their exact state
-            self.level = state['level']
-            self.alien_direction = state['alien_direction']
-            self.alien_speed = state['alien_speed']
-            self.initial_alien_count = state['initial_alien_count']
-            self.current_theme = get_level_theme(self.level)
-
-            # Restore sprite groups from saved state
-            if state['aliens'] is not None and len(state['aliens']) > 0:
-                self.alien_group = state['aliens'].copy()
-            else:
-                self.alien_group = self.create_aliens()
-
-            if state['bunkers'] is not None and len(state['bunkers']) > 0:
-                self.bunker_group = state['bunkers'].copy()
-            else:
-                self.bunker_group = self.create_bunkers()
-
             logging.debug("Restored saved state for Player %d (Level %d, %d aliens)",
                           player_num, self.level, len(self.alien_group))
 
@@ -393,59 +419,13 @@ class Game:
         else:
             self.p2_lives = value
 
-    def create_aliens(self) -> pygame.sprite.Group:
+    def create_aliens(self) -> AlienFormation:
         """Create alien formation and return sprite group."""
-        group = pygame.sprite.Group()
-        margin_y = config.ALIEN_MARGIN_Y
-        spacing_y = config.ALIEN_SPACING_Y
-        rows = config.ALIEN_ROWS
-        cols = config.ALIEN_COLUMNS
-        base_values = [30, 20, 20, 10, 10]  # Top row worth most points
-        values = base_values[:rows]
-
-        # Get sprite dimensions for centering
-        sprite_widths = {
-            30: get_game_sprite('alien_squid_1', config.SPRITE_SCALE).get_width(),
-            20: get_game_sprite('alien_crab_1', config.SPRITE_SCALE).get_width(),
-            10: get_game_sprite('alien_octopus_1', config.SPRITE_SCALE).get_width(),
-        }
-        sprite_heights = {
-            30: get_game_sprite('alien_squid_1', config.SPRITE_SCALE).get_height(),
-            20: get_game_sprite('alien_crab_1', config.SPRITE_SCALE).get_height(),
-            10: get_game_sprite('alien_octopus_1', config.SPRITE_SCALE).get_height(),
-        }
-        max_row_height = max(sprite_heights.values())
-
-        max_sprite_width = max(sprite_widths.values())
-        column_gap = config.ALIEN_SPACING_X
-        formation_width = cols * max_sprite_width + (cols - 1) * column_gap
-        start_x = max(
-            config.ALIEN_MARGIN_X,
-            (self.logical_width - formation_width) / 2,
-        )
-        for row_idx, value in enumerate(values):
-            alien_width = sprite_widths[value]
-            offset_within_cell = (max_sprite_width - alien_width) / 2
-            x_offset = start_x
-            for col_idx in range(cols):
-                cell_x = x_offset + col_idx * (max_sprite_width + column_gap)
-                x = cell_x + offset_within_cell
-                row_base_y = margin_y + row_idx * spacing_y
-                y = row_base_y + (max_row_height - sprite_heights[value])
-                group.add(Alien(x, y, value, tint=self._alien_tint(value)))
-        return group
+        return self.world.create_aliens()
 
     def create_bunkers(self) -> pygame.sprite.Group:
         """Create bunkers and return sprite group."""
-        group = pygame.sprite.Group()
-        spacing = self.logical_width // (constants.BLOCK_NUMBER + 1)
-        player_top = self.player.rect.top
-        bunker_bottom = max(0, player_top - config.BUNKER_PLAYER_GAP)
-        tint = self._sprite_tint("bunker")
-        for i in range(constants.BLOCK_NUMBER):
-            center_x = spacing * (i + 1)
-            group.add(Bunker(center_x, bunker_bottom, tint=tint))
-        return group
+        return self.world.create_bunkers()
 
     def _sprite_tint(self, key: str) -> Optional[Tuple[int, int, int]]:
         """Get tint color for sprite from current theme or None if tinting disabled."""
@@ -484,8 +464,9 @@ class Game:
 
     def _position_player(self) -> None:
         """Position player at bottom center of playfield."""
-        if hasattr(self, "player") and self.player:
-            self.player.rect.midbottom = (self.logical_width // 2, self._player_floor())
+        if hasattr(self, "world"):
+            self.world.player_floor = self._player_floor()
+            self.world.position_player()
 
     def _build_ui_assets(self) -> None:
         """Build UI asset surfaces (life icons, digits, etc)."""
@@ -508,17 +489,13 @@ class Game:
         self.digit_writer = FontDigitWriter(font_size=16)
         icon_height = self.life_icon_surface.get_height() if self.life_icon_surface else 16
         self.bottom_panel_height = max(36, icon_height + 12)
-        if hasattr(self, "player"):
-            self._position_player()
+        self._position_player()
 
     def _refresh_playfield_sprites(self):
-        self.player = Player(tint=self._sprite_tint("player"))
-        self.player_group = pygame.sprite.GroupSingle(self.player)
-        self._position_player()
+        self._respawn_player()
         self.bunker_group = self.create_bunkers()
         self.alien_group = self.create_aliens()
-        self.bullet_group.empty()
-        self.bomb_group.empty()
+        self.world.clear_projectiles()
         self.effects_group.empty()
 
     def _apply_tint_preference(self, enabled: bool):
@@ -643,6 +620,15 @@ class Game:
             self.active_demo.set_debug_borders(enabled)
         logging.info("Sprite border debug %s", "enabled" if enabled else "disabled")
 
+    def _toggle_profiler_overlay(self) -> None:
+        """Show/hide frame timings; showing them also starts collection."""
+        self.show_profiler = not self.show_profiler
+        if self.show_profiler and not self.profiler.enabled:
+            self.profiler.enabled = True
+            self.profiler.reset()
+        self._profiler_lines = []
+        logging.info("Profiler overlay %s", "shown" if self.show_profiler else "hidden")
+
     def handle_events(self):
         """
         Process all pygame events including keyboard input and window events.
@@ -710,6 +696,10 @@ class Game:
                     self._insert_credit()
                     continue
 
+                if event.key == pygame.K_F3:
+                    self._toggle_profiler_overlay()
+                    continue
+
                 if self.state_manager.current_state == GameState.ATTRACT:
                     if event.key in (pygame.K_RETURN, pygame.K_SPACE):
                         self._finish_intro_demo(forced=True)
@@ -852,15 +842,12 @@ class Game:
                 # Spacebar: Fire bullet (only if no bullet currently active and playing)
                 if (
                     event.key == pygame.K_SPACE
-                    and len(self.bullet_group) < config.PLAYER_MAX_BULLETS
                     and self.state_manager.current_state == GameState.PLAYING
                     and not self.viewing_sprites
                     and not self.waiting_for_respawn
                 ):
-                    bullet = Bullet(self.player.get_bullet_spawn_position())
-                    self.bullet_group.add(bullet)
-                    self.audio_manager.play_sound("shoot")
-                    logging.info("Bullet fired from player position")
+                    # Fired by the next simulation step so recordings replay exactly
+                    self._fire_requested = True
 
                 # P or ESC: Toggle pause when playing
                 if event.key in (pygame.K_p, pygame.K_ESCAPE):
@@ -890,63 +877,20 @@ class Game:
         """
         Randomly spawn bombs from alien ships.
 
-        This method:
-        - Checks if any aliens exist (no bombs if no aliens)
-        - Uses random probability (2% chance per frame) to spawn bombs
-        - Selects a random alien to drop the bomb
-        - Creates bomb at alien's bottom center position
+        Bombs only drop during active play; the world picks the alien and
+        ramps the chance up as the formation thins out.
         """
-        # Don't spawn bombs if no aliens remain
-        if (
-            self.state_manager.current_state != GameState.PLAYING
-            or not self.alien_group
-        ):
+        if self.state_manager.current_state != GameState.PLAYING:
             return
-
-        # Probability-based bomb spawn (starts gentle, ramps up as aliens fall)
-        bomb_chance = config.ALIEN_BOMB_CHANCE + (
-            max(0, self.initial_alien_count - len(self.alien_group)) * 0.0005
-        )
-        if random.random() < bomb_chance:
-            # Select random alien from remaining aliens
-            alien = random.choice(self.alien_group.sprites())
-            # Create bomb at alien's bottom center
-            bomb = Bomb(alien.rect.midbottom, sprite_name='bomb_1', tint=self._sprite_tint("bomb_1"))
-            self.bomb_group.add(bomb)
-            logging.debug("Alien bomb spawned at %s from alien at %s",
-                         bomb.rect.topleft, alien.rect.topleft)
+        self.world.spawn_bomb()
 
     def spawn_ufo(self):
-        now = pygame.time.get_ticks()
-        if now - self.last_ufo_time > config.UFO_INTERVAL:
-            self.ufo_group.add(UFO(-60, 40))  # Start UFO slightly higher
-            self.last_ufo_time = now
-            logging.info("UFO spawned")
-            self.audio_manager.start_ufo_loop()
-
-    def _maybe_drop_ufo_bombs(self):
-        """Allow active UFOs to drop their own bomb type while flying across."""
-        if self.state_manager.current_state != GameState.PLAYING:
-            return
-        if not self.ufo_group:
-            self.audio_manager.stop_ufo_loop()
-            return
-        for ufo in self.ufo_group.sprites():
-            if random.random() < config.UFO_BOMB_CHANCE:
-                bomb = Bomb(ufo.rect.midbottom, sprite_name='bomb_2', tint=self._sprite_tint("bomb_2"))
-                self.bomb_group.add(bomb)
-                logging.debug("UFO bomb spawned at %s", bomb.rect.topleft)
-        if not self.ufo_group:
-            self.audio_manager.stop_ufo_loop()
+        """Launch the mystery ship once the UFO interval has elapsed."""
+        self.world.spawn_ufo()
 
     def update_alien_speed(self):
         """Increase alien speed as their numbers decrease."""
-        remaining = len(self.alien_group)
-        if remaining and self.initial_alien_count:
-            progress = 1.0 - (remaining / self.initial_alien_count)
-            max_speed = config.ALIEN_MAX_SPEED
-            base = config.ALIEN_START_SPEED
-            self.alien_speed = base + progress * (max_speed - base)
+        self.world.update_alien_speed()
 
     def _play_fast_invader_sound(self):
         if not self.alien_group:
@@ -955,206 +899,142 @@ class Game:
         self.fast_invader_step = (self.fast_invader_step + 1) % 4
 
     def update(self):
-        pressed = pygame.key.get_pressed()
+        """Advance the simulation by one frame and present its side effects."""
         if self.waiting_for_respawn:
             return
-        self.player_group.update(pressed)
-        # Update non-projectile entities first
-        self.ufo_group.update()
-        self._maybe_drop_ufo_bombs()
-
-        # Animate aliens every 30 frames (0.5 seconds at 60 FPS)
-        if pygame.time.get_ticks() % 500 < 16:  # Roughly every 0.5 seconds
-            for alien in self.alien_group:
-                alien.animate()
-            self._play_fast_invader_sound()
-
-        # Move aliens as a group (classic Space Invaders movement)
-        if self.alien_group:
-            move_x = self.alien_direction * self.alien_speed
-            move_down = False
-
-            aliens = self.alien_group.sprites()
-            formation_left = min(alien.rect.left for alien in aliens)
-            formation_right = max(alien.rect.right for alien in aliens)
-
-            if (
-                formation_right + move_x >= self.logical_width - config.ALIEN_EDGE_PADDING
-                or formation_left + move_x <= config.ALIEN_EDGE_PADDING
-            ):
-                move_down = True
-                self.alien_direction *= -1
-
-            # Move aliens
-            for alien in self.alien_group.sprites():
-                if move_down:
-                    alien.rect.y += config.ALIEN_DROP_DISTANCE  # Drop down when hitting edge
-                else:
-                    alien.rect.x += move_x
-            self._handle_alien_collisions()
-
-        # Spawn events
-        self.spawn_bomb()
-        self.spawn_ufo()
-
-        # Collisions
-        hits = pygame.sprite.groupcollide(self.bullet_group, self.alien_group, True, True)
-        for _bullet, aliens in hits.items():
-            for alien in aliens:
-                # Add score to current player
-                if self.two_player_mode and self.current_player == 2:
-                    self.p2_score += alien.value
-                else:
-                    self.score += alien.value
-                self._spawn_explosion(alien.rect.center)
-                self.audio_manager.play_sound("invaderkilled")
-                logging.info("Alien destroyed at %s", alien.rect.topleft)
-        if hits:
-            self.update_alien_speed()
-
-        hits = pygame.sprite.groupcollide(self.bullet_group, self.ufo_group, True, True)
-        for _bullet, ufos in hits.items():
-            for ufo in ufos:
-                # Add score to current player
-                if self.two_player_mode and self.current_player == 2:
-                    self.p2_score += ufo.value
-                else:
-                    self.score += ufo.value
-                self._spawn_explosion(ufo.rect.center)
-                self.audio_manager.play_sound("explosion")
-                logging.info("UFO destroyed for %d points", ufo.value)
-                self._add_floating_text(str(ufo.value), ufo.rect.center, color=constants.GREEN)
-
-        # bullet vs bunker
-        hits = pygame.sprite.groupcollide(self.bullet_group, self.bunker_group, True, False)
-        for bunker_list in hits.values():
-            for bunker in bunker_list:
-                bunker.damage()
-                logging.debug("Bunker damaged at %s", bunker.rect.topleft)
-
-    # (No duplicate initialization here)
-        intercepts = pygame.sprite.groupcollide(self.bullet_group, self.bomb_group, True, True)
-        if intercepts:
-            logging.debug("Player bullet intercepted an alien bomb")
-
-        # bomb vs player - use sprite collision helper for robustness
-        try:
-            hit_bombs = pygame.sprite.spritecollide(self.player, self.bomb_group, dokill=True)
-        except Exception:
-            hit_bombs = []
-        if hit_bombs:
-            # Deduct lives from current player
-            if self.two_player_mode and self.current_player == 2:
-                self.p2_lives -= len(hit_bombs)
-                current_lives = self.p2_lives
-            else:
-                self.lives -= len(hit_bombs)
-                current_lives = self.lives
-
-            logging.warning("Player %d hit! Lives left=%d", self.current_player, current_lives)
-            self._spawn_explosion(self.player.rect.center)
-            self.audio_manager.play_sound("explosion")
-
-            if self.two_player_mode:
-                # In 2-player mode, switch to other player on every hit
-                if self.current_player == 1:
-                    if self.p2_lives > 0:
-                        # P2 still has lives, switch to them
-                        logging.info("Player 1 hit! Switching to Player 2 (P2 lives: %d)", self.p2_lives)
-                        self.switch_player()
-                    else:
-                        # P2 is out of lives, P1 must continue
-                        if current_lives <= 0:
-                            # P1 also out of lives
-                            logging.info("Both players out of lives - showing continue screen")
-                            self._show_continue_screen()
-                        else:
-                            # P1 continues after being hit
-                            self._handle_life_loss()
-                else:  # current_player == 2
-                    if self.lives > 0:
-                        # P1 still has lives, switch to them
-                        logging.info("Player 2 hit! Switching to Player 1 (P1 lives: %d)", self.lives)
-                        self.switch_player()
-                    else:
-                        # P1 is out of lives, P2 must continue
-                        if current_lives <= 0:
-                            # P2 also out of lives
-                            logging.info("Both players out of lives - showing continue screen")
-                            self._show_continue_screen()
-                        else:
-                            # P2 continues after being hit
-                            self._handle_life_loss()
-            else:
-                # Single-player mode
-                if current_lives <= 0:
-                    self._show_continue_screen()
-                else:
-                    self._handle_life_loss()
-
-        # bomb vs bunker
-        hits = pygame.sprite.groupcollide(self.bomb_group, self.bunker_group, True, False)
-        for bunker_list in hits.values():
-            for bunker in bunker_list:
-                bunker.damage()
-                logging.debug("Bunker hit by bomb at %s", bunker.rect.topleft)
-
-        self._handle_alien_collisions()
-
-        if not self.alien_group:
-            self._start_next_wave()
+        playing = self.state_manager.current_state == GameState.PLAYING
+        inputs = FrameInput.from_keys(pygame.key.get_pressed(), fire=self._fire_requested)
+        self._fire_requested = False
+        if self.recorder is not None:
+            self.recorder.record(inputs, armed=playing)
+        events = self.world.step(inputs, config.SIM_TICK_MS, armed=playing)
+        for event in events:
+            self._apply_sim_event(event)
 
         # Check for extra lives milestones
         self._check_extra_lives()
-
-        # Update bullets and bombs after handling collisions to keep frame semantics
-        self.bullet_group.update()
-        self.bomb_group.update()
         self.effects_group.update()
+        if playing and not self.ufo_group:
+            self.audio_manager.stop_ufo_loop()
 
         if self.game_over:
             logging.info("Game over detected")
             # Don't stop running immediately, let game_over_screen handle it
 
+    def _should_simulate(self) -> bool:
+        """Whether this frame advances gameplay (active play, past the wave banner)."""
+        return (
+            self.state_manager.current_state == GameState.PLAYING
+            and not self.game_over
+            and not self.viewing_sprites
+            and pygame.time.get_ticks() >= self.level_start_ready_time
+        )
+
+    def _begin_frame(self) -> None:
+        """Open a rendered frame for the per-frame log and sound de-duplication."""
+        # Once per frame, not per simulation step: a catch-up frame running
+        # several steps must still play each repeated sound only once
+        self.log_limiter.tick()
+        self.audio_manager.next_frame()
+
+    def _run_simulation_steps(self, steps: int) -> None:
+        """Run ``steps`` fixed updates, stopping early if play is interrupted."""
+        groups = (self.player_group, self.bullet_group, self.bomb_group, self.ufo_group)
+        for _ in range(steps):
+            self.interpolator.capture(groups)
+            self.update()
+            if self.game_over or self.state_manager.current_state != GameState.PLAYING:
+                break
+
+    def _apply_sim_event(self, event: SimEvent) -> None:
+        """Turn a simulation event into score, audio, effects and flow changes."""
+        kind = event.type
+        allow = self.log_limiter.allow
+        if kind == SimEventType.SHOT_FIRED:
+            self.audio_manager.play_sound("shoot")
+            if allow("shot_fired"):
+                logging.info("Bullet fired from player position")
+        elif kind == SimEventType.FORMATION_STEP:
+            self._play_fast_invader_sound()
+        elif kind == SimEventType.ALIEN_KILLED:
+            self.set_current_score(self.get_current_score() + event.value)
+            self._spawn_explosion(event.pos)
+            self.audio_manager.play_sound("invaderkilled")
+            if allow("alien_killed"):
+                logging.info("Alien destroyed at %s", event.pos)
+        elif kind == SimEventType.UFO_SPAWNED:
+            logging.info("UFO spawned")
+            self.audio_manager.start_ufo_loop()
+        elif kind == SimEventType.UFO_KILLED:
+            self.set_current_score(self.get_current_score() + event.value)
+            self._spawn_explosion(event.pos)
+            self.audio_manager.play_sound("explosion")
+            logging.info("UFO destroyed for %d points", event.value)
+            self._add_floating_text(str(event.value), event.pos, color=constants.GREEN)
+        elif kind == SimEventType.BOMB_DROPPED:
+            if allow("bomb_dropped", DEBUG):
+                logging.debug("%s bomb spawned at %s", "UFO" if event.value else "Alien", event.pos)
+        elif kind == SimEventType.BUNKER_HIT:
+            if allow("bunker_hit", DEBUG):
+                logging.debug("Bunker hit at %s", event.pos)
+        elif kind == SimEventType.BUNKER_DESTROYED:
+            if allow("bunker_destroyed", DEBUG):
+                logging.debug("Bunker destroyed by alien at %s", event.pos)
+        elif kind == SimEventType.BOMB_INTERCEPTED:
+            if allow("bomb_intercepted", DEBUG):
+                logging.debug("Player bullet intercepted an alien bomb")
+        elif kind == SimEventType.PLAYER_HIT:
+            self._handle_player_hit(event.value)
+        elif kind == SimEventType.ALIEN_VICTORY:
+            self._trigger_alien_victory(event.reason)
+        elif kind == SimEventType.WAVE_CLEARED:
+            self._announce_wave()
+
+    def _handle_player_hit(self, bomb_count: int) -> None:
+        """Deduct lives after bombs hit the ship and decide who plays next."""
+        # Deduct lives from current player
+        current_lives = self.get_current_lives() - bomb_count
+        self.set_current_lives(current_lives)
+
+        logging.warning("Player %d hit! Lives left=%d", self.current_player, current_lives)
+        self._spawn_explosion(self.player.rect.center)
+        self.audio_manager.play_sound("explosion")
+
+        if self.two_player_mode:
+            # In 2-player mode, switch to the other player on every hit while they have lives
+            other_lives = self.p2_lives if self.current_player == 1 else self.lives
+            if other_lives > 0:
+                logging.info("Player %d hit! Switching to Player %d (lives: %d)",
+                             self.current_player, 3 - self.current_player, other_lives)
+                self.switch_player()
+            elif current_lives <= 0:
+                logging.info("Both players out of lives - showing continue screen")
+                self._show_continue_screen()
+            else:
+                # The other player is out of lives, this one continues after being hit
+                self._handle_life_loss()
+        elif current_lives <= 0:
+            self._show_continue_screen()
+        else:
+            self._handle_life_loss()
+
     def _reset_alien_progression(self, speed_bonus: float = 0.0):
         """Reset alien speed progression to the slow starting pace."""
-        self.initial_alien_count = len(self.alien_group)
-        self.alien_speed = config.ALIEN_START_SPEED + speed_bonus
+        self.world.reset_alien_progression(speed_bonus)
 
     def _respawn_player(self):
         """Respawn the player ship at the starting position."""
-        self.player = Player(tint=self._sprite_tint("player"))
-        self.player_group = pygame.sprite.GroupSingle(self.player)
-        self._position_player()
+        self.world.player_floor = self._player_floor()
+        self.world.respawn_player()
 
     def _handle_life_loss(self):
         """Pause gameplay after losing a life and wait for player input to resume."""
         self.waiting_for_respawn = True
-        self.bullet_group.empty()
-        self.bomb_group.empty()
-        self._respawn_player()
-        self._reset_alien_progression()
+        # Same reset a replay applies after a hit, so recordings stay in sync
+        self.world.player_floor = self._player_floor()
+        self.world.lose_life()
         logging.info("Life lost. Press SPACE to continue.")
 
-    def _handle_alien_collisions(self):
-        """Handle alien interactions with bunkers, player, and the ground."""
-        if not self.alien_group or self.game_over:
-            return
-
-        for alien in list(self.alien_group):
-            if alien.rect.colliderect(self.player.rect):
-                self._trigger_alien_victory("Game over: an alien reached the player")
-                return
-
-            if alien.rect.bottom >= self.logical_height - 4:
-                self._trigger_alien_victory("Game over: aliens reached the ground")
-                return
-
-            if self.bunker_group:
-                destroyed = pygame.sprite.spritecollide(alien, self.bunker_group, dokill=True)
-                for bunker in destroyed:
-                    logging.debug("Bunker destroyed by alien at %s", bunker.rect.topleft)
-
     def _trigger_alien_victory(self, reason: str):
         """Set the game over state due to alien advancement."""
         self._enter_game_over_state(reason)
@@ -1164,6 +1044,7 @@ class Game:
         if self.game_over:
             return
         self.game_over = True
+        self._finish_recording()
         self.state_manager.change_state(GameState.GAME_OVER)
         self._game_over_return_time = pygame.time.get_ticks() + self.game_over_intro_delay_ms
         logging.info(reason)
@@ -1172,6 +1053,7 @@ class Game:
         """Show the continue screen with countdown."""
         # Mark game as over when showing continue screen
         self.game_over = True
+        self._finish_recording()
 
         # Store the current game mode for continue callbacks
         was_two_player = self.two_player_mode
@@ -1224,19 +1106,26 @@ class Game:
 
     def _start_next_wave(self) -> None:
         """Advance to the next wave when all aliens are cleared."""
-        self.level += 1
-        self.current_theme = get_level_theme(self.level)
-        bonus_speed = min(0.05 * (self.level - 1), 0.6)
+        self.world.start_next_wave()
+        self._announce_wave()
+
+    def _announce_wave(self) -> None:
+        """Show the level banner and hold the new wave briefly."""
         self.wave_message_text = f"Level {self.level} - {self.current_theme.name}"
         self.wave_message_timer = pygame.time.get_ticks() + 2000
         self.level_start_ready_time = pygame.time.get_ticks() + self.level_start_delay_ms
-        self.alien_group = self.create_aliens()
-        self.bullet_group.empty()
-        self.bomb_group.empty()
-        self.ufo_group.empty()
-        self._reset_alien_progression(speed_bonus=bonus_speed)
         logging.info("Advanced to level %d (%s)", self.level, self.current_theme.name)
 
+    @staticmethod
+    def _set_display_mode(size: Tuple[int, int]) -> pygame.Surface:
+        """Open or resize the window, asking for vsync when configured."""
+        if config.RENDER_VSYNC:
+            try:
+                return pygame.display.set_mode(size, pygame.RESIZABLE, vsync=1)
+            except pygame.error as exc:
+                logging.warning("Vsync unavailable (%s); presenting without it", exc)
+        return pygame.display.set_mode(size, pygame.RESIZABLE)
+
     def _handle_resize(self, width: int, height: int):
         """Handle window resize events and keep the sprite viewer surface in sync."""
         width = max(1, width)
@@ -1244,7 +1133,9 @@ class Game:
         if (width, height) == (self.window_width, self.window_height):
             return
         self.window_width, self.window_height = width, height
-        self.screen = pygame.display.set_mode((width, height), pygame.RESIZABLE)
+        self.screen = self._set_display_mode((width, height))
+        self.dirty_tracker.invalidate()
+        self.presenter.invalidate()
         # Update sprite viewer target surface so it draws to the new window
         if self.sprite_viewer:
             self.sprite_viewer.screen = self.screen
@@ -1277,6 +1168,7 @@ class Game:
             self.active_demo.update()
             self.active_demo.draw(self.playfield_surface)
             self._present_playfield()
+            self.dirty_tracker.invalidate()
             if self.active_demo.is_finished():
                 if self.demo_cycle_enabled:
                     self.demo_cycle_index = (self.demo_cycle_index + 1) % len(self.demo_cycle)
@@ -1289,6 +1181,8 @@ class Game:
         if self.viewing_sprites:
             self.sprite_viewer.draw_sprite_grid()
             pygame.display.flip()
+            self.dirty_tracker.invalidate()
+            self.presenter.invalidate()
             return
 
         # Normal game drawing
@@ -1300,55 +1194,105 @@ class Game:
             self.menu.draw(surface)
             self._draw_menu_credits(surface)
             self._present_playfield()
+            self.dirty_tracker.invalidate()
             return
 
-        self.player_group.draw(surface)
-        self.alien_group.draw(surface)
-        self.bunker_group.draw(surface)
-        self.bullet_group.draw(surface)
-        self.bomb_group.draw(surface)
-        self.effects_group.draw(surface)
-        self.ufo_group.draw(surface)
-
-        self._draw_floating_texts(surface)
-        self._draw_scoreboard(surface)
+        section = self.profiler.section
+        with section("draw.world"):
+            self.player_group.draw(surface)
+            self.alien_group.draw(surface)
+            self.bunker_group.draw(surface)
+            self.bullet_group.draw(surface)
+            self.bomb_group.draw(surface)
+            self.effects_group.draw(surface)
+            self.ufo_group.draw(surface)
+
+        with section("draw.hud"):
+            self._draw_floating_texts(surface)
+            self._draw_scoreboard(surface)
+
+        with section("draw.overlays"):
+            overlay = False
+            if self.wave_message_timer > pygame.time.get_ticks():
+                self._draw_wave_message()
+                overlay = True
+
+            if self.waiting_for_respawn:
+                self._draw_life_lost_message()
+                overlay = True
 
-        if self.wave_message_timer > pygame.time.get_ticks():
-            self._draw_wave_message()
+            if self.game_over:
+                overlay = True
+                # Draw initials entry or continue screen (initials has priority)
+                if self.initials_entry_screen and self.initials_entry_screen.is_active:
+                    self.initials_entry_screen.draw(surface)
+                elif self.continue_screen and self.continue_screen.is_active:
+                    self.continue_screen.draw(surface)
+                else:
+                    self._draw_game_over_message()
+
+            if self.debug_sprite_borders:
+                self._draw_debug_sprite_borders(surface)
+                overlay = True
+
+            if self.show_profiler:
+                self._draw_profiler_overlay(surface)
+                overlay = True
+
+        self._present_playfield(self._collect_dirty_rects(overlay))
+
+    def _collect_dirty_rects(self, overlay: bool) -> Optional[List[pygame.Rect]]:
+        """Work out which playfield regions changed during this gameplay frame."""
+        tracker = self.dirty_tracker
+        tracker.track(
+            self.player_group,
+            self.bunker_group,
+            self.bullet_group,
+            self.bomb_group,
+            self.effects_group,
+            self.ufo_group,
+        )
+        # The formation describes itself from its columns; diffing it alien by
+        # alien would lease every Alien.rect each frame. Marking its old and new
+        # bounds also covers aliens killed since the last frame.
+        signature, bounds = self.alien_group.draw_state()
+        tracker.track_region("formation", signature, bounds or (0, 0, 0, 0))
+        # Erosion edits bunker images in place, which the sprite diff cannot see
+        for bunker in self.world.bunkers:
+            dirty = bunker.take_dirty_rect()
+            if dirty is not None:
+                tracker.mark(dirty)
+        # Overlays cover most of the playfield; present in full while one is up
+        # and on the frame it goes away
+        if overlay or self._overlay_drawn:
+            tracker.invalidate()
+        self._overlay_drawn = overlay
+        width = self.logical_width
+        tracker.track_region("scoreboard", self._scoreboard_signature(), (0, 0, width, self.scoreboard_height))
+        tracker.track_region(
+            "bottom_panel",
+            self._bottom_panel_signature(),
+            (0, self.logical_height - self.bottom_panel_height, width, self.bottom_panel_height),
+        )
+        return tracker.collect()
 
-        if self.waiting_for_respawn:
-            self._draw_life_lost_message()
+    def _present_playfield(self, dirty_rects: Optional[List[pygame.Rect]] = None):
+        """
+        Scale the logical playfield surface to the current window size.
 
-        if self.game_over:
-            # Draw initials entry or continue screen (initials has priority)
-            if self.initials_entry_screen and self.initials_entry_screen.is_active:
-                self.initials_entry_screen.draw(surface)
-            elif self.continue_screen and self.continue_screen.is_active:
-                self.continue_screen.draw(surface)
-            else:
-                self._draw_game_over_message()
-
-        if self.debug_sprite_borders:
-            self._draw_debug_sprite_borders(surface)
-
-        self._present_playfield()
-
-    def _present_playfield(self):
-        """Scale the logical playfield surface to the current window size."""
-        window_width, window_height = self.screen.get_size()
-        scale_x = window_width / self.logical_width
-        scale_y = window_height / self.logical_height
-        scale = min(scale_x, scale_y)
-        scaled_width = max(1, int(self.logical_width * scale))
-        scaled_height = max(1, int(self.logical_height * scale))
-        scaled_surface = pygame.transform.scale(self.playfield_surface, (scaled_width, scaled_height))
-        x_offset = (window_width - scaled_width) // 2
-        y_offset = (window_height - scaled_height) // 2
-        self.screen.fill(constants.BLACK)
-        self.screen.blit(scaled_surface, (x_offset, y_offset))
-        pygame.display.flip()
+        Args:
+            dirty_rects: Playfield regions that changed; only these are pushed
+                to the display. None presents the whole frame.
+        """
+        with self.profiler.section("present"):
+            updated = self.presenter.present(self.screen, self.playfield_surface, dirty_rects)
+            if updated is None:
+                pygame.display.flip()
+            elif updated:
+                pygame.display.update(updated)
 
     def game_over_screen(self):
+        self.dirty_tracker.invalidate()
         while True:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -1372,26 +1316,37 @@ class Game:
         - Rendering (drawing all game objects)
         - Game over state transitions
         """
+        profiler = self.profiler
         while self.running:
+            profiler.begin_frame()
+            self._begin_frame()
             # Process all input events (keyboard, mouse, window events)
-            self.handle_events()
-
-            # Only update game logic during active play
-            if (
-                self.state_manager.current_state == GameState.PLAYING
-                and not self.game_over
-                and not self.viewing_sprites
-            ):
-                if pygame.time.get_ticks() >= self.level_start_ready_time:
-                    self.update()
+            with profiler.section("events"):
+                self.handle_events()
+
+            # Only update game logic during active play, in fixed steps for the
+            # wall time the last frame took
+            simulating = self._should_simulate()
+            if simulating:
+                with profiler.section("update"):
+                    self._run_simulation_steps(self.timestep.advance(self._frame_ms))
+            else:
+                self.timestep.reset()
+                self.interpolator.clear()
 
             # Always draw the current game state
-            self.draw()
+            with profiler.section("draw"):
+                self.interpolator.apply(self.timestep.alpha)
+                try:
+                    self.draw()
+                finally:
+                    self.interpolator.restore()
+            profiler.end_frame()
 
             # Trigger the demo again if the menu sits idle
             if (
                 self.state_manager.current_state == GameState.MENU
-                and self.settings_manager.intro_demo_enabled()
+                and self.settings_manager.snapshot.intro_demo_enabled
                 and not any(
                     (
                         self.menu.showing_controls,
@@ -1473,10 +1428,15 @@ class Game:
                     ):
                         self._return_to_intro_screen(trigger="timer")
 
-            # Maintain consistent frame rate (60 FPS)
-            self.clock.tick(60)
+            # Gameplay may render uncapped (or at the vsync rate); everything
+            # else still paces itself per frame at the nominal rate
+            cap = config.RENDER_FPS_CAP if simulating else config.SIMULATION_HZ
+            self._frame_ms = self.clock.tick(cap)
 
         # Clean up pygame resources when exiting
+        self._finish_recording()
+        self.high_score_manager.cleanup()
+        self.settings_manager.flush()
         pygame.quit()
 
     def _draw_game_over_message(self):
@@ -1574,18 +1534,61 @@ class Game:
 
     def _spawn_explosion(self, position):
         tint = self._sprite_tint("explosion")
-        self.effects_group.add(ExplosionEffect(position, tint=tint))
+        self.effects_group.add(self.effects_pool.acquire(position, tint))
+
+    def _scoreboard_signature(self) -> tuple:
+        """Everything the top HUD strip shows; it is recomposed when this changes."""
+        return (
+            self.two_player_mode,
+            self.score,
+            self.p2_score,
+            self.high_score_manager.get_high_score(),
+            self.level,
+            get_color("hud_text"),
+            id(self.hi_label_surface),
+            id(self.digit_writer),
+        )
+
+    def _bottom_panel_signature(self) -> tuple:
+        """Everything the bottom HUD strip shows; it is recomposed when this changes."""
+        current_lives = self.p2_lives if (self.two_player_mode and self.current_player == 2) else self.lives
+        return (
+            self.two_player_mode,
+            self.current_player,
+            min(current_lives, self.max_life_icons),
+            self.credit_count,
+            self.sfx_enabled,
+            self.music_enabled,
+            self.bottom_panel_height,
+            get_color("hud_text"),
+            get_color("divider"),
+            id(self.life_icon_surface),
+            id(self.credit_label_surface),
+            id(self.digit_writer),
+        )
 
     def _draw_scoreboard(self, surface: pygame.Surface):
+        width, height = surface.get_size()
+        rect = self.hud.draw(
+            surface, "scoreboard", self._scoreboard_signature(), (0, 0),
+            (width, max(1, height // 4)), self._compose_scoreboard,
+        )
+        self.scoreboard_height = rect.height
+        self._draw_bottom_panel(surface)
+
+    def _compose_scoreboard(self, surface: pygame.Surface) -> int:
         width, _ = surface.get_size()
         margin = 6
         hud_color = get_color("hud_text")
+        text = self.hud.cache.text
+        writer = self.digit_writer
+        high_score = f"{self.high_score_manager.get_high_score():05d}"
 
         if self.two_player_mode:
             # 2-player HUD: "SCORE<1> [P1] HI-SCORE [HIGH] SCORE<2> [P2]"
-            score1_label = self.small_font.render("SCORE<1>", True, hud_color)
-            hi_label = self.hi_label_surface or self.small_font.render("HI-SCORE", True, hud_color)
-            score2_label = self.small_font.render("SCORE<2>", True, hud_color)
+            score1_label = text(self.small_font, "SCORE<1>", hud_color)
+            hi_label = self.hi_label_surface or text(self.small_font, "HI-SCORE", hud_color)
+            score2_label = text(self.small_font, "SCORE<2>", hud_color)
 
             label_height = max(score1_label.get_height(), hi_label.get_height(), score2_label.get_height())
 
@@ -1604,53 +1607,57 @@ class Game:
             surface.blit(score2_label, score2_rect)
 
             values_y = margin + label_height + 4
-            score1_digits = self.digit_writer.render(f"{self.score:05d}")
-            surface.blit(score1_digits, (10, values_y))
+            score1_rect = writer.render_into(surface, (10, values_y), f"{self.score:05d}")
 
-            hi_digits = self.digit_writer.render(f"{self.high_score_manager.get_high_score():05d}")
-            hi_digits_rect = hi_digits.get_rect(midtop=(width // 2, values_y))
-            surface.blit(hi_digits, hi_digits_rect)
+            hi_width, _ = writer.measure(high_score)
+            hi_digits_rect = writer.render_into(surface, (width // 2 - hi_width // 2, values_y), high_score)
 
-            score2_digits = self.digit_writer.render(f"{self.p2_score:05d}")
-            score2_digits_rect = score2_digits.get_rect(topright=(width - 10, values_y))
-            surface.blit(score2_digits, score2_digits_rect)
-        else:
-            # 1-player HUD: "SCORE [P1] HI-SCORE [HIGH] LEVEL [LEVEL]"
-            score_label = self.small_font.render("SCORE", True, hud_color)
-            hi_label = self.hi_label_surface or self.small_font.render("HI-SCORE", True, hud_color)
-            level_label = self.small_font.render("LEVEL", True, hud_color)
+            score2 = f"{self.p2_score:05d}"
+            score2_width, _ = writer.measure(score2)
+            score2_rect = writer.render_into(surface, (width - 10 - score2_width, values_y), score2)
+            return max(score1_rect.bottom, hi_digits_rect.bottom, score2_rect.bottom)
 
-            label_height = max(score_label.get_height(), hi_label.get_height(), level_label.get_height())
+        # 1-player HUD: "SCORE [P1] HI-SCORE [HIGH] LEVEL [LEVEL]"
+        score_label = text(self.small_font, "SCORE", hud_color)
+        hi_label = self.hi_label_surface or text(self.small_font, "HI-SCORE", hud_color)
+        level_label = text(self.small_font, "LEVEL", hud_color)
 
-            score_label_y = margin + (label_height - score_label.get_height()) // 2
-            surface.blit(score_label, (10, score_label_y))
+        label_height = max(score_label.get_height(), hi_label.get_height(), level_label.get_height())
 
-            hi_label_y = margin + (label_height - hi_label.get_height()) // 2
-            hi_rect = hi_label.get_rect(midtop=(width // 2, hi_label_y))
-            surface.blit(hi_label, hi_rect)
+        score_label_y = margin + (label_height - score_label.get_height()) // 2
+        surface.blit(score_label, (10, score_label_y))
 
-            level_label_y = margin + (label_height - level_label.get_height()) // 2
-            level_label_rect = level_label.get_rect(topright=(width - 10, level_label_y))
-            surface.blit(level_label, level_label_rect)
+        hi_label_y = margin + (label_height - hi_label.get_height()) // 2
+        hi_rect = hi_label.get_rect(midtop=(width // 2, hi_label_y))
+        surface.blit(hi_label, hi_rect)
 
-            values_y = margin + label_height + 4
-            score_digits = self.digit_writer.render(f"{self.score:05d}")
-            surface.blit(score_digits, (10, values_y))
+        level_label_y = margin + (label_height - level_label.get_height()) // 2
+        level_label_rect = level_label.get_rect(topright=(width - 10, level_label_y))
+        surface.blit(level_label, level_label_rect)
 
-            hi_digits = self.digit_writer.render(f"{self.high_score_manager.get_high_score():05d}")
-            hi_digits_rect = hi_digits.get_rect(midtop=(width // 2, values_y))
-            surface.blit(hi_digits, hi_digits_rect)
+        values_y = margin + label_height + 4
+        score_rect = writer.render_into(surface, (10, values_y), f"{self.score:05d}")
 
-            level_digits = self.digit_writer.render(f"{self.level:02d}")
-            level_digits_rect = level_digits.get_rect(topright=(width - 10, values_y))
-            surface.blit(level_digits, level_digits_rect)
+        hi_width, _ = writer.measure(high_score)
+        hi_digits_rect = writer.render_into(surface, (width // 2 - hi_width // 2, values_y), high_score)
 
-        self._draw_bottom_panel(surface)
+        level = f"{self.level:02d}"
+        level_width, _ = writer.measure(level)
+        level_rect = writer.render_into(surface, (width - 10 - level_width, values_y), level)
+        return max(score_rect.bottom, hi_digits_rect.bottom, level_rect.bottom)
 
     def _draw_bottom_panel(self, surface: pygame.Surface):
         width, height = surface.get_size()
         overlay_height = self.bottom_panel_height
-        overlay_top = height - overlay_height
+        self.hud.draw(
+            surface, "bottom_panel", self._bottom_panel_signature(), (0, height - overlay_height),
+            (width, overlay_height), self._compose_bottom_panel,
+        )
+
+    def _compose_bottom_panel(self, surface: pygame.Surface) -> None:
+        width, _ = surface.get_size()
+        overlay_top = 0
+        text = self.hud.cache.text
         pygame.draw.line(surface, get_color("divider"), (0, overlay_top), (width, overlay_top), 1)
         icon = self.life_icon_surface
         icons_right = 10
@@ -1664,36 +1671,30 @@ class Game:
         else:
             icons_right = 10
 
+        status = f"SFX {'ON' if self.sfx_enabled else 'OFF'}  MUSIC {'ON' if self.music_enabled else 'OFF'}"
         # Draw current player indicator in 2-player mode
         if self.two_player_mode:
-            player_text = self.small_font.render(f"PLAYER {self.current_player}", True, (255, 255, 0))
+            player_text = text(self.small_font, f"PLAYER {self.current_player}", (255, 255, 0))
             surface.blit(player_text, (icons_right + 12, overlay_top + 6))
-            status_text = self.small_font.render(
-                f"SFX {'ON' if self.sfx_enabled else 'OFF'}  MUSIC {'ON' if self.music_enabled else 'OFF'}",
-                True,
-                get_color("hud_text"),
-            )
+            status_text = text(self.small_font, status, get_color("hud_text"))
             surface.blit(status_text, (icons_right + 12, overlay_top + 18))
         else:
-            status_text = self.small_font.render(
-                f"SFX {'ON' if self.sfx_enabled else 'OFF'}  MUSIC {'ON' if self.music_enabled else 'OFF'}",
-                True,
-                get_color("hud_text"),
-            )
+            status_text = text(self.small_font, status, get_color("hud_text"))
             surface.blit(status_text, (icons_right + 12, overlay_top + 8))
 
         credit_text = self.credit_label_surface
-        digits = self.digit_writer.render(f"{self.credit_count:02d}")
-        label_height = credit_text.get_height() if credit_text else digits.get_height()
+        credits = f"{self.credit_count:02d}"
+        digits_width, digits_height = self.digit_writer.measure(credits)
+        label_height = credit_text.get_height() if credit_text else digits_height
         gap = 6 if credit_text else 0
-        total_width = (credit_text.get_width() if credit_text else 0) + gap + digits.get_width()
+        total_width = (credit_text.get_width() if credit_text else 0) + gap + digits_width
         # Position credits on the right side of the screen
         start_x = width - total_width - 10
         start_y = overlay_top + 6
         if credit_text:
             surface.blit(credit_text, (start_x, start_y))
             start_x += credit_text.get_width() + gap
-        surface.blit(digits, (start_x, start_y + label_height - digits.get_height()))
+        self.digit_writer.render_into(surface, (start_x, start_y + label_height - digits_height), credits)
 
     def _draw_life_lost_message(self):
         """Overlay prompting the player to continue after losing a life."""
@@ -1735,10 +1736,31 @@ class Game:
         """Render temporary floating score/signal text (e.g., UFO bonuses)."""
         now = pygame.time.get_ticks()
         self.floating_texts = [ft for ft in self.floating_texts if ft["expires"] > now]
+        drawn = []
         for ft in self.floating_texts:
             text_surf = self.small_font.render(ft["text"], True, ft["color"])
             rect = text_surf.get_rect(center=ft["pos"])
-            surface.blit(text_surf, rect)
+            drawn.append(surface.blit(text_surf, rect))
+        self.dirty_tracker.track_transient("floating_texts", drawn)
+
+    def _draw_profiler_overlay(self, surface: pygame.Surface) -> None:
+        """Rolling p50/p95/p99 frame and section timings (toggle with F3)."""
+        # Re-rasterize a few times per second; the numbers are rolling anyway
+        if not self._profiler_lines or self.profiler.frames % 15 == 0:
+            rows = [f"{'ms':<24}{'p50':>6}{'p95':>6}{'p99':>6}"]
+            for name, (p50, p95, p99) in list(self.profiler.summary().items())[:12]:
+                rows.append(f"{name:<24}{p50:6.2f}{p95:6.2f}{p99:6.2f}")
+            self._profiler_lines = [self.small_font.render(row, True, constants.GREEN) for row in rows]
+        line_height = self.small_font.get_linesize()
+        width = max(line.get_width() for line in self._profiler_lines) + 8
+        height = line_height * len(self._profiler_lines) + 8
+        top = self.scoreboard_height + 4
+        panel = pygame.Surface((width, height))
+        panel.set_alpha(180)
+        panel.fill(constants.BLACK)
+        surface.blit(panel, (4, top))
+        for index, line in enumerate(self._profiler_lines):
+            surface.blit(line, (8, top + 4 + index * line_height))
 
     def _draw_debug_sprite_borders(self, surface: pygame.Surface) -> None:
         color = constants.GREEN
@@ -6,6 +6,8 @@ from typing import Any, Dict, Optional
 
 from ..utils.logger import setup_logger
 
+logger = setup_logger(__name__)
+
 
 class GameState(Enum):
     """Enumeration of possible game states."""
@@ -22,7 +24,7 @@ class GameStateManager:
 
     def __init__(self):
         """Initialize the game state manager."""
-        self.logger = setup_logger(__name__)
+        self.logger = logger
         self._current_state = GameState.MENU
         self._previous_state: Optional[GameState] = None
         self._state_data: Dict[str, Any] = {}
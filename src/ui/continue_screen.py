@@ -11,6 +11,8 @@ import pygame
 from ..utils.logger import setup_logger
 from .font_manager import get_font
 
+logger = setup_logger(__name__)
+
 
 class ContinueScreen:
     """Screen shown when both players are out of lives with countdown."""
@@ -33,7 +35,7 @@ class ContinueScreen:
             credit_count: Current credit count
             is_two_player_mode: Whether the game was in 2-player mode
         """
-        self.logger = setup_logger(__name__)
+        self.logger = logger
         self.on_continue_1p = on_continue_1p
         self.on_continue_2p = on_continue_2p
         self.on_timeout = on_timeout
@@ -1,14 +1,29 @@
-"""Centralized font management for UI elements and overlays."""
+"""
+Centralized font management for UI elements and overlays.
+
+Looking a font up by family name makes pygame scan the system font
+directories (``fc-list`` on Linux), which dominates cold start. Resolved
+paths are therefore cached on disk in ``config.FONT_CACHE_PATH``, keyed by
+name and weight and invalidated when the font directories change. Setting
+``config.FONT_FILE`` to a font under ``assets/fonts`` skips system lookup
+altogether. Profiles are only built when first requested, and profiles that
+resolve to the same file, size and weight share one ``Font``.
+"""
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import os
+import sys
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 import pygame
 from pygame import font as pg_font
 
 from .. import config
+from ..utils.persistence import WriteBehindWriter
 
 logger = logging.getLogger(__name__)
 
@@ -65,8 +80,173 @@ MENU_OVERLAY_FONT_SECTIONS: Dict[str, Tuple[str, str]] = {
     "credits": ("menu_credits_main", "menu_credits_hint"),
 }
 
-pygame.font.init()
+# Directories whose modification times identify the installed font set
+_FONT_DIRS = (
+    "/usr/share/fonts",
+    "/usr/local/share/fonts",
+    "/var/cache/fontconfig",
+    "~/.fonts",
+    "~/.local/share/fonts",
+    "~/.cache/fontconfig",
+    "/Library/Fonts",
+    "/System/Library/Fonts",
+    "~/Library/Fonts",
+    os.path.join(os.environ.get("WINDIR", "C:\\Windows"), "Fonts"),
+)
+
+
+def font_fingerprint() -> str:
+    """Hash of the platform, pygame version and font directory mtimes."""
+    digest = hashlib.sha1(f"{sys.platform}|{pygame.version.ver}".encode())
+    for directory in _FONT_DIRS:
+        path = os.path.expanduser(directory)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+        digest.update(f"|{path}={mtime}".encode())
+    return digest.hexdigest()[:16]
+
+
+class FontPathCache:
+    """
+    Disk-backed map of (font name, bold) to the file pygame matched.
+
+    Entries are discarded wholesale when the fingerprint changes, and a
+    cached path that has since disappeared is looked up again.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Optional[str], fingerprint: Optional[str] = None,
+                 writer: Optional[WriteBehindWriter] = None):
+        """
+        Load the cache from ``path``.
+
+        Args:
+            path: Cache file; empty or None keeps the cache in memory only
+            fingerprint: Identity of the installed fonts (defaults to
+                ``font_fingerprint()``)
+            writer: Writer used to persist new entries
+        """
+        self.path = path or None
+        self.fingerprint = fingerprint or font_fingerprint()
+        self.writer = writer or WriteBehindWriter(delay_s=0.5, name="font-cache")
+        self.entries: Dict[str, Dict[str, object]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    @staticmethod
+    def _key(name: str, bold: bool) -> str:
+        return f"{name.lower()}|{'bold' if bold else 'regular'}"
+
+    def _load(self) -> None:
+        if not self.path or not os.path.isfile(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Ignoring unreadable font cache %s: %s", self.path, exc)
+            return
+        if data.get("version") == self.VERSION and data.get("fingerprint") == self.fingerprint:
+            self.entries = dict(data.get("fonts", {}))
+        else:
+            logger.info("Font cache is stale; fonts will be looked up again")
+
+    def resolve(self, name: str, bold: bool = False) -> Tuple[Optional[str], bool]:
+        """
+        Return the font file for ``name`` and whether bold must be synthesized.
+
+        Mirrors ``pygame.font.SysFont``: a missing bold face, or no match at
+        all (the default font), is emboldened at render time instead.
+        """
+        key = self._key(name, bold)
+        entry = self.entries.get(key)
+        if entry is not None and (entry["path"] is None or os.path.isfile(entry["path"])):
+            self.hits += 1
+            return entry["path"], bool(entry["synthetic_bold"])
+        self.misses += 1
+        path = pg_font.match_font(name, bold=bold)
+        synthetic_bold = bold and (path is None or path == pg_font.match_font(name, bold=False))
+        self.entries[key] = {"path": path, "synthetic_bold": synthetic_bold}
+        self._save()
+        return path, synthetic_bold
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        data = {"version": self.VERSION, "fingerprint": self.fingerprint,
+                "fonts": dict(sorted(self.entries.items()))}
+        self.writer.submit(self.path, data)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until new entries are on disk."""
+        return self.writer.flush(timeout)
+
+
 _cache: Dict[str, pygame.font.Font] = {}
+_fonts: Dict[Tuple[Optional[str], int, bool], pygame.font.Font] = {}
+_path_cache: Optional[FontPathCache] = None
+
+
+def _get_path_cache() -> FontPathCache:
+    global _path_cache
+    if _path_cache is None:
+        _path_cache = FontPathCache(config.FONT_CACHE_PATH)
+    return _path_cache
+
+
+def _bundled_font() -> Optional[str]:
+    if not config.FONT_FILE:
+        return None
+    path = os.path.join(config.FONT_DIR, config.FONT_FILE)
+    if os.path.isfile(path):
+        return path
+    logger.warning("Bundled font not found: %s; using system fonts", path)
+    return None
+
+
+def resolve_font(name: Optional[str], bold: bool = False) -> Tuple[Optional[str], bool]:
+    """
+    Return (font file, synthesize bold) for a family name.
+
+    The bundled font wins when configured; otherwise the on-disk cache is
+    consulted before asking pygame to search the system. ``None`` selects
+    pygame's default font.
+    """
+    if not name:
+        return None, bold
+    bundled = _bundled_font()
+    if bundled is not None:
+        return bundled, bold
+    return _get_path_cache().resolve(name, bold)
+
+
+def _open_font(path: Optional[str], size: int, bold: bool) -> pygame.font.Font:
+    key = (path, size, bold)
+    font = _fonts.get(key)
+    if font is None:
+        if not pg_font.get_init():
+            pg_font.init()
+        font = pg_font.Font(path, size)
+        if bold:
+            font.set_bold(True)
+        _fonts[key] = font
+    return font
+
+
+def clear_font_cache() -> None:
+    """Drop built fonts (required after ``pygame.font.quit()``); resolved paths are kept."""
+    _cache.clear()
+    _fonts.clear()
+
+
+def get_sys_font(name: str, size: int, bold: bool = False) -> pygame.font.Font:
+    """Cached, disk-resolved stand-in for ``pygame.font.SysFont``."""
+    path, synthetic_bold = resolve_font(name, bold)
+    return _open_font(path, size, synthetic_bold)
 
 
 def _resolve_size(spec: FontSpec) -> int:
@@ -82,14 +262,12 @@ def _resolve_size(spec: FontSpec) -> int:
 
 def _build_font(spec: FontSpec) -> pygame.font.Font:
     size = _resolve_size(spec)
-    matched = pg_font.match_font(spec.name or "", bold=spec.bold) if spec.name else None
+    matched, _ = resolve_font(spec.name, spec.bold) if spec.name else (None, False)
     try:
-        font = pg_font.Font(matched, size)
+        font = _open_font(matched, size, False)
     except Exception as exc:  # pragma: no cover - defensive fallback
         logger.warning("Falling back to default font. spec=%s error=%s", spec, exc)
-        font = pg_font.Font(None, size)
-        if spec.bold:
-            font.set_bold(True)
+        font = _open_font(None, size, spec.bold)
     return font
 
 
@@ -0,0 +1,102 @@
+"""Cached HUD rendering: rasterized text reuse and recompose-on-change strips."""
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+import pygame
+
+from .. import config
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by (text, font, color)."""
+
+    def __init__(self, max_entries: int = config.HUD_TEXT_CACHE_SIZE):
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[Tuple[str, object, object], pygame.Surface] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def get(self, key: Tuple[str, object, object], render: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """Return the cached surface for ``key``, rendering it on a miss."""
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = render()
+        self._entries[key] = surface
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return surface
+
+    def text(self, font: pygame.font.Font, text: str, color) -> pygame.Surface:
+        """Antialiased ``font.render`` through the cache."""
+        return self.get((text, font, tuple(color)), lambda: font.render(text, True, color))
+
+
+class _Strip:
+    def __init__(self, size: Tuple[int, int]):
+        self.canvas = pygame.Surface(size, pygame.SRCALPHA)
+        self.image = self.canvas
+        self.signature: Optional[Hashable] = None
+
+
+class HudLayer:
+    """
+    Pre-composed HUD strips that are only redrawn when what they show changes.
+
+    Each strip is composed onto a transparent surface by a callback and then
+    blitted every frame. pygame copies source pixels onto fully transparent
+    destination pixels, so the strip keeps the text's own alpha and lands on
+    the playfield exactly as drawing the text directly would.
+    """
+
+    def __init__(self, text_cache: Optional[TextCache] = None):
+        self.cache = text_cache or TextCache()
+        self._strips: Dict[str, _Strip] = {}
+        self.compositions = 0
+
+    def invalidate(self) -> None:
+        """Force every strip to recompose on its next draw."""
+        for strip in self._strips.values():
+            strip.signature = None
+
+    def draw(self, surface: pygame.Surface, key: str, signature: Hashable, pos: Tuple[int, int],
+             size: Tuple[int, int], compose: Callable[[pygame.Surface], Optional[int]]) -> pygame.Rect:
+        """
+        Blit strip ``key`` at ``pos``, recomposing it first if ``signature`` changed.
+
+        Args:
+            surface: Target surface
+            key: Strip name
+            signature: Hashable summary of everything the strip shows
+            pos: Top-left position of the strip on ``surface``
+            size: Strip canvas size
+            compose: Draws the strip onto the cleared canvas; may return the
+                height actually used so only that part is blitted
+
+        Returns:
+            Rect covered on ``surface``
+        """
+        strip = self._strips.get(key)
+        if strip is None or strip.canvas.get_size() != tuple(size):
+            strip = self._strips[key] = _Strip(size)
+        if strip.signature != signature or strip.signature is None:
+            strip.canvas.fill((0, 0, 0, 0))
+            used = compose(strip.canvas)
+            height = strip.canvas.get_height()
+            if used is not None:
+                height = max(1, min(height, used))
+            strip.image = strip.canvas.subsurface((0, 0, strip.canvas.get_width(), height))
+            strip.signature = signature
+            self.compositions += 1
+        return surface.blit(strip.image, pos)
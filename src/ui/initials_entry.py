@@ -10,6 +10,8 @@ import pygame
 from ..utils.logger import setup_logger
 from .font_manager import get_font
 
+logger = setup_logger(__name__)
+
 
 class InitialsEntry:
     """Screen for entering player initials for a high score."""
@@ -25,7 +27,7 @@ class InitialsEntry:
             score: The high score value to display
             callback: Function to call when initials are confirmed, receives initials string
         """
-        self.logger = setup_logger(__name__)
+        self.logger = logger
         self.score = score
         self.callback = callback
         self.initials = ["-", "-", "-"]  # Three character slots
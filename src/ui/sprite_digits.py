@@ -1,50 +1,127 @@
 """Utility helpers for rendering numeric strings via sprite digits or font digits."""
 from __future__ import annotations
 
-from typing import Dict
+from typing import Callable, Dict, List, Optional, Tuple
 
 import pygame
 
 from .. import config
 from ..utils.sprite_sheet import get_game_sprite
 from .color_scheme import get_color, get_tint
+from .font_manager import get_sys_font
 
+# Characters rasterized into every atlas up front (digits plus HUD punctuation)
+HUD_GLYPHS = "0123456789<>-:/. "
 
-class SpriteDigitWriter:
+
+class _GlyphAtlas:
+    """
+    Pre-rasterized glyphs packed side by side in a single surface.
+
+    ``render_into`` blits straight from the atlas onto the target, so drawing
+    a string allocates no surfaces. Characters outside the prebuilt set are
+    rasterized once on first use and kept alongside the atlas.
+    """
+
+    def __init__(self, rasterize: Callable[[str], pygame.Surface], spacing: int,
+                 glyphs: Optional[Dict[str, pygame.Surface]] = None):
+        """
+        Build the atlas.
+
+        Args:
+            rasterize: Renders one character; used for ``HUD_GLYPHS`` missing
+                from ``glyphs`` and for any other character on first use
+            spacing: Pixels between adjacent glyphs
+            glyphs: Ready-made glyph surfaces to pack instead of rasterizing
+        """
+        self._rasterize = rasterize
+        self.spacing = spacing
+        glyphs = dict(glyphs or {})
+        for ch in HUD_GLYPHS:
+            if ch not in glyphs:
+                glyphs[ch] = rasterize(ch)
+        width = sum(glyph.get_width() for glyph in glyphs.values())
+        height = max((glyph.get_height() for glyph in glyphs.values()), default=1)
+        self.surface = pygame.Surface((max(1, width), max(1, height)), pygame.SRCALPHA)
+        self._areas: Dict[str, Tuple[pygame.Surface, pygame.Rect]] = {}
+        x = 0
+        for ch, glyph in glyphs.items():
+            self.surface.blit(glyph, (x, 0))
+            self._areas[ch] = (self.surface, pygame.Rect(x, 0, glyph.get_width(), glyph.get_height()))
+            x += glyph.get_width()
+
+    def _glyphs(self, text: str) -> List[Tuple[pygame.Surface, pygame.Rect]]:
+        areas = self._areas
+        glyphs = []
+        for ch in text:
+            entry = areas.get(ch)
+            if entry is None:
+                source = self._rasterize(ch)
+                entry = areas[ch] = (source, source.get_rect())
+            glyphs.append(entry)
+        return glyphs
+
+    def measure(self, text: str) -> Tuple[int, int]:
+        """Return the (width, height) ``text`` occupies when rendered."""
+        glyphs = self._glyphs(text)
+        if not glyphs:
+            return 0, 0
+        width = sum(area.width for _, area in glyphs) + self.spacing * (len(glyphs) - 1)
+        return width, max(area.height for _, area in glyphs)
+
+    def render_into(self, surface: pygame.Surface, pos: Tuple[int, int], text: str) -> pygame.Rect:
+        """
+        Draw ``text`` onto ``surface`` with its top-left corner at ``pos``.
+
+        Glyphs are bottom-aligned to the tallest character in ``text``.
+
+        Returns:
+            Rect covered on ``surface``
+        """
+        glyphs = self._glyphs(text)
+        x, y = pos
+        if not glyphs:
+            return pygame.Rect(x, y, 0, 0)
+        height = max(area.height for _, area in glyphs)
+        spacing = self.spacing
+        blits = []
+        cursor = x
+        for source, area in glyphs:
+            blits.append((source, (cursor, y + height - area.height), area))
+            cursor += area.width + spacing
+        surface.blits(blits, doreturn=False)
+        return pygame.Rect(x, y, cursor - spacing - x, height)
+
+    def render(self, text: str) -> pygame.Surface:
+        """Render ``text`` onto a new transparent surface (prefer ``render_into``)."""
+        width, height = self.measure(text)
+        surface = pygame.Surface((max(1, width), height), pygame.SRCALPHA)
+        self.render_into(surface, (0, 0), text)
+        return surface
+
+
+class SpriteDigitWriter(_GlyphAtlas):
     """Renders digits using sprite sheet images (legacy)."""
     def __init__(self, scale: int | None = None, tint_enabled: bool = False):
         self.scale = scale or config.SPRITE_SCALE
         tint = get_tint('digit') if tint_enabled else None
-        self.digit_spacing = 1  # Small buffer so digits don't touch each other
-        self.digits: Dict[str, pygame.Surface] = {}
+        self.font = get_sys_font('monospace', 14)
+        self.font_color = get_color('hud_text')
+        glyphs: Dict[str, pygame.Surface] = {}
         for value in range(8):
             sprite_name = f'digit_{value}'
             tint_color = tint if tint is not None else None
-            self.digits[str(value)] = get_game_sprite(sprite_name, self.scale, tint=tint_color)
-        self.font = pygame.font.SysFont('monospace', 14)
-        self.font_color = get_color('hud_text')
+            glyphs[str(value)] = get_game_sprite(sprite_name, self.scale, tint=tint_color)
+        self.digits = dict(glyphs)
+        # The sheet has no 8, 9 or punctuation; the atlas rasterizes those from the font once
+        super().__init__(self._render_glyph, spacing=1, glyphs=glyphs)  # Small buffer so digits don't touch
+        self.digit_spacing = self.spacing
 
-    def render(self, text: str) -> pygame.Surface:
-        pieces = []
-        max_height = 0
-        for ch in text:
-            surf = self.digits.get(ch)
-            if not surf:
-                surf = self.font.render(ch, True, self.font_color)
-            pieces.append(surf)
-            max_height = max(max_height, surf.get_height())
-        width = sum(s.get_width() for s in pieces)
-        if pieces:
-            width += self.digit_spacing * (len(pieces) - 1)
-        surface = pygame.Surface((max(1, width), max_height), pygame.SRCALPHA)
-        x = 0
-        for surf in pieces:
-            surface.blit(surf, (x, max_height - surf.get_height()))
-            x += surf.get_width() + self.digit_spacing
-        return surface
+    def _render_glyph(self, ch: str) -> pygame.Surface:
+        return self.font.render(ch, True, self.font_color)
 
 
-class FontDigitWriter:
+class FontDigitWriter(_GlyphAtlas):
     """Renders digits using monospace font (matches sprite digit size)."""
     def __init__(self, font_size: int | None = None, color: tuple | None = None):
         """
@@ -55,33 +132,10 @@ class FontDigitWriter:
             color: RGB color tuple (default: hud_text color)
         """
         self.font_size = font_size or 14
-        self.font = pygame.font.SysFont('courier', self.font_size, bold=True)
+        self.font = get_sys_font('courier', self.font_size, bold=True)
         self.color = color or get_color('hud_text')
-        self.digit_spacing = 2  # Small spacing between digits for readability
+        super().__init__(self._render_glyph, spacing=2)
+        self.digit_spacing = self.spacing  # Small spacing between digits for readability
 
-    def render(self, text: str) -> pygame.Surface:
-        """Render text string as digits."""
-        pieces = []
-        max_height = 0
-
-        for ch in text:
-            # Render each character
-            surf = self.font.render(ch, True, self.color)
-            pieces.append(surf)
-            max_height = max(max_height, surf.get_height())
-
-        if not pieces:
-            return pygame.Surface((0, 0), pygame.SRCALPHA)
-
-        # Calculate total width
-        width = sum(s.get_width() for s in pieces)
-        width += self.digit_spacing * (len(pieces) - 1)
-
-        # Create combined surface
-        surface = pygame.Surface((max(1, width), max_height), pygame.SRCALPHA)
-        x = 0
-        for surf in pieces:
-            surface.blit(surf, (x, max_height - surf.get_height()))
-            x += surf.get_width() + self.digit_spacing
-
-        return surface
+    def _render_glyph(self, ch: str) -> pygame.Surface:
+        return self.font.render(ch, True, self.color)
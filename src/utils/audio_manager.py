@@ -3,15 +3,176 @@ Audio Manager for Space Invaders.
 
 Handles all sound effects and music, with support for toggling audio on/off
 and volume control. Audio is muted by default.
+
+Sound effects are routed through ``VoiceManager``, which owns a fixed set of
+reserved mixer channels: one for the marching heartbeat, one for the UFO loop
+and a small pool for everything else. Identical sounds requested in the same
+frame play once, and a full SFX pool gives up its lowest-priority voice.
+
+Sound effects are not decoded until they are first enabled, and then on a
+background thread: ``AudioManager.sounds_ready`` is a future that resolves
+once they are in memory. Sounds requested before that are skipped.
 """
 import logging
 import os
+import threading
+import time
+from concurrent.futures import Future
+from enum import Enum
+from typing import Dict, List, Optional, Set, Tuple
 
 import pygame
 
+from .. import config
+
 logger = logging.getLogger(__name__)
 
 
+class VoiceCategory(Enum):
+    """Mixer channel groups; each owns its own reserved channels."""
+    HEARTBEAT = "heartbeat"
+    UFO = "ufo"
+    SFX = "sfx"
+
+
+# Sound key -> (category, priority); higher priorities may steal SFX channels
+SOUND_VOICES: Dict[str, Tuple[VoiceCategory, int]] = {
+    "fastinvader1": (VoiceCategory.HEARTBEAT, 0),
+    "fastinvader2": (VoiceCategory.HEARTBEAT, 0),
+    "fastinvader3": (VoiceCategory.HEARTBEAT, 0),
+    "fastinvader4": (VoiceCategory.HEARTBEAT, 0),
+    "ufo_lowpitch": (VoiceCategory.UFO, 0),
+    "ufo_highpitch": (VoiceCategory.UFO, 0),
+    "shoot": (VoiceCategory.SFX, 1),
+    "invaderkilled": (VoiceCategory.SFX, 2),
+    "explosion": (VoiceCategory.SFX, 3),
+    "extra_life": (VoiceCategory.SFX, 3),
+}
+
+SOUND_FILES: Dict[str, str] = {
+    "shoot": "shoot.wav",
+    "explosion": "explosion.wav",
+    "invaderkilled": "invaderkilled.wav",
+    "fastinvader1": "fastinvader1.wav",
+    "fastinvader2": "fastinvader2.wav",
+    "fastinvader3": "fastinvader3.wav",
+    "fastinvader4": "fastinvader4.wav",
+    "ufo_lowpitch": "ufo_lowpitch.wav",
+    "ufo_highpitch": "ufo_highpitch.wav",
+}
+
+
+def configure_mixer(buffer: int = config.AUDIO_BUFFER_SIZE) -> None:
+    """Request the mixer buffer size; call before ``pygame.init()`` to take effect."""
+    pygame.mixer.pre_init(buffer=buffer)
+
+
+class VoiceManager:
+    """Allocates reserved mixer channels to sounds by category and priority."""
+
+    def __init__(self, sfx_channels: int = config.AUDIO_SFX_CHANNELS):
+        """
+        Initialize an unallocated voice manager.
+
+        Args:
+            sfx_channels: Channels shared by one-shot effects
+        """
+        self.sfx_channel_count = max(1, sfx_channels)
+        self.channels: Dict[VoiceCategory, List[pygame.mixer.Channel]] = {}
+        self._priority: Dict[int, int] = {}  # id(channel) -> priority of its voice
+        self._started: Dict[int, int] = {}  # id(channel) -> play serial, oldest first
+        self._serial = 0
+        self._frame_keys: Set[str] = set()
+        self._volumes: Dict[int, float] = {}  # id(sound) -> volume last applied
+        self.played = 0
+        self.coalesced = 0
+        self.stolen = 0
+        self.dropped = 0
+
+    @property
+    def allocated(self) -> bool:
+        return bool(self.channels)
+
+    def allocate(self) -> bool:
+        """Reserve the channels; False (and direct ``Sound.play``) if the mixer is not up."""
+        total = 2 + self.sfx_channel_count
+        try:
+            if pygame.mixer.get_num_channels() < total:
+                pygame.mixer.set_num_channels(total)
+            # Reserved channels are never handed out by a bare Sound.play()
+            pygame.mixer.set_reserved(total)
+            channel = pygame.mixer.Channel
+            self.channels = {
+                VoiceCategory.HEARTBEAT: [channel(0)],
+                VoiceCategory.UFO: [channel(1)],
+                VoiceCategory.SFX: [channel(2 + i) for i in range(self.sfx_channel_count)],
+            }
+        except pygame.error as exc:
+            logger.debug("Voice channels unavailable: %s", exc)
+            self.channels = {}
+            return False
+        return True
+
+    def next_frame(self) -> None:
+        """Start a new frame for same-frame de-duplication."""
+        self._frame_keys.clear()
+
+    def _apply_volume(self, sound: pygame.mixer.Sound, volume: float) -> None:
+        key = id(sound)
+        if self._volumes.get(key) != volume:
+            sound.set_volume(volume)
+            self._volumes[key] = volume
+
+    def _pick_channel(self, category: VoiceCategory, priority: int) -> Optional[pygame.mixer.Channel]:
+        channels = self.channels[category]
+        if category is not VoiceCategory.SFX:
+            return channels[0]
+        for channel in channels:
+            if not channel.get_busy():
+                return channel
+        victim = min(channels, key=lambda ch: (self._priority.get(id(ch), 0), self._started.get(id(ch), 0)))
+        if self._priority.get(id(victim), 0) > priority:
+            return None
+        self.stolen += 1
+        return victim
+
+    def play(self, key: str, sound: pygame.mixer.Sound, volume: float,
+             loops: int = 0) -> Optional[pygame.mixer.Channel]:
+        """
+        Play ``sound`` on a channel of its category.
+
+        Returns:
+            The channel used, or None if the sound was coalesced or dropped
+        """
+        if key in self._frame_keys:
+            self.coalesced += 1
+            return None
+        self._frame_keys.add(key)
+        self._apply_volume(sound, volume)
+        if not self.channels:
+            self.played += 1
+            return sound.play(loops)
+        category, priority = SOUND_VOICES.get(key, (VoiceCategory.SFX, 1))
+        channel = self._pick_channel(category, priority)
+        if channel is None:
+            self.dropped += 1
+            return None
+        channel.play(sound, loops)
+        self._serial += 1
+        self._priority[id(channel)] = priority
+        self._started[id(channel)] = self._serial
+        self.played += 1
+        return channel
+
+    def busy(self, category: VoiceCategory) -> bool:
+        return any(channel.get_busy() for channel in self.channels.get(category, ()))
+
+    def stats(self) -> Dict[str, int]:
+        """Voice counters for diagnostics."""
+        return {"played": self.played, "coalesced": self.coalesced,
+                "stolen": self.stolen, "dropped": self.dropped}
+
+
 class AudioManager:
     """Manages all game audio - SFX and background music."""
 
@@ -25,9 +186,15 @@ class AudioManager:
         self.sounds = {}
         self.music_track = "spaceinvaders1.mpeg"
         self._ufo_channel = None
+        self.voices = VoiceManager()
+        # Asset paths are resolved once; missing files map to None
+        self._sound_paths = self._resolve_sound_paths()
+        self._music_path = self._resolve_path(self.music_track)
+        self.sounds_ready: Optional[Future] = None
+        self.load_time_ms: Optional[float] = None
         if self._initialize_mixer():
             self.available = True
-            self._load_sounds()
+            self.voices.allocate()
             logger.info("AudioManager initialized (muted by default)")
         else:
             logger.warning("Audio subsystem unavailable; running muted.")
@@ -37,7 +204,7 @@ class AudioManager:
         if pygame.mixer.get_init():
             return True
         try:
-            pygame.mixer.init()
+            pygame.mixer.init(buffer=config.AUDIO_BUFFER_SIZE)
             return True
         except pygame.error as exc:
             logger.warning("Unable to initialize audio: %s", exc)
@@ -50,30 +217,73 @@ class AudioManager:
         sound_dir = os.path.join(assets_dir, "sounds")
         return os.path.join(sound_dir, filename)
 
-    def _load_sounds(self):
-        """Load all sound effects. Missing files are logged but don't crash the game."""
-        sound_files = {
-            "shoot": "shoot.wav",
-            "explosion": "explosion.wav",
-            "invaderkilled": "invaderkilled.wav",
-            "fastinvader1": "fastinvader1.wav",
-            "fastinvader2": "fastinvader2.wav",
-            "fastinvader3": "fastinvader3.wav",
-            "fastinvader4": "fastinvader4.wav",
-            "ufo_lowpitch": "ufo_lowpitch.wav",
-            "ufo_highpitch": "ufo_highpitch.wav",
-        }
-
-        for key, filename in sound_files.items():
-            path = self._get_sound_path(filename)
+    def _resolve_path(self, filename: str) -> Optional[str]:
+        """Return the asset path for ``filename``, or None if it is missing."""
+        path = self._get_sound_path(filename)
+        if os.path.exists(path):
+            return path
+        logger.warning("Sound file not found: %s", path)
+        return None
+
+    def _resolve_sound_paths(self) -> Dict[str, Optional[str]]:
+        return {key: self._resolve_path(filename) for key, filename in SOUND_FILES.items()}
+
+    def _load_sounds(self) -> Dict[str, pygame.mixer.Sound]:
+        """Decode all sound effects. Missing files are logged but don't crash the game."""
+        started = time.perf_counter()
+        loaded = {}
+        for key, path in self._sound_paths.items():
+            if path is None:
+                continue
             try:
-                if os.path.exists(path):
-                    self.sounds[key] = pygame.mixer.Sound(path)
-                    logger.debug(f"Loaded sound: {key}")
-                else:
-                    logger.warning(f"Sound file not found: {path}")
+                loaded[key] = pygame.mixer.Sound(path)
+                logger.debug("Loaded sound: %s", key)
             except pygame.error as e:
-                logger.warning(f"Failed to load sound {key}: {e}")
+                logger.warning("Failed to load sound %s: %s", key, e)
+        # Publish the whole set at once so the game thread never sees a partial dict
+        self.sounds = loaded
+        self.load_time_ms = (time.perf_counter() - started) * 1000.0
+        logger.info("Loaded %d sounds in %.1f ms", len(loaded), self.load_time_ms)
+        return loaded
+
+    def load_sounds(self, background: bool = config.AUDIO_BACKGROUND_LOAD) -> Future:
+        """
+        Start decoding sound effects, once; later calls return the same future.
+
+        Args:
+            background: Decode on a daemon thread instead of blocking the caller
+
+        Returns:
+            Future resolving to the loaded sounds by key
+        """
+        if self.sounds_ready is not None:
+            return self.sounds_ready
+        future: Future = Future()
+        self.sounds_ready = future
+
+        def run() -> None:
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(self._load_sounds())
+            except Exception as exc:  # surfaced through the future
+                logger.warning("Sound loading failed: %s", exc)
+                future.set_exception(exc)
+
+        if background:
+            threading.Thread(target=run, name="audio-loader", daemon=True).start()
+        else:
+            run()
+        return future
+
+    def load_report(self) -> Dict[str, object]:
+        """Describe sound loading for the startup report."""
+        if self.sounds_ready is None:
+            state = "deferred"
+        elif self.sounds_ready.done():
+            state = "ready"
+        else:
+            state = "loading"
+        return {"state": state, "sounds": len(self.sounds), "load_ms": self.load_time_ms}
 
     def play_sound(self, key):
         """Play a sound effect if audio is enabled and the sound exists."""
@@ -81,10 +291,7 @@ class AudioManager:
             return
 
         try:
-            sound = self.sounds[key]
-            sound.set_volume(self.volume)
-            sound.play()
-            logger.debug(f"Playing sound: {key}")
+            self.voices.play(key, self.sounds[key], self.volume)
         except pygame.error as e:
             logger.warning(f"Failed to play sound {key}: {e}")
 
@@ -132,8 +339,10 @@ class AudioManager:
                 logger.info("Unable to enable SFX; mixer unavailable.")
                 return
             self.available = True
-            if not self.sounds:
-                self._load_sounds()
+            self.voices.allocate()
+        if enabled and self.available:
+            # First enable pays for decoding, off the game thread
+            self.load_sounds()
         self.sfx_enabled = bool(enabled)
         if not self.sfx_enabled and self.available:
             pygame.mixer.stop()
@@ -156,15 +365,13 @@ class AudioManager:
         """Start looping the menu/attract music if available."""
         if not (self.available and self.music_enabled):
             return
-        path = self._get_sound_path(self.music_track)
+        if self._music_path is None:
+            return
         try:
-            if os.path.exists(path):
-                if not pygame.mixer.music.get_busy():
-                    pygame.mixer.music.load(path)
-                    pygame.mixer.music.set_volume(self.music_volume)
-                    pygame.mixer.music.play(-1)
-            else:
-                logger.warning("Music file not found: %s", path)
+            if not pygame.mixer.music.get_busy():
+                pygame.mixer.music.load(self._music_path)
+                pygame.mixer.music.set_volume(self.music_volume)
+                pygame.mixer.music.play(-1)
         except pygame.error as exc:
             logger.warning("Failed to start music: %s", exc)
 
@@ -187,7 +394,11 @@ class AudioManager:
             return
         if self._ufo_channel and self._ufo_channel.get_busy():
             return
-        self._ufo_channel = sound.play(-1)
+        self._ufo_channel = self.voices.play("ufo_lowpitch", sound, self.volume, loops=-1)
+
+    def next_frame(self) -> None:
+        """Mark a frame boundary; repeated sounds within one frame play once."""
+        self.voices.next_frame()
 
     def stop_ufo_loop(self) -> None:
         if self._ufo_channel:
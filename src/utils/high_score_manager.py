@@ -3,13 +3,19 @@ High Score Manager for Space Invaders.
 
 Persists high scores with player initials to disk and provides methods to track and update them.
 """
+import bisect
 import json
 import logging
 import os
-from typing import List
+from typing import List, Optional
+
+from .. import config
+from .persistence import WriteBehindWriter
 
 logger = logging.getLogger(__name__)
 
+MAX_SCORES = 10
+
 
 class HighScoreEntry:
     """Represents a single high score entry with initials and player number."""
@@ -44,11 +50,20 @@ class HighScoreEntry:
 class HighScoreManager:
     """Manages high score persistence and tracking with player initials."""
 
-    def __init__(self, scores_file="highscores.json"):
-        """Initialize the high score manager."""
+    def __init__(self, scores_file="highscores.json", writer: Optional[WriteBehindWriter] = None):
+        """
+        Initialize the high score manager.
+
+        Args:
+            scores_file: Scores file name, relative to the project root
+            writer: Background writer for saves (a private one by default)
+        """
         self.scores_file = scores_file
         self.high_score = 0
         self.all_scores: List[HighScoreEntry] = []
+        if writer is None:
+            writer = WriteBehindWriter(config.HIGH_SCORE_SAVE_DELAY_MS / 1000.0, name="highscores")
+        self.writer = writer
         self._load_scores()
         logger.info(f"HighScoreManager initialized. Current high score: {self.high_score}")
 
@@ -76,6 +91,9 @@ class HighScoreManager:
                         else:
                             # Old format: just a number
                             self.all_scores.append(HighScoreEntry(score=score_data))
+                    # Older files may be unordered; inserts below rely on descending order
+                    self.all_scores.sort(key=lambda e: e.score, reverse=True)
+                    del self.all_scores[MAX_SCORES:]
                     logger.info(f"Loaded high score: {self.high_score}")
             else:
                 logger.info("No existing high scores file found, starting fresh")
@@ -85,18 +103,26 @@ class HighScoreManager:
             self.all_scores = []
 
     def _save_scores(self):
-        """Save scores to disk."""
-        path = self._get_scores_path()
-        try:
-            data = {
-                "high_score": self.high_score,
-                "scores": [entry.to_dict() for entry in self.all_scores],
-            }
-            with open(path, "w") as f:
-                json.dump(data, f, indent=2)
-            logger.info(f"Saved high score: {self.high_score}")
-        except IOError as e:
-            logger.warning(f"Failed to save high scores: {e}")
+        """
+        Queue the scores for saving.
+
+        The snapshot is taken now; the background writer replaces the file
+        atomically a moment later, coalescing saves that arrive close together.
+        """
+        data = {
+            "high_score": self.high_score,
+            "scores": [entry.to_dict() for entry in self.all_scores],
+        }
+        self.writer.submit(self._get_scores_path(), data)
+        logger.info(f"Queued high score save: {self.high_score}")
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until queued saves are on disk; False if ``timeout`` expired."""
+        return self.writer.flush(timeout)
+
+    def cleanup(self) -> None:
+        """Write out any pending save before shutdown."""
+        self.flush()
 
     def check_high_score(self, score: int) -> bool:
         """Check if a score is a new high score."""
@@ -115,10 +141,13 @@ class HighScoreManager:
             True if this is a new high score, False otherwise
         """
         entry = HighScoreEntry(score=score, initials=initials, player=player)
-        self.all_scores.append(entry)
 
-        # Keep only top 10 scores, sorted by score descending
-        self.all_scores = sorted(self.all_scores, key=lambda e: e.score, reverse=True)[:10]
+        # Keep only the top 10, sorted by score descending; ties go after earlier entries
+        keys = [-e.score for e in self.all_scores]
+        index = bisect.bisect_right(keys, -score)
+        if index < MAX_SCORES:
+            self.all_scores.insert(index, entry)
+            del self.all_scores[MAX_SCORES:]
 
         if score > self.high_score:
             self.high_score = score
@@ -132,7 +161,7 @@ class HighScoreManager:
 
     def is_high_score_position(self, score: int) -> bool:
         """Check if a score would make the top 10."""
-        if len(self.all_scores) < 10:
+        if len(self.all_scores) < MAX_SCORES:
             return True
         return score > self.all_scores[-1].score
 
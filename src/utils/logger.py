@@ -1,19 +1,39 @@
 """
 Logging utilities for the game.
+
+Log records are handed to a ``QueueHandler`` on the root logger and written by
+a ``QueueListener`` thread, so formatting and file/console I/O never run on the
+game loop. Modules keep one ``logger = setup_logger(__name__)`` at import time;
+``LogRateLimiter`` caps how often high-frequency gameplay events are logged.
 """
+import atexit
 import logging
+import logging.handlers
 import os
-from typing import Optional
+import queue
+import sys
+from collections import defaultdict
+from typing import DefaultDict, Optional
+
+LOG_FORMAT = '%(asctime)s [%(levelname)s] %(name)s: %(message)s'
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
 
 
 def setup_logger(name: str, level: int = logging.INFO, log_file: Optional[str] = None) -> logging.Logger:
     """
-    Set up a logger with consistent formatting.
+    Return the named logger, configured once.
+
+    Records propagate to the root logger, whose queue handler (installed by
+    ``configure_logging``) formats and writes them off the game thread. Call
+    this once per module and keep the result rather than once per instance.
 
     Args:
         name: Logger name (usually __name__)
         level: Logging level
-        log_file: Optional log file path
+        log_file: Optional extra log file for this logger only
 
     Returns:
         Configured logger instance
@@ -21,23 +41,11 @@ def setup_logger(name: str, level: int = logging.INFO, log_file: Optional[str] =
     logger = logging.getLogger(name)
 
     # Avoid duplicate handlers
-    if logger.handlers:
+    if getattr(logger, "_configured", False):
         return logger
-
+    logger._configured = True
     logger.setLevel(level)
 
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s [%(levelname)s] %(name)s: %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-
     # File handler if specified
     if log_file:
         try:
@@ -48,9 +56,113 @@ def setup_logger(name: str, level: int = logging.INFO, log_file: Optional[str] =
 
             file_handler = logging.FileHandler(log_file, mode='w')
             file_handler.setLevel(level)
-            file_handler.setFormatter(formatter)
+            file_handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT))
             logger.addHandler(file_handler)
         except (OSError, IOError) as e:
             logger.warning(f"Could not create file handler for {log_file}: {e}")
 
     return logger
+
+
+def configure_logging(level: int = logging.INFO, console_level: int = logging.WARNING,
+                      log_file: Optional[str] = "game.log") -> logging.handlers.QueueListener:
+    """
+    Route all logging through a queue drained by a background listener.
+
+    The root logger gets a single ``QueueHandler``; the file and console
+    handlers are attached to the listener thread instead. Calling this again
+    replaces the previous pipeline.
+
+    Args:
+        level: Root logging level (and the file handler's level)
+        console_level: Minimum level echoed to stdout
+        log_file: Log file rewritten on every start (None to skip it)
+
+    Returns:
+        The running listener
+    """
+    global _listener, _queue_handler
+    stop_logging()
+
+    handlers = []
+    formatter = logging.Formatter(LOG_FORMAT)
+    if log_file:
+        file_handler = logging.FileHandler(log_file, mode="w")
+        file_handler.setLevel(level)
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(console_level)
+    console_handler.setFormatter(formatter)
+    handlers.append(console_handler)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    root_logger.addHandler(_queue_handler)
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the listener (safe to call repeatedly)."""
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(stop_logging)
+
+
+class LogRateLimiter:
+    """
+    Caps how many messages per key are logged within a window of frames.
+
+    Call ``allow(key)`` before logging a high-frequency event and ``tick()``
+    once per frame. When a window closes, suppressed messages are summarised
+    in one line so nothing disappears silently.
+    """
+
+    def __init__(self, logger: logging.Logger, limit: int = 5, window_frames: int = 60):
+        """
+        Initialize the limiter.
+
+        Args:
+            logger: Logger that receives the suppression summaries
+            limit: Messages per key allowed in each window
+            window_frames: Window length in frames
+        """
+        self.logger = logger
+        self.limit = limit
+        self.window_frames = max(1, window_frames)
+        self._frame = 0
+        self._counts: DefaultDict[str, int] = defaultdict(int)
+
+    def allow(self, key: str, level: int = logging.INFO) -> bool:
+        """Return True if a ``key`` message at ``level`` should be logged now."""
+        if not self.logger.isEnabledFor(level):
+            return False
+        self._counts[key] += 1
+        return self._counts[key] <= self.limit
+
+    def tick(self) -> None:
+        """Advance one frame, closing the window when it is full."""
+        self._frame += 1
+        if self._frame < self.window_frames:
+            return
+        self._frame = 0
+        if not self._counts:
+            return
+        for key, count in self._counts.items():
+            if count > self.limit:
+                self.logger.info("%d more '%s' messages suppressed", count - self.limit, key)
+        self._counts.clear()
@@ -0,0 +1,158 @@
+"""
+Crash-safe, write-behind JSON persistence.
+
+``atomic_write_json`` writes to a temporary file in the target directory,
+fsyncs it and renames it over the destination, so a power cut leaves either
+the old file or the new one, never a torn mix. ``WriteBehindWriter`` moves
+those writes onto a background thread and coalesces bursts of saves to the
+same file into one write of the latest data.
+"""
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+import weakref
+from typing import Any, Dict, Optional
+
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_writers: "weakref.WeakSet[WriteBehindWriter]" = weakref.WeakSet()
+
+
+def atomic_write_json(path: str, data: Any, indent: Optional[int] = 2) -> None:
+    """
+    Replace ``path`` with ``data`` serialized as JSON, atomically.
+
+    Raises:
+        OSError: If the temporary file cannot be written or renamed
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=".tmp-", suffix=".json", dir=directory)
+    try:
+        with os.fdopen(fd, "w") as handle:
+            json.dump(data, handle, indent=indent)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    # Persist the rename itself; not every platform can open directories
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+class WriteBehindWriter:
+    """
+    Background JSON writer that coalesces saves per path.
+
+    ``submit()`` only records the latest data for a path and returns; a daemon
+    thread writes it with ``atomic_write_json`` once ``delay_s`` has passed
+    without another submit for that writer (a debounce). ``flush()`` forces
+    pending writes out and waits for them; every writer is flushed at exit.
+    """
+
+    def __init__(self, delay_s: float = 0.0, name: str = "write-behind"):
+        """
+        Initialize an idle writer; the thread starts on the first submit.
+
+        Args:
+            delay_s: Quiet period before pending data is written
+            name: Thread name, for debugging
+        """
+        self.delay_s = delay_s
+        self.name = name
+        self.writes = 0
+        self.failures = 0
+        self._pending: Dict[str, Any] = {}
+        self._due = 0.0
+        self._busy = False
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        _writers.add(self)
+
+    @property
+    def pending(self) -> bool:
+        with self._cond:
+            return bool(self._pending) or self._busy
+
+    def submit(self, path: str, data: Any) -> None:
+        """Queue ``data`` for ``path``, replacing anything not yet written."""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError(f"{self.name} writer is closed")
+            self._pending[path] = data
+            self._due = time.monotonic() + self.delay_s
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Write pending data now; returns False if ``timeout`` expired first."""
+        with self._cond:
+            self._due = 0.0
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Flush and stop the thread; further submits raise."""
+        self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._pending:
+                        remaining = self._due - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                    elif self._closed:
+                        return
+                    else:
+                        self._cond.wait()
+                batch, self._pending = self._pending, {}
+                self._busy = True
+            try:
+                for path, data in batch.items():
+                    try:
+                        atomic_write_json(path, data)
+                        self.writes += 1
+                    except (OSError, TypeError, ValueError) as e:
+                        self.failures += 1
+                        logger.warning("Failed to write %s: %s", path, e)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+
+def flush_all_writers(timeout: Optional[float] = 2.0) -> None:
+    """Flush every live writer (registered to run at interpreter exit)."""
+    for writer in list(_writers):
+        writer.flush(timeout)
+
+
+atexit.register(flush_all_writers)
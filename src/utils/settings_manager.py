@@ -2,14 +2,35 @@
 Persistent settings manager for SpaceInvadersPy.
 
 Handles loading and saving lightweight configuration such as audio state
-and whether the intro demo should run automatically.
+and whether the intro demo should run automatically. Changes update an
+immutable in-memory snapshot at once; the file is rewritten by a background
+writer after a short debounce, so a burst of toggles costs one atomic write.
 """
 import json
 import os
+from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
 from .. import config
 from .logger import setup_logger
+from .persistence import WriteBehindWriter
+
+logger = setup_logger(__name__)
+
+# Shared by every manager so a new one can flush saves still queued by an old one
+_writer = WriteBehindWriter(config.SETTINGS_SAVE_DELAY_MS / 1000.0, name="settings")
+
+
+@dataclass(frozen=True)
+class SettingsSnapshot:
+    """Resolved settings as plain attributes, for per-frame reads."""
+
+    audio_enabled: bool
+    music_enabled: bool
+    intro_demo_enabled: bool
+    debug_sprite_borders: bool
+    tint_enabled: bool
+    scale_quality: str
 
 
 class SettingsManager:
@@ -21,6 +42,7 @@ class SettingsManager:
         "intro_demo_enabled": True,
         "debug_sprite_borders": False,
         "tint_enabled": False,
+        "scale_quality": "nearest",
     }
 
     # Schema: key -> (type, description)
@@ -30,13 +52,23 @@ class SettingsManager:
         "intro_demo_enabled": (bool, "Auto-play intro demo on menu"),
         "debug_sprite_borders": (bool, "Draw borders around sprites (debug)"),
         "tint_enabled": (bool, "Apply color tints to sprites"),
+        "scale_quality": (str, "Window scaling filter: nearest, scale2x or smooth"),
     }
 
-    def __init__(self, path: Optional[str] = None):
+    def __init__(self, path: Optional[str] = None, writer: Optional[WriteBehindWriter] = None):
+        """
+        Load settings from ``path``.
+
+        Args:
+            path: Settings file (defaults to ``SPACEINVADERS_SETTINGS_PATH`` or
+                ``settings.json`` in the project root)
+            writer: Background writer for saves (the shared settings writer by default)
+        """
         base_dir = os.path.dirname(config.BASE_DIR)
         env_path = os.environ.get("SPACEINVADERS_SETTINGS_PATH")
         self.path = path or env_path or os.path.join(base_dir, "settings.json")
-        self.logger = setup_logger(__name__)
+        self.logger = logger
+        self.writer = writer or _writer
         self.settings: Dict[str, Any] = {}
         self._load()
 
@@ -66,6 +98,8 @@ class SettingsManager:
 
     def _load(self) -> None:
         """Load settings file, falling back to defaults on errors."""
+        # A save for this file may still be waiting in the writer
+        self.writer.flush()
         data = self.DEFAULTS.copy()
         try:
             if os.path.isfile(self.path):
@@ -86,15 +120,22 @@ class SettingsManager:
         except (OSError, json.JSONDecodeError) as exc:
             self.logger.warning("Failed to load settings (%s). Using defaults.", exc)
         self.settings = data
+        self.snapshot = self._build_snapshot()
+
+    def _build_snapshot(self) -> SettingsSnapshot:
+        return SettingsSnapshot(**{key: self.get_option(key) for key in self.DEFAULTS})
 
     def _save(self) -> None:
-        """Persist settings to disk."""
+        """Queue the current settings for a debounced, atomic write."""
         try:
-            with open(self.path, "w", encoding="utf-8") as fh:
-                json.dump(self.settings, fh, indent=2, sort_keys=True)
-        except OSError as exc:
+            self.writer.submit(self.path, dict(sorted(self.settings.items())))
+        except RuntimeError as exc:
             self.logger.warning("Unable to save settings: %s", exc)
 
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until queued saves are on disk; False if ``timeout`` expired."""
+        return self.writer.flush(timeout)
+
     def get_option(self, key: str, default: Optional[Any] = None) -> Any:
         """Return a stored option value."""
         if key in self.settings:
@@ -102,10 +143,11 @@ class SettingsManager:
         return self.DEFAULTS.get(key, default)
 
     def set_option(self, key: str, value: Any) -> None:
-        """Set and persist an option value."""
+        """Set an option, refresh the snapshot and queue a save."""
         if self.settings.get(key) == value:
             return
         self.settings[key] = value
+        self.snapshot = self._build_snapshot()
         self._save()
 
     # Convenience helpers for common options ---------------------------------
@@ -140,6 +182,12 @@ class SettingsManager:
     def set_music_enabled(self, enabled: bool) -> None:
         self.set_option("music_enabled", bool(enabled))
 
+    def scale_quality(self) -> str:
+        return str(self.get_option("scale_quality", "nearest"))
+
+    def set_scale_quality(self, quality: str) -> None:
+        self.set_option("scale_quality", str(quality))
+
     def as_dict(self) -> Dict[str, Any]:
         """Return a shallow copy of the in-memory settings."""
         return dict(self.settings)
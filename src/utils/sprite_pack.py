@@ -0,0 +1,202 @@
+"""
+Precompiled sprite packs.
+
+A pack holds every sprite of one platform JSON already cut from
+``SpaceInvaders.png`` and scaled, as raw RGBA blocks behind a small index.
+Loading one memory-maps the file and wraps each block with
+``pygame.image.frombuffer``, so startup pays for neither PNG decoding nor JSON
+parsing. Packs record a digest of the PNG and JSON they were built from; a
+missing, corrupt or stale pack is ignored and sprites come from the sheet.
+
+Build packs offline (after editing the sheet or a JSON file) with::
+
+    python -m src.utils.sprite_pack [--scales 1 2]
+
+File layout (little-endian)::
+
+    header  magic "SIPK", version u8, source sha1 (20 bytes), entries u32
+    index   per entry: name length u8, name, scale u8, width u16,
+            height u16, offset u32
+    pixels  RGBA rows for each entry, each block 4-byte aligned
+"""
+import argparse
+import glob
+import hashlib
+import mmap
+import os
+import struct
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pygame
+
+from .. import config
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+MAGIC = b"SIPK"
+VERSION = 1
+SHEET_FILE = "SpaceInvaders.png"
+_HEADER = struct.Struct("<4sB20sI")
+_ENTRY = struct.Struct("<BHHI")
+
+
+class SpritePackError(ValueError):
+    """Raised when a pack file is malformed."""
+
+
+def json_path(platform: str) -> str:
+    return os.path.join(config.IMG_DIR, f"SpaceInvaders.{platform}.json")
+
+
+def pack_path(platform: str) -> str:
+    return os.path.join(config.IMG_DIR, f"SpaceInvaders.{platform}.sipack")
+
+
+def available_platforms() -> List[str]:
+    """Platforms with a coordinate JSON next to the sprite sheet."""
+    pattern = os.path.join(config.IMG_DIR, "SpaceInvaders.*.json")
+    return sorted(os.path.basename(path).split(".")[1] for path in glob.glob(pattern))
+
+
+def source_digest(sheet_file: str, json_file: str) -> bytes:
+    """SHA-1 of the sheet and coordinate files a pack is built from."""
+    digest = hashlib.sha1()
+    for path in (sheet_file, json_file):
+        with open(path, "rb") as fh:
+            digest.update(fh.read())
+    return digest.digest()
+
+
+class SpritePack:
+    """Read-only view of a memory-mapped sprite pack."""
+
+    def __init__(self, path: str, expected_digest: Optional[bytes] = None):
+        """
+        Map ``path`` and read its index.
+
+        Args:
+            path: Pack file
+            expected_digest: Source digest the pack must have been built from
+
+        Raises:
+            OSError: If the file cannot be opened
+            SpritePackError: If the file is malformed or stale
+        """
+        self.path = path
+        with open(path, "rb") as fh:
+            # Copy-on-write, so a caller drawing on a sprite never touches the file
+            self._data = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_COPY)
+        if len(self._data) < _HEADER.size:
+            raise SpritePackError(f"{path}: truncated header")
+        magic, version, digest, count = _HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise SpritePackError(f"{path}: not a version {VERSION} sprite pack")
+        if expected_digest is not None and digest != expected_digest:
+            raise SpritePackError(f"{path}: built from different sources")
+        self.digest = digest
+        self.index: Dict[Tuple[str, int], Tuple[int, int, int]] = {}
+        pos = _HEADER.size
+        view = memoryview(self._data)
+        for _ in range(count):
+            name_len = self._data[pos]
+            name = bytes(view[pos + 1:pos + 1 + name_len]).decode("utf-8")
+            pos += 1 + name_len
+            scale, width, height, offset = _ENTRY.unpack_from(self._data, pos)
+            pos += _ENTRY.size
+            if offset + width * height * 4 > len(self._data):
+                raise SpritePackError(f"{path}: sprite '{name}' runs past the end of the file")
+            self.index[(name, scale)] = (width, height, offset)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, key: Tuple[str, int]) -> bool:
+        return key in self.index
+
+    def get(self, sprite_name: str, scale: int) -> Optional[pygame.Surface]:
+        """Return an RGBA surface backed by the mapped file, or None if not packed."""
+        entry = self.index.get((sprite_name, scale))
+        if entry is None:
+            return None
+        width, height, offset = entry
+        block = memoryview(self._data)[offset:offset + width * height * 4]
+        return pygame.image.frombuffer(block, (width, height), "RGBA")
+
+
+def build_pack(platform: str, scales: Sequence[int] = config.SPRITE_PACK_SCALES,
+               out_path: Optional[str] = None) -> str:
+    """
+    Compile one platform's sprites into a pack file.
+
+    Args:
+        platform: Platform name, e.g. ``"arcade"``
+        scales: Integer scales to pre-render every sprite at
+        out_path: Destination (defaults to ``pack_path(platform)``)
+
+    Returns:
+        Path of the written pack
+    """
+    from .sprite_sheet import SpriteSheet
+
+    sheet_file = os.path.join(config.IMG_DIR, SHEET_FILE)
+    coords_file = json_path(platform)
+    sheet = SpriteSheet(sheet_file, coords_file)
+    entries: List[Tuple[str, int, pygame.Surface]] = [
+        (name, scale, sheet.get_sprite_by_name(name, scale))
+        for name, coords in sorted(sheet.sprite_coords.items())
+        if coords['width'] > 0 and coords['height'] > 0  # placeholders stay on the sheet path
+        for scale in scales
+    ]
+    index_size = sum(1 + len(name.encode("utf-8")) + _ENTRY.size for name, _, _ in entries)
+    offset = _align(_HEADER.size + index_size)
+    index = bytearray()
+    blocks = bytearray()
+    for name, scale, surface in entries:
+        encoded = name.encode("utf-8")
+        width, height = surface.get_size()
+        index += bytes([len(encoded)]) + encoded + _ENTRY.pack(scale, width, height, offset + len(blocks))
+        blocks += pygame.image.tobytes(surface, "RGBA")
+        blocks += bytes(_align(len(blocks)) - len(blocks))
+    header = _HEADER.pack(MAGIC, VERSION, source_digest(sheet_file, coords_file), len(entries))
+    padding = bytes(offset - len(header) - len(index))
+    out_path = out_path or pack_path(platform)
+    with open(out_path, "wb") as fh:
+        fh.write(header + index + padding + blocks)
+    logger.info("Wrote %d sprites for %s to %s", len(entries), platform, out_path)
+    return out_path
+
+
+def _align(size: int) -> int:
+    return (size + 3) & ~3
+
+
+def load_pack(platform: str) -> Optional[SpritePack]:
+    """Return the platform's pack if it exists and matches its sources, else None."""
+    path = pack_path(platform)
+    if not os.path.isfile(path):
+        return None
+    try:
+        digest = source_digest(os.path.join(config.IMG_DIR, SHEET_FILE), json_path(platform))
+        pack = SpritePack(path, expected_digest=digest)
+    except (OSError, SpritePackError) as exc:
+        logger.info("Ignoring sprite pack %s (%s); rebuild with python -m src.utils.sprite_pack", path, exc)
+        return None
+    logger.debug("Mapped %d packed sprites from %s", len(pack), path)
+    return pack
+
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compile sprite sheet platforms into binary sprite packs.")
+    parser.add_argument("platforms", nargs="*", help="Platforms to build (default: every platform JSON)")
+    parser.add_argument("--scales", type=int, nargs="+", default=list(config.SPRITE_PACK_SCALES),
+                        help="Sprite scales to pre-render (default: %(default)s)")
+    args = parser.parse_args(list(argv) if argv is not None else None)
+    pygame.init()
+    for platform in args.platforms or available_platforms():
+        print(build_pack(platform, args.scales))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
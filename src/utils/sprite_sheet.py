@@ -11,6 +11,9 @@ from typing import Dict, Optional, Tuple
 import pygame
 
 from .logger import setup_logger
+from .sprite_pack import SpritePack, load_pack
+
+logger = setup_logger(__name__)
 
 
 class SpriteSheet:
@@ -29,7 +32,7 @@ class SpriteSheet:
             filename: Path to the sprite sheet image file
             json_filename: Path to the JSON coordinate file (optional)
         """
-        self.logger = setup_logger(__name__)
+        self.logger = logger
         self.filename = filename
         self.json_filename = json_filename
         self.sprite_sheet: Optional[pygame.Surface] = None
@@ -198,22 +201,146 @@ ARCADE_SPRITE_MAPPING = {
     'title_logo': 'title_logo',
 }
 
-_tint_cache: Dict[Tuple[str, int, Tuple[int, int, int]], pygame.Surface] = {}
+# Sprites the gameplay entities request on every spawn
+ENTITY_SPRITES = (
+    'player', 'bullet', 'bomb_1', 'bomb_2', 'bomb_3', 'explosion', 'explosion_alt', 'ufo',
+    'alien_squid_1', 'alien_squid_2', 'alien_crab_1', 'alien_crab_2',
+    'alien_octopus_1', 'alien_octopus_2', 'bunker_full',
+)
+
+_VariantKey = Tuple[str, int, Optional[Tuple[int, int, int]]]
+
+
+class SpriteRegistry:
+    """
+    Central cache of ready-to-blit sprite variants keyed by (name, scale, tint).
+
+    Each variant is cut from the sheet, scaled and tinted once, converted to
+    the display format as soon as a display exists, and the same surface is
+    handed to every caller. Returned surfaces are shared: treat them as
+    read-only and ``copy()`` before drawing on one.
+
+    Collision masks are cached beside the surfaces, keyed by (name, scale)
+    only: tinting recolours pixels but never changes which ones are solid.
+    """
+
+    def __init__(self):
+        self.logger = logger
+        self._variants: Dict[_VariantKey, pygame.Surface] = {}
+        self._masks: Dict[Tuple[str, int], pygame.mask.Mask] = {}
+        self._unconverted: set = set()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._variants)
+
+    def get(self, sprite_name: str, scale: int, tint: Optional[Tuple[int, int, int]] = None) -> pygame.Surface:
+        """Return the shared surface for a sprite variant, building it on first use."""
+        key = (sprite_name, scale, tint)
+        surface = self._variants.get(key)
+        if surface is None:
+            self.misses += 1
+            surface = self._build(sprite_name, scale, tint)
+            self._variants[key] = surface
+            if not _display_ready():
+                self._unconverted.add(key)
+            return surface
+        self.hits += 1
+        if self._unconverted and key in self._unconverted and _display_ready():
+            # Built before the window existed; convert now that there is a format to match
+            surface = self._variants[key] = surface.convert_alpha()
+            self._unconverted.discard(key)
+        return surface
+
+    def mask(self, sprite_name: str, scale: int) -> pygame.mask.Mask:
+        """Return the shared collision mask for a sprite, building it on first use."""
+        key = (sprite_name, scale)
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = self._masks[key] = solid_mask(self.get(sprite_name, scale))
+        return mask
+
+    def preload(self, sprite_names=ENTITY_SPRITES, scale: int = 1, tints=(None,)) -> None:
+        """Build variants and their collision masks ahead of time (e.g. before the first wave)."""
+        for tint in tints:
+            for sprite_name in sprite_names:
+                self.get(sprite_name, scale, tint)
+        for sprite_name in sprite_names:
+            self.mask(sprite_name, scale)
+
+    def invalidate(self) -> None:
+        """Drop every variant; call when the theme or tint setting changes. Masks are kept."""
+        self._variants.clear()
+        self._unconverted.clear()
+
+    def _build(self, sprite_name: str, scale: int, tint: Optional[Tuple[int, int, int]]) -> pygame.Surface:
+        pack = _get_shared_sprite_pack()
+        surface = pack.get(sprite_name, scale) if pack is not None else None
+        if surface is None:
+            surface = _get_shared_sprite_sheet().get_sprite_by_name(sprite_name, scale)
+        if tint is not None:
+            surface = _apply_tint(surface, tint)
+        if _display_ready():
+            surface = surface.convert_alpha()
+        return surface
+
+
+def solid_mask(surface: pygame.Surface) -> pygame.mask.Mask:
+    """
+    Mask of a sprite's visible pixels.
+
+    Sheet sprites are drawn on opaque black and fallbacks on transparency, so
+    both black and transparent pixels count as empty.
+    """
+    mask = pygame.mask.from_surface(surface)
+    mask.erase(pygame.mask.from_threshold(surface, (0, 0, 0, 255), (1, 1, 1, 255)), (0, 0))
+    return mask
+
+
+def _display_ready() -> bool:
+    return pygame.display.get_init() and pygame.display.get_surface() is not None
+
+
+_registry = SpriteRegistry()
+
+
+def get_sprite_registry() -> SpriteRegistry:
+    """Return the shared sprite variant registry."""
+    return _registry
 
 
 def clear_tint_cache() -> None:
-    """Forget any cached tinted surfaces."""
-    _tint_cache.clear()
+    """Forget every cached sprite variant (tinted or not)."""
+    _registry.invalidate()
+
+
+_platform_sheets: Dict[str, SpriteSheet] = {}
+_packs: Dict[str, Optional[SpritePack]] = {}
+
+
+def get_platform_sprite_sheet(json_file: str) -> SpriteSheet:
+    """Return the sprite sheet for a platform JSON, decoding the PNG only once."""
+    sheet = _platform_sheets.get(json_file)
+    if sheet is None:
+        from .. import config
+        sprite_sheet_path = os.path.join(config.IMG_DIR, 'SpaceInvaders.png')
+        json_path = os.path.join(config.IMG_DIR, json_file)
+        sheet = _platform_sheets[json_file] = SpriteSheet(sprite_sheet_path, json_path)
+    return sheet
 
 
 def _get_shared_sprite_sheet() -> SpriteSheet:
     """Return the shared sprite sheet instance used by helper functions."""
-    if not hasattr(_get_shared_sprite_sheet, "_sheet"):
+    return get_platform_sprite_sheet('SpaceInvaders.arcade.json')
+
+
+def _get_shared_sprite_pack() -> Optional[SpritePack]:
+    """Return the arcade sprite pack, or None when disabled, missing or stale."""
+    if 'arcade' not in _packs:
         from .. import config
-        sprite_sheet_path = os.path.join(config.IMG_DIR, 'SpaceInvaders.png')
-        json_path = os.path.join(config.IMG_DIR, 'SpaceInvaders.arcade.json')
-        _get_shared_sprite_sheet._sheet = SpriteSheet(sprite_sheet_path, json_path)
-    return _get_shared_sprite_sheet._sheet
+        _packs['arcade'] = load_pack('arcade') if config.SPRITE_PACK_ENABLED else None
+    return _packs['arcade']
 
 
 def _apply_tint(surface: pygame.Surface, tint_color: Tuple[int, int, int]) -> pygame.Surface:
@@ -229,6 +356,8 @@ def get_game_sprite(sprite_name: str, scale: int = 2, tint: Optional[Tuple[int,
     """
     Get a specific game sprite by name using arcade JSON coordinates.
 
+    The surface comes from the shared ``SpriteRegistry``; do not draw on it.
+
     Args:
         sprite_name: Name of the sprite (key in ARCADE_SPRITE_MAPPING)
         scale: Scale factor for the sprite
@@ -237,25 +366,28 @@ def get_game_sprite(sprite_name: str, scale: int = 2, tint: Optional[Tuple[int,
     Returns:
         pygame.Surface containing the requested sprite
     """
-    sheet = _get_shared_sprite_sheet()
-
     arcade_sprite_name = ARCADE_SPRITE_MAPPING.get(sprite_name)
     if not arcade_sprite_name:
-        logger = setup_logger(__name__)
-        logger.warning(f"Unknown sprite name: {sprite_name}")
+        logger.warning("Unknown sprite name: %s", sprite_name)
         placeholder = pygame.Surface((16 * scale, 16 * scale), pygame.SRCALPHA)
         placeholder.fill((255, 0, 255))
         return placeholder
 
     if tint is not None:
-        tint_tuple = tuple(int(c) for c in tint[:3])
-        cache_key = (arcade_sprite_name, scale, tint_tuple)
-        if cache_key not in _tint_cache:
-            base_surface = sheet.get_sprite_by_name(arcade_sprite_name, scale)
-            _tint_cache[cache_key] = _apply_tint(base_surface, tint_tuple)
-        return _tint_cache[cache_key].copy()
-
-    return sheet.get_sprite_by_name(arcade_sprite_name, scale)
+        tint = tuple(int(c) for c in tint[:3])
+    return _registry.get(arcade_sprite_name, scale, tint)
+
+
+def get_game_sprite_mask(sprite_name: str, scale: int = 2) -> pygame.mask.Mask:
+    """
+    Get the collision mask matching ``get_game_sprite(sprite_name, scale)``.
+
+    Masks are shared by every sprite instance (and every tint); do not modify them.
+    """
+    arcade_sprite_name = ARCADE_SPRITE_MAPPING.get(sprite_name)
+    if not arcade_sprite_name:
+        return pygame.mask.Mask((16 * scale, 16 * scale), fill=True)
+    return _registry.mask(arcade_sprite_name, scale)
 
 
 def get_title_logo(scale: int = 1) -> pygame.Surface:
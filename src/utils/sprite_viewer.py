@@ -13,7 +13,9 @@ import pygame
 from .. import config, constants
 from ..ui.font_manager import get_font
 from .logger import setup_logger
-from .sprite_sheet import SpriteSheet, get_game_sprite
+from .sprite_sheet import get_game_sprite, get_platform_sprite_sheet
+
+logger = setup_logger(__name__)
 
 
 class SpriteViewer:
@@ -29,7 +31,7 @@ class SpriteViewer:
             screen: The pygame screen surface to draw on
         """
         self.screen = screen
-        self.logger = setup_logger(__name__)
+        self.logger = logger
         self.font = get_font("spriteviewer_title")
         self.small_font = get_font("spriteviewer_small")
         self.tiny_font = get_font("spriteviewer_tiny")
@@ -105,7 +107,6 @@ class SpriteViewer:
         self.clear_stage_preview()
         platform_config = self.platforms[platform]
         json_path = os.path.join(config.IMG_DIR, platform_config['json_file'])
-        sprite_sheet_path = os.path.join(config.IMG_DIR, 'SpaceInvaders.png')
 
         # Validate JSON file exists
         if not os.path.isfile(json_path):
@@ -113,8 +114,8 @@ class SpriteViewer:
             return False
 
         try:
-            # Load sprite sheet with JSON coordinates
-            self.sprite_sheet = SpriteSheet(sprite_sheet_path, json_path)
+            # Sheets are cached per platform, so switching back never re-decodes the PNG
+            self.sprite_sheet = get_platform_sprite_sheet(platform_config['json_file'])
 
             # Load JSON data for display
             with open(json_path, 'r') as f:
@@ -6,6 +6,8 @@ import pytest
 
 # Set dummy video driver before pygame initialization
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+# Keep resolved font paths in memory so test runs never write a cache file
+os.environ.setdefault("SPACEINVADERS_FONT_CACHE", "")
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -25,5 +27,5 @@ def reset_pygame_per_test():
     """Ensure clean pygame state between tests."""
     yield
     # Clear any cached fonts between tests to prevent state corruption
-    from src.ui.font_manager import _cache
-    _cache.clear()
+    from src.ui.font_manager import clear_font_cache
+    clear_font_cache()
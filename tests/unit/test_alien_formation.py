@@ -0,0 +1,108 @@
+"""Tests for the array-backed alien formation."""
+import pygame
+
+from src.entities.alien import Alien
+from src.entities.formation import AlienFormation
+
+
+def _formation(cols=3, rows=2):
+    aliens = [Alien(40 + c * 30, 50 + r * 20, 10) for r in range(rows) for c in range(cols)]
+    return AlienFormation(*aliens), aliens
+
+
+def test_bounds_cover_every_live_alien():
+    formation, aliens = _formation()
+    expected = aliens[0].rect.unionall([a.rect for a in aliens[1:]])
+    assert formation.bounds() == expected
+    assert AlienFormation().bounds() is None
+
+
+def test_advance_moves_origin_and_rects_follow():
+    formation, aliens = _formation()
+    before = [a.rect.topleft for a in aliens]
+    assert formation.advance(2.0, 0, 400, 10) is False
+    assert [a.rect.topleft for a in aliens] == [(x + 2, y) for x, y in before]
+
+
+def test_advance_drops_at_edge():
+    formation, aliens = _formation()
+    top = formation.bounds().top
+    assert formation.advance(-2.0, formation.bounds().left - 1, 400, 10) is True
+    assert formation.bounds().top == top + 10
+    assert aliens[0].rect.top == top + 10
+
+
+def test_animate_flips_frames():
+    formation, aliens = _formation()
+    aliens[0].animate()
+    formation.animate()
+    assert aliens[0].animation_frame == 0
+    assert all(a.animation_frame == 1 for a in aliens[1:])
+    assert aliens[1].image is aliens[1].frame2
+
+
+def test_moving_a_rect_is_folded_back():
+    formation, aliens = _formation()
+    aliens[0].rect.center = (300, 300)
+    assert formation.query(pygame.Rect(299, 299, 2, 2)) == [aliens[0]]
+    assert formation.bounds().bottom >= aliens[0].rect.bottom
+
+
+def test_killed_aliens_leave_queries_and_bounds():
+    formation, aliens = _formation(cols=2, rows=1)
+    last = aliens[1]
+    last.kill()
+    assert formation.query(last.rect) == []
+    assert formation.bounds() == aliens[0].rect
+    assert len(formation) == 1
+
+
+def test_draw_blits_live_aliens():
+    formation, aliens = _formation(cols=1, rows=1)
+    surface = pygame.Surface((200, 200))
+    surface.fill((0, 0, 0))
+    formation.draw(surface)
+    rect = aliens[0].rect
+    assert surface.subsurface(rect).get_bounding_rect().width > 0
+
+
+def test_copy_keeps_positions():
+    formation, aliens = _formation()
+    formation.advance(3.0, 0, 400, 10)
+    positions = [a.rect.topleft for a in aliens]
+    saved = formation.copy()
+    assert sorted(a.rect.topleft for a in saved) == sorted(positions)
+
+
+def test_restore_revives_the_same_aliens():
+    formation, aliens = _formation()
+    formation.advance(4.0, 0, 400, 10)
+    aliens[1].kill()
+    formation.animate()
+    snapshot = formation.snapshot()
+    rects = [tuple(a.rect) for a in aliens]
+
+    aliens[0].kill()
+    aliens[4].kill()
+    formation.advance(4.0, 0, 400, 10)
+    formation.animate()
+    formation.restore(snapshot)
+    assert formation.sprites() == [a for i, a in enumerate(aliens) if i != 1]
+    assert [tuple(a.rect) for a in formation] == [r for i, r in enumerate(rects) if i != 1]
+    assert all(a.animation_frame == 1 for a in formation)
+    assert formation.bounds() == aliens[0].rect.unionall([a.rect for a in aliens[2:]])
+
+
+def test_draw_state_tracks_changes_without_leasing_rects():
+    formation, aliens = _formation()
+    signature, bounds = formation.draw_state()
+    assert formation.draw_state() == (signature, bounds)
+    assert not formation._leased
+    formation.animate()
+    assert formation.draw_state()[0] != signature
+    signature = formation.draw_state()[0]
+    formation.advance(0.4, 0, 1000, 8)  # Less than a pixel: nothing to redraw
+    assert formation.draw_state()[0] == signature
+    aliens[4].kill()
+    assert formation.draw_state()[0] != signature
+    assert not formation._leased
@@ -0,0 +1,51 @@
+"""Tests for deferred, background sound loading."""
+import os
+from unittest.mock import patch
+
+import pygame
+import pytest
+
+from src.utils.audio_manager import SOUND_FILES, AudioManager
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+@pytest.fixture
+def manager():
+    try:
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+    except pygame.error:
+        pytest.skip("No audio device available")
+    manager = AudioManager()
+    yield manager
+    manager.cleanup()
+
+
+def test_sounds_decode_in_background_on_first_enable(manager):
+    assert manager.sounds == {}
+    assert manager.load_report()["state"] == "deferred"
+
+    manager.set_sfx_enabled(True)
+    loaded = manager.sounds_ready.result(timeout=5)
+    assert set(loaded) == set(SOUND_FILES)
+    assert manager.sounds is loaded
+    report = manager.load_report()
+    assert report["state"] == "ready" and report["sounds"] == len(SOUND_FILES)
+    assert report["load_ms"] >= 0
+
+    manager.set_sfx_enabled(False)
+    manager.set_sfx_enabled(True)
+    assert manager.load_sounds() is manager.sounds_ready
+
+
+def test_music_path_is_resolved_once(manager):
+    manager.set_music_enabled(True)
+    with patch("os.path.exists", side_effect=AssertionError("path re-resolved")), \
+            patch("pygame.mixer.music.load") as load, \
+            patch("pygame.mixer.music.play"), \
+            patch("pygame.mixer.music.get_busy", return_value=False):
+        manager.play_menu_music()
+        manager.play_menu_music()
+    assert load.call_count == 2
+    load.assert_called_with(manager._music_path)
@@ -0,0 +1,78 @@
+"""Tests for reserved mixer channels, priorities and same-frame de-duplication."""
+import os
+
+import pygame
+import pytest
+
+from src import config
+from src.utils.audio_manager import VoiceCategory, VoiceManager
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+class CountingSound(pygame.mixer.Sound):
+    volume_calls = 0
+
+    def set_volume(self, *args):
+        self.volume_calls += 1
+        super().set_volume(*args)
+
+
+@pytest.fixture
+def mixer():
+    try:
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+    except pygame.error:
+        pytest.skip("No audio device available")
+    yield
+    pygame.mixer.stop()
+
+
+def _sound(name):
+    return CountingSound(os.path.join(config.SOUND_DIR, name))
+
+
+def test_channels_are_reserved_per_category(mixer):
+    sfx_count = max(3, pygame.mixer.get_num_channels() - 2)
+    voices = VoiceManager(sfx_channels=sfx_count)
+    assert voices.allocate()
+    assert len(voices.channels[VoiceCategory.SFX]) == sfx_count
+    # Nothing outside the voice manager can grab a reserved channel
+    assert _sound("shoot.wav").play() is None
+
+    loop = voices.play("ufo_lowpitch", _sound("ufo_lowpitch.wav"), 0.5, loops=-1)
+    assert loop is voices.channels[VoiceCategory.UFO][0]
+    for step in range(3):
+        voices.next_frame()
+        voices.play(f"fastinvader{step + 1}", _sound("fastinvader1.wav"), 0.5)
+    assert loop.get_busy()
+    assert voices.busy(VoiceCategory.HEARTBEAT)
+
+
+def test_same_frame_duplicates_coalesce_and_volume_is_set_once(mixer):
+    voices = VoiceManager(sfx_channels=4)
+    voices.allocate()
+    sound = _sound("invaderkilled.wav")
+    played = [voices.play("invaderkilled", sound, 0.7) for _ in range(3)]
+    assert played[0] is not None and played[1:] == [None, None]
+    assert voices.coalesced == 2
+    voices.next_frame()
+    assert voices.play("invaderkilled", sound, 0.7) is not None
+    assert sound.volume_calls == 1
+
+
+def test_saturated_pool_steals_lowest_priority_voice(mixer):
+    voices = VoiceManager(sfx_channels=2)
+    voices.allocate()
+    shoot = voices.play("shoot", _sound("shoot.wav"), 1.0)
+    voices.next_frame()
+    boom = voices.play("explosion", _sound("explosion.wav"), 1.0)
+    voices.next_frame()
+    kill = voices.play("invaderkilled", _sound("invaderkilled.wav"), 1.0)
+    assert kill is shoot and voices.stolen == 1
+
+    voices.next_frame()
+    assert voices.play("shoot", _sound("shoot.wav"), 1.0) is None
+    assert voices.dropped == 1
+    assert boom.get_busy()
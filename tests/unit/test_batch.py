@@ -0,0 +1,47 @@
+"""Tests for the headless batch episode runner."""
+import pytest
+
+from src import config
+from src.batch import parse_overrides, run_batch, run_episode
+
+
+def test_episode_is_reproducible_from_its_seed():
+    first = run_episode(0, 42, "random", max_minutes=0.2)
+    second = run_episode(0, 42, "random", max_minutes=0.2)
+    assert (first.score, first.shots_fired, first.steps) == (second.score, second.shots_fired, second.steps)
+    assert first.outcome in ("game_over", "invaded", "timeout")
+    assert first.survival_s == pytest.approx(first.steps * config.SIM_TICK_MS / 1000, abs=0.01)
+
+
+def test_overrides_apply_in_process_and_are_restored():
+    original = config.ALIEN_BOMB_CHANCE
+    overrides = parse_overrides(["ALIEN_BOMB_CHANCE=0.5"])
+    results = list(run_batch(2, seed=3, policy="scripted", jobs=1, overrides=overrides, max_minutes=0.1))
+    assert [result.episode for result in results] == [0, 1]
+    assert [result.seed for result in results] == [3, 4]
+    assert config.ALIEN_BOMB_CHANCE == original
+    with pytest.raises(ValueError):
+        parse_overrides(["NOT_A_SETTING=1"])
+    with pytest.raises(ValueError):
+        parse_overrides(["ALIEN_BOMB_CHANCE"])
+
+
+def test_worker_processes_match_in_process_results():
+    def key(result):
+        return result.episode, result.score, result.shots_fired, result.steps, result.outcome
+
+    pooled = list(run_batch(3, seed=9, policy="random", jobs=2, max_minutes=0.1))
+    local = list(run_batch(3, seed=9, policy="random", jobs=1, max_minutes=0.1))
+    assert [key(r) for r in pooled] == [key(r) for r in local]
+
+
+def test_timing_overrides_update_derived_settings():
+    tick_ms = config.SIM_TICK_MS
+    overrides = parse_overrides(["SIM_TICK_HZ=120"])
+    result = next(run_batch(1, seed=5, policy="random", jobs=1, overrides=overrides, max_minutes=0.05))
+    assert result.steps == 360  # 3 simulated seconds at 120 Hz
+    assert config.SIM_TICK_MS == tick_ms
+    for bad in ("SIM_TICK_MS=8.3", "ALIEN_BOMB_CHANCE='x'", "ALIEN_BOMB_CHANCE=x", "SIM_TICK_HZ=0.5", "SIM_TICK_HZ=0"):
+        with pytest.raises(ValueError):
+            parse_overrides([bad])
+    assert parse_overrides(["ALIEN_BOMB_CHANCE=1"]) == {"ALIEN_BOMB_CHANCE": 1}
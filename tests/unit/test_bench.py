@@ -0,0 +1,26 @@
+"""Tests for the scenario benchmark suite."""
+from src.bench import SCENARIOS, compare, run_suite
+
+
+def test_scenarios_report_timings_and_allocations():
+    report = run_suite(["full_formation", "two_player_switch"], frames=12, warmup=2, alloc_frames=3)
+    assert set(report["scenarios"]) == {"full_formation", "two_player_switch"}
+    entry = report["scenarios"]["full_formation"]
+    assert entry["frames"] == 12
+    assert entry["update_ms"]["mean"] > 0
+    assert entry["frame_ms"]["p95"] >= entry["frame_ms"]["p50"]
+    assert "alloc_peak_kb" in entry
+    assert {"full_formation", "bomb_storm", "two_player_switch", "attract_idle", "wave_transition"} <= set(SCENARIOS)
+
+
+def test_compare_flags_only_regressions_beyond_threshold():
+    def report(update_mean):
+        return {"scenarios": {"full_formation": {"update_ms": {"mean": update_mean}}}}
+
+    baseline = report(1.0)
+    assert compare(report(1.05), baseline, threshold=0.10) == []
+    assert compare(report(0.5), baseline, threshold=0.10) == []
+    regressions = compare(report(1.5), baseline, threshold=0.10)
+    assert len(regressions) == 1 and "update_ms.mean" in regressions[0]
+    # Tiny absolute changes stay within the noise floor
+    assert compare(report(0.03), report(0.01), threshold=0.10) == []
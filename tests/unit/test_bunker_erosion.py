@@ -0,0 +1,70 @@
+"""Tests for pixel-level bunker erosion."""
+import random
+
+import pygame
+import pytest
+
+from src.core.simulation import FrameInput, SimEventType, SimulationWorld
+from src.entities.bullet import Bullet
+from src.entities.bunker import BOMB_STAMP, SHOT_STAMP, Bunker
+
+
+@pytest.fixture
+def bunker():
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    return Bunker(100, 100)
+
+
+def test_hit_only_touches_the_stamp_area(bunker):
+    before = bunker.image.copy()
+    point = bunker.rect.center
+    carved = bunker.damage(point, SHOT_STAMP)
+    dirty = bunker.take_dirty_rect()
+    assert carved > 0 and dirty is not None and bunker.take_dirty_rect() is None
+    assert dirty.width < bunker.rect.width
+    local = dirty.move(-bunker.rect.x, -bunker.rect.y)
+    for x in range(bunker.rect.width):
+        for y in range(bunker.rect.height):
+            if not local.collidepoint(x, y):
+                assert bunker.image.get_at((x, y)) == before.get_at((x, y))
+    assert bunker.image.get_at((point[0] - bunker.rect.x, point[1] - bunker.rect.y))[:3] == (0, 0, 0)
+
+
+def test_projectiles_pass_through_carved_gaps(bunker):
+    column = pygame.Rect(bunker.rect.centerx, bunker.rect.top, 1, bunker.rect.height)
+    assert bunker.hit_point(column) is not None
+    for _ in range(20):
+        point = bunker.hit_point(column)
+        if point is None:
+            break
+        bunker.damage(point, BOMB_STAMP)
+    assert bunker.hit_point(column) is None
+    assert 0 < bunker.solid_pixels < bunker.initial_pixels
+
+
+def test_bullet_through_gap_is_not_stopped():
+    world = SimulationWorld(rng=random.Random(5))
+    world.reset()
+    bunker = world.bunkers[0]
+    x = bunker.rect.centerx
+    for _ in range(20):
+        point = bunker.hit_point(pygame.Rect(x - 2, bunker.rect.top, 4, bunker.rect.height))
+        if point is None:
+            break
+        bunker.damage(point, SHOT_STAMP)
+    bullet = Bullet((x, bunker.rect.centery))
+    world.bullet_group.add(bullet)
+    events = world.step(FrameInput(), armed=False)
+    assert bullet.alive()
+    assert SimEventType.BUNKER_HIT not in [event.type for event in events]
+
+
+def test_erosion_state_replays_onto_fresh_bunker(bunker):
+    bunker.damage(bunker.rect.midtop, BOMB_STAMP)
+    bunker.damage((bunker.rect.left + 10, bunker.rect.bottom - 4), SHOT_STAMP)
+    copy = Bunker(100, 100)
+    copy.restore_erosion(bunker.erosion_state())
+    assert copy.solid_pixels == bunker.solid_pixels
+    assert copy.mask.overlap_area(bunker.mask, (0, 0)) == bunker.solid_pixels
+    assert pygame.image.tobytes(copy.image, "RGBA") == pygame.image.tobytes(bunker.image, "RGBA")
@@ -0,0 +1,94 @@
+"""Tests for the spatial hash broad-phase collision index."""
+import pygame
+
+from src.core.collision_manager import CollisionManager, SpatialHash
+
+
+class Box(pygame.sprite.Sprite):
+    def __init__(self, x, y, w=8, h=8):
+        super().__init__()
+        self.rect = pygame.Rect(x, y, w, h)
+
+
+def _grid(group, count, step=20):
+    boxes = [Box((i % 10) * step, (i // 10) * step) for i in range(count)]
+    group.add(boxes)
+    return boxes
+
+
+def test_query_returns_overlapping_sprites_in_insertion_order():
+    index = SpatialHash(cell_size=16)
+    group = pygame.sprite.Group()
+    boxes = _grid(group, 30)
+    index.insert_many(group)
+    found = index.query(pygame.Rect(0, 0, 30, 30))
+    assert found == [boxes[0], boxes[1], boxes[10], boxes[11]]
+
+
+def test_sprite_spanning_cells_is_reported_once():
+    index = SpatialHash(cell_size=8)
+    group = pygame.sprite.Group()
+    wide = Box(0, 0, 40, 40)
+    group.add(wide)
+    index.insert(wide)
+    assert index.query(pygame.Rect(4, 4, 30, 30)) == [wide]
+
+
+def test_killed_sprites_are_skipped():
+    index = SpatialHash()
+    group = pygame.sprite.Group()
+    box = Box(10, 10)
+    group.add(box)
+    index.insert(box)
+    box.kill()
+    assert index.query(box.rect) == []
+
+
+def test_groupcollide_matches_pygame():
+    manager = CollisionManager(cell_size=24)
+    targets = pygame.sprite.Group()
+    probes = pygame.sprite.Group()
+    _grid(targets, 55)
+    for x, y in ((5, 5), (42, 21), (150, 90), (400, 400), (19, 19)):
+        probes.add(Box(x, y, 2, 8))
+
+    expected = pygame.sprite.groupcollide(probes, targets, False, False)
+    manager.rebuild({"targets": targets})
+    actual = manager.groupcollide(probes, "targets", False, False)
+    assert {k: set(v) for k, v in actual.items()} == {k: set(v) for k, v in expected.items()}
+
+
+def test_groupcollide_kills_like_pygame():
+    manager = CollisionManager()
+    targets = pygame.sprite.Group()
+    probes = pygame.sprite.Group()
+    target = Box(10, 10)
+    targets.add(target)
+    probes.add(Box(12, 12, 2, 2), Box(14, 14, 2, 2))
+    manager.rebuild({"targets": targets})
+
+    hits = manager.groupcollide(probes, "targets", True, True)
+
+    # The first probe takes the target, the second finds nothing left to hit
+    assert len(hits) == 1
+    assert not targets
+    assert len(probes) == 1
+
+
+def test_spritecollide_and_late_additions():
+    manager = CollisionManager()
+    bombs = pygame.sprite.Group()
+    manager.rebuild({"bombs": bombs})
+    bomb = Box(50, 50)
+    bombs.add(bomb)
+    manager.add_to_layer("bombs", bomb)
+    player = Box(48, 48, 16, 16)
+    assert manager.spritecollide(player, "bombs", dokill=True) == [bomb]
+    assert not bombs
+
+
+def test_unknown_layer_is_empty():
+    manager = CollisionManager()
+    probes = pygame.sprite.Group(Box(0, 0))
+    assert manager.groupcollide(probes, "missing") == {}
+    assert manager.query("missing", pygame.Rect(0, 0, 4, 4)) == []
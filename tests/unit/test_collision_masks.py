@@ -0,0 +1,49 @@
+"""Tests for the shared narrow-phase collision masks."""
+import random
+
+import pygame
+import pytest
+
+from src import config
+from src.core.simulation import FrameInput, SimEventType, SimulationWorld
+from src.entities.alien import Alien
+from src.entities.bullet import Bomb
+from src.utils.sprite_sheet import get_game_sprite_mask, get_sprite_registry
+
+
+@pytest.fixture
+def world():
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    sim = SimulationWorld(rng=random.Random(11))
+    sim.reset()
+    return sim
+
+
+def test_masks_are_shared_per_frame_and_ignore_tint():
+    first = Alien(0, 0, 30)
+    second = Alien(40, 0, 30, tint=(255, 0, 0))
+    assert first.mask is second.mask is get_game_sprite_mask('alien_squid_1', config.SPRITE_SCALE)
+    first.animate()
+    assert first.mask is get_game_sprite_mask('alien_squid_2', config.SPRITE_SCALE)
+    assert 0 < first.mask.count() < first.mask.get_size()[0] * first.mask.get_size()[1]
+
+
+def test_preload_builds_masks_with_sprites():
+    registry = get_sprite_registry()
+    registry.preload(('player',), scale=3)
+    assert ('player', 3) in registry._masks
+
+
+def test_bomb_on_transparent_corner_misses_player(world):
+    player = world.player
+    assert not player.mask.get_at((0, 0))
+    bomb = Bomb((0, 0))
+    bomb.rect.bottomright = (player.rect.left + 1, player.rect.top + 1)
+    world.bomb_group.add(bomb)
+    events = world.step(FrameInput(), armed=False)
+    assert SimEventType.PLAYER_HIT not in [event.type for event in events]
+
+    bomb.rect.center = player.rect.center
+    events = world.step(FrameInput(), armed=False)
+    assert SimEventType.PLAYER_HIT in [event.type for event in events]
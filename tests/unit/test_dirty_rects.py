@@ -0,0 +1,113 @@
+"""Tests for dirty-rectangle tracking and partial presents."""
+from unittest.mock import patch
+
+import pygame
+
+from src.core.dirty_rects import DirtyRectTracker, merge_rects
+from src.main import Game
+from src.systems.game_state_manager import GameState
+
+
+class Box(pygame.sprite.Sprite):
+    def __init__(self, x, y):
+        super().__init__()
+        self.image = pygame.Surface((4, 4))
+        self.rect = self.image.get_rect(topleft=(x, y))
+
+
+def _tracker():
+    tracker = DirtyRectTracker((200, 200), enabled=True)
+    assert tracker.collect() is None  # First frame is always full
+    return tracker
+
+
+def test_static_sprites_produce_no_dirty_rects():
+    tracker = _tracker()
+    group = pygame.sprite.Group(Box(10, 10))
+    tracker.track(group)
+    tracker.collect()
+    tracker.track(group)
+    assert tracker.collect() == []
+
+
+def test_moved_and_removed_sprites_mark_old_and_new_rects():
+    tracker = _tracker()
+    mover, gone = Box(10, 10), Box(100, 100)
+    group = pygame.sprite.Group(mover, gone)
+    tracker.track(group)
+    tracker.collect()
+
+    mover.rect.y += 3
+    gone.kill()
+    tracker.track(group)
+    rects = tracker.collect()
+    assert pygame.Rect(10, 10, 4, 7) in rects
+    assert pygame.Rect(100, 100, 4, 4) in rects
+
+
+def test_regions_and_transients():
+    tracker = _tracker()
+    tracker.track_region("hud", 100, (0, 0, 200, 20))
+    tracker.track_transient("text", [(50, 50, 10, 5)])
+    tracker.collect()
+
+    tracker.track_region("hud", 100, (0, 0, 200, 20))
+    tracker.track_transient("text", [])
+    assert tracker.collect() == [pygame.Rect(50, 50, 10, 5)]
+
+    tracker.track_region("hud", 110, (0, 0, 200, 20))
+    assert tracker.collect() == [pygame.Rect(0, 0, 200, 20)]
+
+
+def test_full_redraw_fallbacks():
+    tracker = DirtyRectTracker((100, 100), enabled=False)
+    tracker.collect()
+    tracker.mark((0, 0, 2, 2))
+    assert tracker.collect() is None
+
+    tracker = DirtyRectTracker((100, 100), enabled=True, full_redraw_ratio=0.5)
+    tracker.collect()
+    tracker.mark((0, 0, 100, 60))
+    assert tracker.collect() is None
+    tracker.invalidate()
+    assert tracker.collect() is None
+
+
+def test_merge_rects_unions_overlaps():
+    merged = merge_rects([pygame.Rect(0, 0, 10, 10), pygame.Rect(5, 5, 10, 10), pygame.Rect(50, 50, 2, 2)])
+    assert sorted(map(tuple, merged)) == [(0, 0, 15, 15), (50, 50, 2, 2)]
+
+
+def test_game_presents_only_changed_regions():
+    game = Game()
+    game.dirty_tracker.enabled = True
+    game.state_manager.change_state(GameState.PLAYING)
+    game.wave_message_timer = 0
+    game.draw()  # Full frame
+    game.draw()  # Overlay-free frame after the full one
+
+    player = game.player
+    with patch("pygame.display.update") as update, patch("pygame.display.flip") as flip:
+        player.rect.x += 3
+        game.draw()
+    flip.assert_not_called()
+    rects = update.call_args[0][0]
+    area = sum(rect.width * rect.height for rect in rects)
+    window = game.screen.get_width() * game.screen.get_height()
+    assert 0 < area < window / 4
+
+
+def test_killed_alien_is_marked_without_leasing_the_formation():
+    game = Game()
+    game.dirty_tracker.enabled = True
+    game.state_manager.change_state(GameState.PLAYING)
+    game.wave_message_timer = 0
+    game.draw()
+    game.draw()
+    formation = game.alien_group
+    alien = formation.sprites()[0]
+    dead = alien.rect.copy()
+    alien.kill()
+    rects = game._collect_dirty_rects(False)
+    assert rects is not None and any(rect.contains(dead) for rect in rects)
+    assert not formation._leased
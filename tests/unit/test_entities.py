@@ -116,9 +116,12 @@ class TestBunker(unittest.TestCase):
     def test_bunker_damage(self):
         """Test bunker takes damage correctly."""
         bunker = Bunker(100, 100)
-        initial_health = bunker.health
-        bunker.damage()
-        self.assertEqual(bunker.health, initial_health - 1)
+        initial_pixels = bunker.solid_pixels
+        carved = bunker.damage()
+        self.assertGreater(carved, 0)
+        self.assertEqual(bunker.solid_pixels, initial_pixels - carved)
+        self.assertEqual(bunker.mask.count(), bunker.solid_pixels)
+        self.assertLessEqual(bunker.health, 4)
 
 
 if __name__ == '__main__':
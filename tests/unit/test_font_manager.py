@@ -1,9 +1,19 @@
 import os
+import shutil
+from unittest.mock import patch
 
 import pygame
 import pytest
 
-from src.ui.font_manager import FONT_PROFILES, get_font, get_menu_overlay_fonts
+from src import config
+from src.ui.font_manager import (
+    FONT_PROFILES,
+    FontPathCache,
+    get_font,
+    get_menu_overlay_fonts,
+    get_sys_font,
+    resolve_font,
+)
 
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
@@ -28,3 +38,36 @@ def test_controls_overlay_font_supports_arrows():
     controls_font, _ = get_menu_overlay_fonts("controls")
     surface = controls_font.render("← →", True, (255, 255, 255))
     assert surface.get_width() > 0
+
+
+def test_resolved_paths_persist_until_fingerprint_changes(tmp_path):
+    cache_file = str(tmp_path / "fonts.json")
+    with patch("pygame.font.match_font", wraps=pygame.font.match_font) as match:
+        cache = FontPathCache(cache_file, fingerprint="a")
+        path, _ = cache.resolve("monospace")
+        assert cache.flush(timeout=2)
+        calls = match.call_count
+
+        warm = FontPathCache(cache_file, fingerprint="a")
+        assert warm.resolve("Monospace") == (path, False)
+        assert match.call_count == calls and warm.hits == 1
+
+        stale = FontPathCache(cache_file, fingerprint="b")
+        stale.resolve("monospace")
+        assert match.call_count > calls and stale.misses == 1
+
+
+def test_bundled_font_skips_system_lookup(tmp_path, monkeypatch):
+    bundled = tmp_path / "arcade.ttf"
+    default = os.path.join(os.path.dirname(pygame.__file__), pygame.font.get_default_font())
+    shutil.copy(default, bundled)
+    monkeypatch.setattr(config, "FONT_DIR", str(tmp_path))
+    monkeypatch.setattr(config, "FONT_FILE", "arcade.ttf")
+    with patch("pygame.font.match_font", side_effect=AssertionError("system lookup")):
+        assert resolve_font("courier", bold=True) == (str(bundled), True)
+        assert get_sys_font("courier", 14, bold=True).get_bold()
+
+
+def test_profiles_with_identical_faces_share_a_font():
+    assert get_font("hud_main") is get_font("menu_options_main")
+    assert get_font("hud_main") is not get_font("hud_small")
@@ -0,0 +1,52 @@
+"""Tests for write-behind, atomic high score saving."""
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.high_score_manager import HighScoreManager
+from src.utils.persistence import WriteBehindWriter, atomic_write_json
+
+
+@pytest.fixture
+def manager(tmp_path):
+    path = str(tmp_path / "scores.json")
+    with patch.object(HighScoreManager, "_get_scores_path", return_value=path):
+        manager = HighScoreManager(writer=WriteBehindWriter(delay_s=0.05))
+        yield manager
+        manager.writer.close()
+
+
+def test_saves_are_coalesced_off_thread_and_flushed(manager, tmp_path):
+    path = tmp_path / "scores.json"
+    for score in (300, 100, 200, 500):
+        manager.update_score(score, "abc")
+    assert manager.writer.pending
+    assert manager.flush(timeout=2)
+    assert manager.writer.writes == 1
+    data = json.loads(path.read_text())
+    assert data["high_score"] == 500
+    assert [entry["score"] for entry in data["scores"]] == [500, 300, 200, 100]
+    assert os.listdir(tmp_path) == ["scores.json"]
+
+
+def test_bisect_insert_keeps_top_ten_with_stable_ties(manager):
+    for score in range(1000, 16000, 1000):
+        manager.update_score(score)
+    manager.update_score(10000, "NEW")
+    manager.update_score(1, "LOW")
+    scores = [(e.score, e.initials) for e in manager.all_scores]
+    assert len(scores) == 10
+    assert scores[0] == (15000, "---")
+    assert scores.index((10000, "NEW")) == scores.index((10000, "---")) + 1
+    assert (1, "LOW") not in scores
+
+
+def test_failed_atomic_write_leaves_previous_file(tmp_path):
+    path = tmp_path / "scores.json"
+    atomic_write_json(str(path), {"high_score": 10})
+    with pytest.raises(TypeError):
+        atomic_write_json(str(path), {"high_score": object()})
+    assert json.loads(path.read_text()) == {"high_score": 10}
+    assert os.listdir(tmp_path) == ["scores.json"]
@@ -0,0 +1,55 @@
+"""Tests for the cached HUD layer."""
+import pygame
+
+from src.main import Game
+from src.ui.hud import HudLayer, TextCache
+
+
+def test_text_cache_reuses_and_evicts_least_recent():
+    pygame.font.init()
+    font = pygame.font.Font(None, 12)
+    cache = TextCache(max_entries=2)
+    first = cache.text(font, "SCORE", (255, 255, 255))
+    assert cache.text(font, "SCORE", (255, 255, 255)) is first
+    cache.text(font, "LEVEL", (255, 255, 255))
+    cache.text(font, "SCORE", (255, 255, 255))  # Refresh SCORE
+    cache.text(font, "HI", (255, 255, 255))  # Evicts LEVEL
+    assert len(cache) == 2
+    assert cache.text(font, "SCORE", (255, 255, 255)) is first
+    assert (cache.hits, cache.misses) == (3, 3)
+    cache.text(font, "LEVEL", (255, 255, 255))
+    assert cache.misses == 4
+
+
+def test_strip_recomposes_only_on_signature_change():
+    hud = HudLayer()
+    calls = []
+
+    def compose(canvas):
+        calls.append(canvas)
+        canvas.fill((255, 0, 0, 255), pygame.Rect(0, 0, 4, 4))
+        return 4
+
+    surface = pygame.Surface((20, 20))
+    for _ in range(3):
+        rect = hud.draw(surface, "top", ("score", 10), (0, 0), (20, 10), compose)
+    assert len(calls) == 1
+    assert rect.height == 4
+    hud.draw(surface, "top", ("score", 20), (0, 0), (20, 10), compose)
+    assert len(calls) == 2
+    assert surface.get_at((1, 1))[:3] == (255, 0, 0)
+
+
+def test_game_hud_is_not_recomposed_every_frame():
+    game = Game()
+    surface = game.playfield_surface
+    game._draw_scoreboard(surface)
+    composed = game.hud.compositions
+    game._draw_scoreboard(surface)
+    game._draw_scoreboard(surface)
+    assert game.hud.compositions == composed
+
+    game.score += 10
+    game._draw_scoreboard(surface)
+    assert game.hud.compositions == composed + 1
+    assert game.scoreboard_height > 0
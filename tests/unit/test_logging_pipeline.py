@@ -0,0 +1,44 @@
+"""Tests for the queued logging pipeline and log rate limiting."""
+import logging
+import logging.handlers
+
+from src.entities.bunker import Bunker
+from src.utils.logger import LogRateLimiter, configure_logging, setup_logger, stop_logging
+
+
+def test_records_are_written_by_the_listener(tmp_path):
+    log_file = tmp_path / "game.log"
+    listener = configure_logging(logging.INFO, log_file=str(log_file))
+    try:
+        root_handlers = logging.getLogger().handlers
+        assert any(isinstance(h, logging.handlers.QueueHandler) for h in root_handlers)
+        assert str(log_file) not in [getattr(h, "baseFilename", None) for h in root_handlers]
+        assert listener._thread is not None
+        logging.getLogger("src.test").info("queued %d", 42)
+    finally:
+        stop_logging()
+    assert "queued 42" in log_file.read_text()
+    assert not any(isinstance(h, logging.handlers.QueueHandler) for h in logging.getLogger().handlers)
+
+
+def test_module_loggers_are_shared_and_handler_free():
+    first = Bunker(50, 100)
+    second = Bunker(90, 100)
+    assert first.logger is second.logger
+    assert setup_logger("src.entities.bunker") is first.logger
+    assert first.logger.handlers == []
+
+
+def test_rate_limiter_caps_messages_and_reports_suppressed(caplog):
+    logger = logging.getLogger("src.test.limiter")
+    logger.setLevel(logging.INFO)
+    limiter = LogRateLimiter(logger, limit=2, window_frames=3)
+    allowed = [limiter.allow("alien_killed") for _ in range(5)]
+    assert allowed == [True, True, False, False, False]
+    assert not limiter.allow("bomb_dropped", logging.DEBUG)
+
+    with caplog.at_level(logging.INFO, logger="src.test.limiter"):
+        for _ in range(3):
+            limiter.tick()
+    assert "3 more 'alien_killed' messages suppressed" in caplog.text
+    assert limiter.allow("alien_killed")
@@ -0,0 +1,62 @@
+"""Tests for the cached playfield presenter."""
+import pygame
+import pytest
+
+from src.core.presenter import PlayfieldPresenter
+
+
+def _source():
+    source = pygame.Surface((20, 10), 0, 32)
+    source.fill((0, 0, 0))
+    source.fill((255, 0, 0), pygame.Rect(4, 2, 2, 2))
+    return source
+
+
+def test_full_present_letterboxes_and_reuses_target():
+    presenter = PlayfieldPresenter((20, 10))
+    screen = pygame.Surface((60, 40), 0, 32)
+    assert presenter.present(screen, _source()) is None
+    assert presenter.dest_rect == pygame.Rect(0, 5, 60, 30)
+    assert presenter.integer_scale == 3
+    target = presenter._target
+
+    presenter.present(screen, _source())
+    assert presenter._target is target
+    assert screen.get_at((4 * 3, 5 + 2 * 3))[:3] == (255, 0, 0)
+    assert screen.get_at((0, 0))[:3] == (0, 0, 0)
+
+
+def test_invalidate_rebuilds_geometry():
+    presenter = PlayfieldPresenter((20, 10))
+    presenter.present(pygame.Surface((40, 20), 0, 32), _source())
+    presenter.invalidate()
+    presenter.present(pygame.Surface((30, 15), 0, 32), _source())
+    assert presenter.integer_scale == 0
+    assert presenter.dest_rect.size == (30, 15)
+
+
+def test_dirty_regions_map_to_window_rects():
+    presenter = PlayfieldPresenter((20, 10))
+    screen = pygame.Surface((40, 20), 0, 32)
+    presenter.present(screen, _source())
+    source = _source()
+    source.fill((0, 255, 0), pygame.Rect(10, 5, 1, 1))
+    updated = presenter.present(screen, source, [pygame.Rect(10, 5, 1, 1)])
+    assert updated == [pygame.Rect(20, 10, 2, 2)]
+    assert screen.get_at((21, 11))[:3] == (0, 255, 0)
+    assert presenter.present(screen, source, []) == []
+
+
+@pytest.mark.parametrize("quality", ["scale2x", "smooth"])
+def test_filtered_qualities_present_full_frame(quality):
+    presenter = PlayfieldPresenter((20, 10), quality=quality)
+    screen = pygame.Surface((40, 20), 0, 32)
+    presenter.present(screen, _source())
+    assert screen.get_at((9, 5))[0] > 0
+    updated = presenter.present(screen, _source(), [pygame.Rect(0, 0, 2, 2)])
+    assert updated == [pygame.Rect(0, 0, 4, 4)]
+
+
+def test_unknown_quality_falls_back_to_nearest():
+    presenter = PlayfieldPresenter((20, 10), quality="bogus")
+    assert presenter.quality == "nearest"
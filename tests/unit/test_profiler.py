@@ -0,0 +1,76 @@
+"""Tests for the frame profiler and its overlay."""
+import pygame
+
+from src.core.profiler import FrameProfiler, RingBuffer
+from src.main import Game
+from src.systems.game_state_manager import GameState
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ring_buffer_keeps_latest_window():
+    buffer = RingBuffer(4)
+    for value in range(10):
+        buffer.push(float(value))
+    assert sorted(buffer.values()) == [6.0, 7.0, 8.0, 9.0]
+    assert buffer.percentiles(0, 50, 100) == (6.0, 8.0, 9.0)
+
+
+def test_sections_accumulate_per_frame():
+    clock = FakeClock()
+    profiler = FrameProfiler(window=100, enabled=True, clock=clock)
+    for frame in range(100):
+        profiler.begin_frame()
+        with profiler.section("update"):
+            clock.now += 0.001
+        with profiler.section("update"):
+            clock.now += 0.001 if frame < 98 else 0.020
+        profiler.end_frame()
+    p50, p95, p99 = profiler.percentiles("update")
+    assert round(p50, 3) == 2.0
+    assert round(p95, 3) == 2.0
+    assert round(p99, 3) == 21.0
+    assert list(profiler.summary())[0] == "frame"
+
+
+def test_late_sections_are_backfilled_and_disabled_profiler_is_inert():
+    clock = FakeClock()
+    profiler = FrameProfiler(window=10, enabled=True, clock=clock)
+    for frame in range(4):
+        profiler.begin_frame()
+        if frame == 3:
+            with profiler.section("spawn"):
+                clock.now += 0.004
+        profiler.end_frame()
+    assert profiler.percentiles("spawn") == (0.0, 4.0, 4.0)
+
+    disabled = FrameProfiler(enabled=False, clock=clock)
+    disabled.begin_frame()
+    with disabled.section("x"):
+        clock.now += 1
+    disabled.end_frame()
+    assert disabled.summary() == {}
+
+
+def test_overlay_toggle_collects_and_draws():
+    game = Game()
+    game.state_manager.change_state(GameState.PLAYING)
+    game._toggle_profiler_overlay()
+    assert game.profiler.enabled and game.world.profiler is game.profiler
+    for _ in range(3):
+        game.profiler.begin_frame()
+        with game.profiler.section("update"):
+            game.update()
+        game.draw()
+        game.profiler.end_frame()
+    summary = game.profiler.summary()
+    assert "collide.bullets_aliens" in summary
+    assert "draw.world" in summary
+    assert game._profiler_lines
+    assert isinstance(game._profiler_lines[0], pygame.Surface)
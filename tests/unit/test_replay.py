@@ -0,0 +1,94 @@
+"""Tests for seeded runs and the binary replay format."""
+import collections
+
+import pygame
+import pytest
+
+from src import config
+from src.core.replay import (
+    Replay,
+    ReplayError,
+    ReplayRecorder,
+    play_replay,
+)
+from src.core.simulation import FrameInput, SimulationWorld
+from src.main import Game
+from src.systems.game_state_manager import GameState
+
+
+def test_recorder_run_length_encodes_and_round_trips(tmp_path):
+    recorder = ReplayRecorder(seed=2**63 + 5)
+    for _ in range(500):
+        recorder.record(FrameInput(left=True))
+    recorder.record(FrameInput(fire=True), armed=False)
+    for _ in range(300):
+        recorder.record(FrameInput())
+    assert recorder.steps == 801
+    assert len(recorder.replay.runs) == 3
+
+    path = tmp_path / "run.sirp"
+    recorder.replay.save(str(path))
+    assert path.stat().st_size < 40
+    loaded = Replay.load(str(path))
+    assert loaded == recorder.replay
+    decoded = list(loaded.inputs())
+    assert decoded[0] == (FrameInput(left=True), True)
+    assert decoded[500] == (FrameInput(fire=True), False)
+    assert len(decoded) == 801
+
+
+def test_corrupt_or_foreign_replays_are_rejected():
+    data = ReplayRecorder(seed=1).replay.to_bytes()
+    with pytest.raises(ReplayError):
+        Replay.from_bytes(b"XXXX" + data[4:])
+    with pytest.raises(ReplayError):
+        Replay.from_bytes(Replay(seed=1, runs=[[2, 0]]).to_bytes()[:-1])  # truncated run
+    foreign = Replay(seed=1, config_hash=b"\x00" * 8, runs=[[3, 0]])
+    with pytest.raises(ReplayError):
+        play_replay(foreign)
+    assert play_replay(foreign, strict=False).steps == 3
+
+
+def test_same_seed_and_inputs_reproduce_the_world():
+    def run(seed):
+        world = SimulationWorld()
+        world.reseed(seed)
+        world.reset()
+        for frame in range(1200):
+            world.step(FrameInput(left=frame % 200 < 100, right=frame % 200 >= 100, fire=frame % 30 == 0))
+        return (world.player.rect.topleft, len(world.alien_group), len(world.bomb_group),
+                [ufo.value for ufo in world.ufo_group], world.rng.random())
+
+    assert run(77) == run(77)
+    assert run(77) != run(78)
+
+
+def test_game_recording_replays_headlessly(monkeypatch):
+    game = Game()
+    game.two_player_mode = False
+    game.reset_game()
+    game.state_manager.change_state(GameState.PLAYING)
+    seed = game.recorder.replay.seed
+    assert game.world.seed == seed
+
+    held = collections.defaultdict(bool)
+    monkeypatch.setattr(pygame.key, "get_pressed", lambda: held)
+    for frame in range(600):
+        held[pygame.K_LEFT] = frame % 240 < 90
+        held[pygame.K_RIGHT] = 120 <= frame % 240 < 200
+        if frame % 20 == 0:
+            game._fire_requested = True
+        if game.waiting_for_respawn:
+            game.waiting_for_respawn = False
+        game.update()
+        if game.game_over:
+            break
+    replay = game.recorder.replay if game.recorder else game.last_replay
+
+    world = SimulationWorld(config.BASE_WIDTH, config.BASE_HEIGHT, player_floor=game._player_floor())
+    result = play_replay(Replay.from_bytes(replay.to_bytes()), world)
+    assert result.steps == replay.steps
+    assert result.score == game.score > 0
+    assert world.player.rect == game.world.player.rect
+    assert [a.rect for a in world.alien_group] == [a.rect for a in game.world.alien_group]
+    assert [b.rect for b in world.bomb_group] == [b.rect for b in game.world.bomb_group]
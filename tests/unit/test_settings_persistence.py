@@ -4,6 +4,8 @@ import pygame
 import pytest
 
 from src.main import Game
+from src.utils.persistence import WriteBehindWriter
+from src.utils.settings_manager import SettingsManager
 
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
 
@@ -82,3 +84,23 @@ def test_debug_border_toggle_persists(tmp_path, monkeypatch):
     _skip_attract(game2)
     assert game2.debug_sprite_borders is True
     assert game2.menu.debug_draw_borders is True
+
+
+def test_rapid_toggles_update_snapshot_and_coalesce_into_one_write(tmp_path):
+    settings_path = tmp_path / "settings.json"
+    writer = WriteBehindWriter(delay_s=0.2)
+    manager = SettingsManager(str(settings_path), writer=writer)
+    assert manager.snapshot.audio_enabled is False
+
+    for _ in range(5):
+        manager.set_audio_enabled(not manager.audio_enabled())
+        manager.set_tint_enabled(not manager.snapshot.tint_enabled)
+    assert manager.snapshot.audio_enabled is True
+    assert manager.snapshot.tint_enabled is True
+    assert not settings_path.exists()  # still inside the debounce window
+
+    assert manager.flush(timeout=2)
+    assert writer.writes == 1
+    reloaded = SettingsManager(str(settings_path), writer=writer)
+    assert reloaded.snapshot == manager.snapshot
+    writer.close()
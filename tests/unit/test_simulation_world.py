@@ -0,0 +1,140 @@
+"""Tests for the headless simulation core."""
+import random
+
+import pygame
+import pytest
+
+from src import config
+from src.core.simulation import FrameInput, PlayfieldSnapshot, SimEventType, SimulationWorld
+from src.entities.bullet import Bomb
+
+
+@pytest.fixture
+def world():
+    sim = SimulationWorld(rng=random.Random(1234))
+    sim.reset()
+    return sim
+
+
+def _event_types(events):
+    return [event.type for event in events]
+
+
+def test_reset_builds_full_formation(world):
+    assert len(world.alien_group) == config.ALIEN_ROWS * config.ALIEN_COLUMNS
+    assert len(world.bunker_group) == 4
+    assert world.player is not None
+    assert world.level == 1
+
+
+def test_step_advances_simulated_time_only(world):
+    for _ in range(120):
+        world.step(FrameInput())
+    assert world.frame == 120
+    assert world.time_ms == pytest.approx(120 * config.SIM_FRAME_MS)
+
+
+def test_player_moves_from_inputs(world):
+    start_x = world.player.rect.x
+    world.step(FrameInput(left=True))
+    assert world.player.rect.x < start_x
+
+
+def test_fire_input_respects_bullet_limit(world):
+    events = world.step(FrameInput(fire=True))
+    assert SimEventType.SHOT_FIRED in _event_types(events)
+    world.step(FrameInput(fire=True))
+    assert len(world.bullet_group) <= config.PLAYER_MAX_BULLETS
+
+
+def test_bullet_kill_is_reported(world):
+    alien = world.alien_group.sprites()[-1]
+    bullet = world.fire()
+    bullet.rect.center = alien.rect.center
+    events = world.step(FrameInput())
+    kills = [event for event in events if event.type == SimEventType.ALIEN_KILLED]
+    assert len(kills) == 1
+    assert kills[0].value == alien.value
+    assert not alien.alive()
+
+
+def test_player_hit_is_reported(world):
+    world.bomb_group.add(Bomb(world.player.rect.center))
+    events = world.step(FrameInput())
+    hits = [event for event in events if event.type == SimEventType.PLAYER_HIT]
+    assert hits and hits[0].value == 1
+
+
+def test_cleared_formation_starts_next_wave(world):
+    world.alien_group.empty()
+    events = world.step(FrameInput())
+    assert SimEventType.WAVE_CLEARED in _event_types(events)
+    assert world.level == 2
+    assert len(world.alien_group) == config.ALIEN_ROWS * config.ALIEN_COLUMNS
+    assert world.alien_speed > config.ALIEN_START_SPEED
+
+
+def test_unarmed_world_holds_fire(world):
+    for _ in range(600):
+        events = world.step(FrameInput(), armed=False)
+        assert SimEventType.BOMB_DROPPED not in _event_types(events)
+
+
+def test_same_seed_produces_same_run():
+    def run(seed):
+        sim = SimulationWorld(rng=random.Random(seed))
+        sim.reset()
+        drops = []
+        for _ in range(300):
+            for event in sim.step(FrameInput()):
+                if event.type == SimEventType.BOMB_DROPPED:
+                    drops.append((sim.frame, event.pos))
+        return drops
+
+    assert run(7) == run(7)
+
+
+def test_larger_steps_cover_more_ground(world):
+    bomb = Bomb((100, 100))
+    world.bomb_group.add(bomb)
+    world.step(FrameInput(), dt_ms=config.SIM_FRAME_MS * 2, armed=False)
+    assert bomb.rect.centery == 100 + config.BOMB_SPEED * 2
+
+
+def test_world_runs_without_display():
+    pygame.display.quit()
+    try:
+        sim = SimulationWorld(rng=random.Random(3))
+        sim.reset()
+        for _ in range(60):
+            sim.step(FrameInput(right=True))
+        assert sim.frame == 60
+    finally:
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+
+def test_playfield_snapshot_restores_into_reused_sprites(world):
+    world.level = 3
+    world.alien_group.advance(6.0, 0, world.width, 10)
+    for alien in world.alien_group.sprites()[:7]:
+        alien.kill()
+    bunkers = world.bunkers
+    bunkers[0].damage()
+    bunkers[1].kill()
+    carved = bunkers[0].solid_pixels
+    snapshot = world.snapshot_playfield()
+    assert PlayfieldSnapshot.from_bytes(snapshot.to_bytes()) == snapshot
+    survivors = world.alien_group.sprites()
+    formation = world.alien_group
+
+    world.restore_playfield(None)
+    assert world.level == 1 and len(world.alien_group) == config.ALIEN_ROWS * config.ALIEN_COLUMNS
+    assert len(world.bunker_group) == len(bunkers)
+
+    world.restore_playfield(snapshot)
+    assert world.alien_group is formation
+    assert world.alien_group.sprites() == survivors
+    assert world.level == 3
+    assert bunkers[0].solid_pixels == carved < bunkers[0].initial_pixels and not bunkers[1].alive()
+    assert all(b.solid_pixels == b.initial_pixels for b in bunkers[2:])
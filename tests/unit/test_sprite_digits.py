@@ -0,0 +1,55 @@
+"""Tests for the glyph-atlas digit writers."""
+from unittest.mock import patch
+
+import pygame
+import pytest
+
+from src.ui.sprite_digits import HUD_GLYPHS, FontDigitWriter, SpriteDigitWriter, _GlyphAtlas
+
+
+@pytest.fixture(autouse=True)
+def init_fonts():
+    pygame.font.init()
+
+
+@pytest.mark.parametrize("writer_cls", [FontDigitWriter, SpriteDigitWriter])
+def test_render_into_matches_render(writer_cls):
+    writer = writer_cls()
+    text = "0123456789"
+    expected = writer.render(text)
+    target = pygame.Surface((200, 40), pygame.SRCALPHA)
+    rect = writer.render_into(target, (5, 3), text)
+    assert rect.size == expected.get_size() == writer.measure(text)
+    for x in range(0, rect.width, 3):
+        for y in range(rect.height):
+            assert target.get_at((5 + x, 3 + y)) == expected.get_at((x, y))
+
+
+def test_render_into_allocates_no_surfaces():
+    writer = FontDigitWriter()
+    target = pygame.Surface((100, 20), pygame.SRCALPHA)
+    writer.render_into(target, (0, 0), "00000")
+    with patch("pygame.Surface", side_effect=AssertionError("surface allocated")):
+        writer.render_into(target, (0, 0), "98765")
+
+
+def test_unknown_characters_are_rasterized_once():
+    writer = FontDigitWriter()
+    target = pygame.Surface((100, 20), pygame.SRCALPHA)
+    with patch.object(writer, "_rasterize", wraps=writer._rasterize) as rasterize:
+        writer.render_into(target, (0, 0), "AA")
+        writer.render_into(target, (0, 0), "A")
+    assert rasterize.call_count == 1
+
+
+def test_atlas_uses_the_rasterizer_it_is_given():
+    drawn = []
+
+    def rasterize(ch):
+        drawn.append(ch)
+        return pygame.Surface((4, 6), pygame.SRCALPHA)
+
+    atlas = _GlyphAtlas(rasterize, spacing=1, glyphs={"0": pygame.Surface((5, 6))})
+    assert "".join(drawn) == HUD_GLYPHS.replace("0", "")
+    assert atlas.measure("0#") == (10, 6)
+    assert drawn[-1] == "#"
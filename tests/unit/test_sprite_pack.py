@@ -0,0 +1,61 @@
+"""Tests for precompiled, memory-mapped sprite packs."""
+import json
+import shutil
+
+import pygame
+import pytest
+
+from src import config
+from src.utils import sprite_sheet
+from src.utils.sprite_pack import build_pack, load_pack, pack_path
+
+
+@pytest.fixture
+def img_dir(tmp_path, monkeypatch):
+    for name in ("SpaceInvaders.png", "SpaceInvaders.arcade.json"):
+        shutil.copy(f"{config.IMG_DIR}/{name}", tmp_path / name)
+    monkeypatch.setattr(config, "IMG_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _pixels(surface):
+    return pygame.image.tobytes(surface, "RGBA")
+
+
+def test_packed_sprites_match_the_sheet(img_dir):
+    build_pack("arcade", scales=(1, 2))
+    pack = load_pack("arcade")
+    sheet = sprite_sheet.SpriteSheet(str(img_dir / "SpaceInvaders.png"), str(img_dir / "SpaceInvaders.arcade.json"))
+    for name in ("player", "alien_crab_2", "title_logo"):
+        for scale in (1, 2):
+            assert _pixels(pack.get(name, scale)) == _pixels(sheet.get_sprite_by_name(name, scale))
+    assert pack.get("player", 3) is None
+    assert ("bunker_full_v2", 1) not in pack  # zero-sized placeholder
+
+
+def test_stale_or_corrupt_pack_is_ignored(img_dir):
+    build_pack("arcade", scales=(1,))
+    coords = img_dir / "SpaceInvaders.arcade.json"
+    sprites = json.loads(coords.read_text())
+    sprites[0]["x"] += 1
+    coords.write_text(json.dumps(sprites))
+    assert load_pack("arcade") is None
+
+    with open(pack_path("arcade"), "wb") as fh:
+        fh.write(b"SIPK")
+    assert load_pack("arcade") is None
+
+
+def test_registry_builds_from_pack_without_the_sheet(img_dir, monkeypatch):
+    build_pack("arcade", scales=(1,))
+    expected = _pixels(load_pack("arcade").get("bullet", 1))
+    monkeypatch.setattr(sprite_sheet, "_packs", {})
+
+    def no_sheet():
+        raise AssertionError("sheet decoded")
+
+    monkeypatch.setattr(sprite_sheet, "_get_shared_sprite_sheet", no_sheet)
+    registry = sprite_sheet.SpriteRegistry()
+    surface = registry.get("bullet", 1, (0, 255, 0))
+    assert surface.get_size() == load_pack("arcade").get("bullet", 1).get_size()
+    assert _pixels(registry.get("bullet", 1)) == expected
@@ -0,0 +1,70 @@
+"""Tests for projectile and effect pooling."""
+import pygame
+import pytest
+
+from src.core.simulation import FrameInput, SimulationWorld
+from src.entities.bullet import Bomb, BombPool, BulletPool
+from src.entities.effects import ExplosionPool
+from src.entities.pool import PooledSprite
+
+
+def test_killed_sprite_is_reused():
+    pool = BulletPool()
+    group = pygame.sprite.Group()
+    bullet = pool.acquire((50, 50))
+    group.add(bullet)
+    bullet.kill()
+    again = pool.acquire((80, 90))
+    assert again is bullet
+    assert again.rect.midbottom == (80, 90)
+    assert pool.stats() == {"created": 1, "reused": 1, "released": 1, "free": 0, "in_use": 1}
+
+
+def test_emptying_a_group_releases_once():
+    pool = BombPool()
+    group = pygame.sprite.Group()
+    bombs = [pool.acquire((10 * i, 10), 'bomb_2') for i in range(3)]
+    group.add(bombs)
+    group.empty()
+    for bomb in bombs:
+        bomb.kill()
+    assert len(pool) == 3
+    assert pool.stats()["released"] == 3
+
+
+def test_sprite_still_in_a_group_is_not_released():
+    pool = ExplosionPool()
+    first, second = pygame.sprite.Group(), pygame.sprite.Group()
+    effect = pool.acquire((5, 5))
+    first.add(effect)
+    second.add(effect)
+    first.remove(effect)
+    assert len(pool) == 0
+    second.remove(effect)
+    assert len(pool) == 1
+
+
+def test_unpooled_sprites_behave_normally():
+    bomb = Bomb((10, 10))
+    group = pygame.sprite.Group(bomb)
+    bomb.kill()
+    assert not bomb.alive()
+    assert not group
+
+
+def test_pooled_sprite_without_reset_cannot_be_built():
+    class Incomplete(PooledSprite):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_world_recycles_bullets():
+    world = SimulationWorld(448, 512)
+    world.reset()
+    for _ in range(200):
+        world.step(FrameInput(fire=True), armed=False)
+    stats = world.pool_stats()["bullets"]
+    assert stats["created"] == 1
+    assert stats["reused"] > 0
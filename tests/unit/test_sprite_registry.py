@@ -0,0 +1,47 @@
+"""Tests for the shared sprite variant registry."""
+import pygame
+
+from src.utils.sprite_sheet import (
+    SpriteRegistry,
+    clear_tint_cache,
+    get_game_sprite,
+    get_sprite_registry,
+)
+
+
+def test_variants_are_built_once_and_shared():
+    registry = SpriteRegistry()
+    first = registry.get("bullet", 1)
+    assert registry.get("bullet", 1) is first
+    assert registry.get("bullet", 2) is not first
+    assert registry.get("bullet", 1, (255, 0, 0)) is not first
+    assert (registry.hits, registry.misses) == (1, 3)
+
+
+def test_tinted_variant_is_recolored():
+    registry = SpriteRegistry()
+    plain = registry.get("player", 1)
+    red = registry.get("player", 1, (255, 0, 0))
+    assert plain.get_size() == red.get_size()
+    rect = plain.get_bounding_rect()
+    assert any(red.get_at((x, rect.centery))[1] == 0 for x in range(rect.left, rect.right))
+
+
+def test_preload_and_invalidate():
+    registry = SpriteRegistry()
+    registry.preload(("bullet", "ufo"), scale=1, tints=(None, (0, 255, 0)))
+    assert len(registry) == 4
+    bullet = registry.get("bullet", 1)
+    registry.invalidate()
+    assert len(registry) == 0
+    assert registry.get("bullet", 1) is not bullet
+
+
+def test_get_game_sprite_uses_shared_registry():
+    pygame.display.set_mode((1, 1))
+    tint = [10, 20, 30]
+    sprite = get_game_sprite("bomb_1", 1, tint=tint)
+    assert get_game_sprite("bomb_1", 1, tint=(10, 20, 30)) is sprite
+    assert get_sprite_registry().get("bomb_1", 1, (10, 20, 30)) is sprite
+    clear_tint_cache()
+    assert get_game_sprite("bomb_1", 1, tint=tint) is not sprite
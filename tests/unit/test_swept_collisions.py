@@ -0,0 +1,75 @@
+"""Tests for swept (continuous) projectile collisions."""
+import random
+
+import pygame
+import pytest
+
+from src.core.collision_manager import collision_bounds, sweep_contact
+from src.core.simulation import FrameInput, SimEventType, SimulationWorld
+from src.entities.bullet import Bomb, Bullet
+
+
+@pytest.fixture
+def world():
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    sim = SimulationWorld(rng=random.Random(21))
+    sim.reset()
+    return sim
+
+
+def _events(world, kind):
+    return [event for event in world.step(FrameInput(), armed=False) if event.type == kind]
+
+
+def test_crossing_projectiles_touch_mid_step():
+    bullet = Bullet((100, 200))
+    bomb = Bomb((100, 180))
+    bullet.move_by(-30)
+    bomb.move_by(30)
+    assert not bullet.rect.colliderect(bomb.rect)
+    assert 0 < sweep_contact(bullet, bomb) < 1
+    assert collision_bounds(bullet).height == bullet.rect.height + 30
+
+
+def test_placing_by_hand_drops_the_sweep():
+    bullet = Bullet((100, 200))
+    bullet.move_by(-30)
+    bullet.rect.midbottom = (50, 50)
+    assert collision_bounds(bullet) == bullet.rect
+
+
+def test_fast_bullet_kills_first_alien_in_its_path(world):
+    bottom = max(world.alien_group.sprites(), key=lambda alien: (alien.rect.bottom, -alien.rect.x))
+    above = min(
+        (a for a in world.alien_group if a.rect.bottom < bottom.rect.top and a.rect.centerx == bottom.rect.centerx),
+        key=lambda alien: bottom.rect.top - alien.rect.bottom,
+    )
+    bullet = Bullet((bottom.rect.centerx, bottom.rect.bottom + 40))
+    world.bullet_group.add(bullet)
+    bullet.move_by(above.rect.top - bullet.rect.bottom - 1)  # Ends clear of both rows
+    kills = _events(world, SimEventType.ALIEN_KILLED)
+    assert [kill.value for kill in kills] == [bottom.value]
+    assert not bottom.alive() and above.alive() and not bullet.alive()
+
+
+def test_bomb_cannot_tunnel_through_player(world):
+    player = world.player
+    bomb = Bomb(player.rect.midtop)
+    bomb.rect.bottom = player.rect.top - 2
+    world.bomb_group.add(bomb)
+    bomb.move_by(player.rect.height + bomb.rect.height + 4)
+    assert not bomb.rect.colliderect(player.rect)
+    assert _events(world, SimEventType.PLAYER_HIT)
+
+
+def test_two_bullets_on_one_invader_score_once(world):
+    alien = world.alien_group.sprites()[-1]
+    count = len(world.alien_group)
+    bullets = [Bullet(alien.rect.center), Bullet(alien.rect.center)]
+    world.bullet_group.add(*bullets)
+    kills = _events(world, SimEventType.ALIEN_KILLED)
+    assert len(kills) == 1 and kills[0].value == alien.value
+    assert sum(kill.value for kill in kills) == alien.value
+    assert len(world.alien_group) == count - 1
+    assert sum(bullet.alive() for bullet in bullets) == 1
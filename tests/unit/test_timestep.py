@@ -0,0 +1,99 @@
+"""Tests for the fixed-timestep accumulator and render interpolation."""
+from unittest.mock import patch
+
+import pygame
+import pytest
+
+from src import config
+from src.core.timestep import FixedTimestep, SpriteInterpolator
+from src.entities.alien import Alien
+from src.entities.bullet import Bomb, Bullet, BulletPool
+from src.entities.formation import AlienFormation
+from src.entities.player import Player
+from src.entities.ufo import UFO
+from src.main import Game
+from src.systems.game_state_manager import GameState
+
+
+def test_steps_follow_wall_time_not_frame_rate():
+    for frame_ms in (1000 / 144, 1000 / 60, 1000 / 40):
+        timestep = FixedTimestep(step_ms=1000 / 60, max_steps=5)
+        steps = sum(timestep.advance(frame_ms) for _ in range(round(2000 / frame_ms)))
+        assert steps == pytest.approx(120, abs=1)
+        assert 0 <= timestep.alpha < 1
+
+
+def test_overload_skips_frames_then_drops_time():
+    timestep = FixedTimestep(step_ms=10, max_steps=3)
+    assert timestep.advance(25) == 2 and timestep.skipped_frames == 1
+    assert timestep.alpha == pytest.approx(0.5)
+    assert timestep.advance(1000) == 3
+    assert timestep.dropped_ms == pytest.approx(975)
+    assert timestep.alpha == 0
+
+
+def _distance_per_second(hz):
+    scale = 1000 / hz / config.SIM_FRAME_MS
+    player, ufo = Player(), UFO(0, 40)
+    player.rect.x = 0
+    bullet, bomb = Bullet((300, 500)), Bomb((300, 50))
+    formation = AlienFormation(Alien(100, 100, 10))
+    start = (player.rect.x, ufo.rect.x, bullet.rect.y, bomb.rect.y, formation.bounds().x)
+    for _ in range(hz):
+        player.steer(False, True, scale)
+        ufo.update(scale)
+        bullet.update(scale)
+        bomb.update(scale)
+        formation.advance(config.ALIEN_START_SPEED * scale, 0, 10_000, 0)
+    end = (player.rect.x, ufo.rect.x, bullet.rect.y, bomb.rect.y, formation.bounds().x)
+    return [abs(b - a) for a, b in zip(start, end)]
+
+
+def test_pace_does_not_depend_on_tick_rate():
+    reference = _distance_per_second(60)
+    assert reference == [300, 120, 300, 180, 24]
+    for hz in (30, 120):
+        assert _distance_per_second(hz) == pytest.approx(reference, abs=1)
+
+
+def test_interpolator_draws_between_steps_and_restores():
+    sprite = pygame.sprite.Sprite()
+    sprite.rect = pygame.Rect(100, 100, 4, 4)
+    group = pygame.sprite.Group(sprite)
+    interpolator = SpriteInterpolator(enabled=True, snap_distance=20)
+    interpolator.capture([group])
+    sprite.rect.y -= 10
+    interpolator.apply(0.25)
+    assert sprite.rect.topleft == (100, 98)  # Three quarters of the way back
+    interpolator.restore()
+    assert sprite.rect.topleft == (100, 90)
+
+    interpolator.capture([group])
+    sprite.rect.x += 50  # Teleported: drawn where it is
+    interpolator.apply(0.5)
+    assert sprite.rect.topleft == (150, 90)
+
+
+def test_interpolator_ignores_recycled_pool_sprites():
+    pool = BulletPool()
+    group = pygame.sprite.Group(pool.acquire((100, 300)))
+    interpolator = SpriteInterpolator(enabled=True)
+    interpolator.capture([group])
+    group.empty()  # Old shot ends during the step...
+    bullet = pool.acquire((110, 330))  # ...and a new one is fired from the same sprite
+    group.add(bullet)
+    position = bullet.rect.topleft
+    interpolator.apply(0.5)
+    assert bullet.rect.topleft == position
+
+
+def test_sound_and_log_dedupe_reset_once_per_rendered_frame():
+    game = Game()
+    game.reset_game(start_playing=True)
+    game.state_manager.change_state(GameState.PLAYING)
+    with patch.object(game.audio_manager, "next_frame") as next_frame, \
+            patch.object(game.log_limiter, "tick") as tick:
+        game._begin_frame()
+        game._run_simulation_steps(5)  # A catch-up frame
+    assert next_frame.call_count == 1
+    assert tick.call_count == 1
@@ -277,6 +277,22 @@ class TestGameStatePersistence:
         self.game.switch_player()
         assert len(self.game.alien_group) == aliens_p1
 
+    def test_switch_reuses_formation_sprites(self):
+        """Switching restores snapshots into the live formation instead of copying groups."""
+        self.game.start_two_player_game()
+        self.game.state_manager.change_state(GameState.PLAYING)
+        formation = self.game.alien_group
+        for alien in formation.sprites()[:5]:
+            alien.kill()
+        p1_aliens = formation.sprites()
+
+        self.game.switch_player()
+        assert self.game.alien_group is formation
+        assert len(formation) == len(p1_aliens) + 5
+
+        self.game.switch_player()
+        assert self.game.alien_group.sprites() == p1_aliens
+
 
 class TestSinglePlayerModeUnaffected:
     """Tests to ensure 1P mode still works correctly."""